@@ -0,0 +1,51 @@
+"""
+Image assets decoded once per process and shared by every session.
+
+`st.image` given a PIL image or a path decodes, resizes and re-encodes the
+file on every rerun. `image_asset` does that work once: it resizes the image
+to its display width and encodes it so Streamlit passes the bytes through
+unchanged (pass the matching `output_format` to st.image). Photos stay JPEG;
+everything else becomes an optimized PNG, without the alpha channel when the
+image is fully opaque. Results are cached by path, width and the file's
+mtime/size, so editing the file on disk is the only thing that re-encodes it.
+"""
+import io
+import os
+
+import streamlit as st
+from PIL import Image
+
+JPEG_QUALITY = 90
+
+
+def asset_format(path):
+    """Encoding image_asset uses for `path` (the output_format to give st.image)."""
+    return 'JPEG' if os.path.splitext(path)[1].lower() in ('.jpg', '.jpeg') else 'PNG'
+
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def _encode_image(path, width, mtime_ns, size):
+    """Decodes, resizes and encodes one image version; mtime_ns/size only key the cache."""
+    with Image.open(path) as image:
+        image.load()
+        if width is not None and image.width > width:
+            height = max(1, round(image.height * width / image.width))
+            image = image.resize((width, height), resample=Image.LANCZOS)
+
+        buffer = io.BytesIO()
+        if asset_format(path) == 'JPEG':
+            image.convert('RGB').save(buffer, format='JPEG', quality=JPEG_QUALITY, optimize=True)
+        else:
+            if image.mode == 'RGBA' and image.getchannel('A').getextrema() == (255, 255):
+                image = image.convert('RGB')
+            image.save(buffer, format='PNG', optimize=True)
+    return buffer.getvalue()
+
+
+def image_asset(path, width=None):
+    """
+    Encoded bytes of `path`, downscaled to `width` pixels if it is wider.
+    Raises FileNotFoundError if the file does not exist.
+    """
+    stat = os.stat(path)
+    return _encode_image(path, width, stat.st_mtime_ns, stat.st_size)
@@ -0,0 +1,54 @@
+"""
+Shared helpers for the benchmark scripts.
+
+The shipped joblib file only holds model metrics (no fitted estimator), so the
+benchmarks fit a small Random Forest on synthetic profiles with the same
+7 features the app uses. Run scripts from the repository root, e.g.
+`python benchmarks/bench_batch_scoring.py`.
+"""
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# Make the app modules importable when running `python benchmarks/<script>.py`
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from scoring import engineer_features  # noqa: E402
+
+ACADEMIC_LEVELS = ["High School", "Undergraduate", "Postgraduate", "PhD"]
+
+
+def synthetic_profiles(n, seed=42):
+    """Random profiles covering the ranges of the Assessment sliders."""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'usage': np.round(rng.uniform(0.5, 12.0, n) * 2) / 2,
+        'sleep': np.round(rng.uniform(4.0, 12.0, n) * 2) / 2,
+        'mental': rng.integers(1, 11, n),
+        'stress': rng.integers(1, 11, n),
+        'academic': rng.choice(ACADEMIC_LEVELS, n),
+        'late_night': rng.random(n) < 0.5,
+        'fomo': rng.random(n) < 0.5,
+    })
+
+
+def synthetic_forest(n_estimators=100, n_train=705, seed=42):
+    """Fits a Random Forest on synthetic profiles labelled by a usage/sleep/mental rule."""
+    from sklearn.ensemble import RandomForestClassifier
+
+    profiles = synthetic_profiles(n_train, seed=seed)
+    X = engineer_features(profiles)
+    risk = X['avg_daily_usage_hours'] - 0.5 * X['sleep_hours_per_night'] - 0.4 * X['mental_health_score']
+    y = (risk + np.random.default_rng(seed).normal(0, 0.8, n_train) > risk.median()).astype(int)
+    model = RandomForestClassifier(n_estimators=n_estimators, random_state=seed)
+    model.fit(X, y)
+    return model
+
+
+def rate(n, seconds):
+    """Formats a throughput figure."""
+    return f"{n / seconds:,.0f} rows/s" if seconds > 0 else "inf rows/s"
@@ -0,0 +1,246 @@
+"""
+App benchmark suite: scoring latency, model cold start and per-page rerun time.
+
+Measures
+- predict_risk_score latency for the heuristic path and the model path
+  (scikit-learn engine, compiled engine, and the precomputed risk table),
+- load_model cold start (cache cleared before every call) for the shipped
+  model file and a synthetic versioned artifact (compiled from scratch, and
+  mapped from an existing compiled export),
+- full script rerun time for every sidebar page, using Streamlit's AppTest
+  harness (each rerun is what a widget interaction costs on that page),
+- bytes of element payload each page sends to the browser per rerun.
+
+Results are printed and, with --output, written as JSON. Pass --compare with
+an earlier JSON file to print the ratio of every metric against it:
+
+    python benchmarks/bench_app.py --output bench_before.json
+    python benchmarks/bench_app.py --output bench_after.json --compare bench_before.json
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+# Bare-mode Streamlit logs a warning per st.* call outside a script run; keep the output readable
+os.environ.setdefault('STREAMLIT_LOGGER_LEVEL', 'error')
+
+from _common import REPO_ROOT, synthetic_forest, synthetic_profiles  # noqa: E402
+
+APP_PATH = os.path.join(REPO_ROOT, 'app.py')
+PAGES = [
+    "Home",
+    "Insights",
+    "Assessment",
+    "Your Personas",
+    "What-If Simulator",
+    "Recommendations",
+    "Peer Comparison",
+]
+
+
+def timings_ms(fn, repeat):
+    """Runs fn `repeat` times and returns the individual call times in ms."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1e3)
+    return samples
+
+
+def summarize(samples):
+    """Median / p95 / min / max of a list of ms timings."""
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))]
+    return {
+        'n': len(ordered),
+        'median_ms': statistics.median(ordered),
+        'p95_ms': p95,
+        'min_ms': ordered[0],
+        'max_ms': ordered[-1],
+    }
+
+
+def _import_serving():
+    """Imports serving.py (model loading + predict_risk_score) from the repo root, in Streamlit bare mode."""
+    os.chdir(REPO_ROOT)
+    import serving
+    return serving
+
+
+def bench_predict(serving, repeat):
+    """predict_risk_score latency per serving path, on a fixed set of slider-grid profiles."""
+    from forest_compiler import compile_forest
+    from risk_table import build_risk_table
+
+    profiles = synthetic_profiles(256, seed=7).itertuples(index=False)
+    profiles = [tuple(p) for p in profiles]
+    forest = synthetic_forest()
+    paths = {
+        'heuristic': (None, None),
+        'sklearn': (forest, None),
+        'compiled': (compile_forest(forest), None),
+        'risk_table': (forest, build_risk_table(forest)),
+    }
+
+    saved = serving.model, serving.risk_lookup, serving.HIGH_RISK_INDEX
+    results = {}
+    try:
+        for name, (model, table) in paths.items():
+            serving.model, serving.risk_lookup, serving.HIGH_RISK_INDEX = model, table, serving.HIGH_RISK_CLASS
+            calls = repeat if name != 'sklearn' else max(repeat // 10, 20)
+            cycle = iter(profiles * (calls // len(profiles) + 1))
+            results[name] = summarize(timings_ms(lambda: serving.predict_risk_score(*next(cycle)), calls))
+    finally:
+        serving.model, serving.risk_lookup, serving.HIGH_RISK_INDEX = saved
+    return results
+
+
+def bench_load_model(serving, repeat):
+    """load_model cold start: the st.cache_resource cache is cleared before every call."""
+    from model_artifact import build_artifact, save_artifact
+
+    with tempfile.TemporaryDirectory() as tmp:
+        artifact_path = os.path.join(tmp, 'model_artifact.joblib')
+        save_artifact(build_artifact(synthetic_forest()), artifact_path)
+        compiled_dir = os.path.join(tmp, 'compiled_forest')
+        # (path, engine, drop the compiled export first)
+        cases = {
+            'shipped_file': (serving.MODEL_PATH, serving.SERVING_ENGINE, False),
+            'artifact_sklearn': (artifact_path, 'sklearn', False),
+            'artifact_compiled': (artifact_path, 'compiled', True),
+            'artifact_compiled_mapped': (artifact_path, 'compiled', False),
+        }
+
+        results = {}
+        for name, (path, engine, recompile) in cases.items():
+            def cold_load():
+                serving.load_model.clear()
+                if recompile:
+                    shutil.rmtree(compiled_dir, ignore_errors=True)
+                serving.load_model(path, engine, compiled_dir)
+            results[name] = summarize(timings_ms(cold_load, repeat))
+        serving.load_model.clear()
+    return results
+
+
+def element_bytes(node):
+    """Serialized size of every element proto under an AppTest node (what a rerun ships to the browser)."""
+    children = getattr(node, 'children', None)
+    if children is None:
+        proto = getattr(node, 'proto', None)
+        return proto.ByteSize() if proto is not None else 0
+    return sum(element_bytes(child) for child in children.values())
+
+
+def bench_pages(repeat, timeout):
+    """Full script rerun time and element payload bytes per sidebar page, measured with AppTest."""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+    at.run()  # warm-up: imports, cached resources, first render
+    if at.exception:
+        raise RuntimeError(f"app.py raised on first run: {at.exception[0].message}")
+
+    results, payload = {}, {}
+    for page in PAGES:
+        at.sidebar.radio[0].set_value(page)
+        at.run()  # switch to the page (first render)
+        payload[page] = element_bytes(at._tree)
+
+        def rerun():
+            at.run()
+            if at.exception:
+                raise RuntimeError(f"{page} raised: {at.exception[0].message}")
+        results[page] = summarize(timings_ms(rerun, repeat))
+    return results, payload
+
+
+def environment():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT,
+                                capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    import numpy
+    import pandas
+    import sklearn
+    import streamlit
+
+    return {
+        'commit': commit,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'versions': {
+            'streamlit': streamlit.__version__,
+            'numpy': numpy.__version__,
+            'pandas': pandas.__version__,
+            'scikit-learn': sklearn.__version__,
+        },
+    }
+
+
+def print_results(results, baseline=None):
+    for section in ('predict_risk_score', 'load_model', 'page_rerun'):
+        if section not in results:
+            continue
+        print(f"\n{section}")
+        for name, stats in results[section].items():
+            line = f"  {name:<20} median {stats['median_ms']:9.3f} ms   p95 {stats['p95_ms']:9.3f} ms"
+            previous = (baseline or {}).get(section, {}).get(name)
+            if previous and previous['median_ms'] > 0:
+                line += f"   {stats['median_ms'] / previous['median_ms']:5.2f}x baseline"
+            print(line)
+
+    if 'page_bytes' in results:
+        print("\npage_bytes")
+        for name, size in results['page_bytes'].items():
+            line = f"  {name:<20} {size:9,d} bytes"
+            previous = (baseline or {}).get('page_bytes', {}).get(name)
+            if previous:
+                line += f"   {size / previous:5.2f}x baseline"
+            print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--predict-repeat', type=int, default=2000, help="predict_risk_score calls per path")
+    parser.add_argument('--load-repeat', type=int, default=5, help="Cold load_model calls per case")
+    parser.add_argument('--page-repeat', type=int, default=5, help="Reruns per page")
+    parser.add_argument('--timeout', type=float, default=60, help="AppTest timeout per run (s)")
+    parser.add_argument('--skip-pages', action='store_true', help="Skip the AppTest page reruns")
+    parser.add_argument('--output', help="Write results to this JSON file")
+    parser.add_argument('--compare', help="Earlier JSON results to compare medians against")
+    args = parser.parse_args()
+
+    serving = _import_serving()
+    results = {'environment': environment()}
+    results['predict_risk_score'] = bench_predict(serving, args.predict_repeat)
+    results['load_model'] = bench_load_model(serving, args.load_repeat)
+    if not args.skip_pages:
+        results['page_rerun'], results['page_bytes'] = bench_pages(args.page_repeat, args.timeout)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as fh:
+            baseline = json.load(fh)
+    print_results(results, baseline)
+
+    if args.output:
+        with open(args.output, 'w') as fh:
+            json.dump(results, fh, indent=2)
+        print(f"\nWrote {args.output}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""
+Batch scoring vs. per-row scoring throughput.
+
+The per-row loop does what predict_risk_score does for every profile (one-row
+DataFrame + one predict_proba call); the batch path scores the whole cohort
+with a single predict_risk_scores call.
+
+    python benchmarks/bench_batch_scoring.py --rows 50000 --loop-rows 2000
+"""
+import argparse
+import time
+
+import numpy as np
+
+from _common import rate, synthetic_forest, synthetic_profiles
+from scoring import predict_risk_scores
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=50000, help="Profiles scored by the batch path")
+    parser.add_argument('--loop-rows', type=int, default=2000, help="Profiles scored one at a time (extrapolated)")
+    args = parser.parse_args()
+
+    model = synthetic_forest()
+    profiles = synthetic_profiles(args.rows)
+
+    # Per-row loop on a subset (a full 50k loop takes minutes)
+    loop_rows = profiles.head(args.loop_rows)
+    start = time.perf_counter()
+    loop_scores = np.array([predict_risk_scores(model, loop_rows.iloc[[i]])[0] for i in range(len(loop_rows))])
+    loop_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch_scores = predict_risk_scores(model, profiles)
+    batch_seconds = time.perf_counter() - start
+
+    assert np.array_equal(loop_scores, batch_scores[:len(loop_scores)]), "batch and per-row scores differ"
+
+    start = time.perf_counter()
+    predict_risk_scores(None, profiles)
+    heuristic_seconds = time.perf_counter() - start
+
+    print(f"Per-row loop    : {len(loop_rows):>7,} rows in {loop_seconds:8.3f}s  ({rate(len(loop_rows), loop_seconds)})")
+    print(f"Batch (model)   : {len(profiles):>7,} rows in {batch_seconds:8.3f}s  ({rate(len(profiles), batch_seconds)})")
+    print(f"Batch (fallback): {len(profiles):>7,} rows in {heuristic_seconds:8.3f}s  ({rate(len(profiles), heuristic_seconds)})")
+    speedup = (len(profiles) / batch_seconds) / (len(loop_rows) / loop_seconds)
+    print(f"Speedup         : {speedup:,.0f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""
+Single-row and batch latency: scikit-learn predict_proba vs. the compiled forest.
+
+    python benchmarks/bench_compiled_forest.py --repeat 2000
+"""
+import argparse
+import time
+
+import numpy as np
+
+from _common import synthetic_forest, synthetic_profiles
+from forest_compiler import compile_forest
+from scoring import engineer_features
+
+
+def per_call_us(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=2000, help="Single-row calls per engine")
+    parser.add_argument('--batch', type=int, default=50000, help="Rows in the batch comparison")
+    args = parser.parse_args()
+
+    forest = synthetic_forest()
+    compiled = compile_forest(forest)
+    features = engineer_features(synthetic_profiles(args.batch))
+    assert np.array_equal(compiled.predict_proba(features.to_numpy()), forest.predict_proba(features))
+
+    one_row_df = features.iloc[[0]]
+    one_row = features.to_numpy()[:1]
+    sklearn_us = per_call_us(lambda: forest.predict_proba(one_row_df), max(args.repeat // 20, 10))
+    compiled_us = per_call_us(lambda: compiled.predict_proba(one_row), args.repeat)
+    print(f"Single row  sklearn : {sklearn_us:10.1f} us/call")
+    print(f"Single row  compiled: {compiled_us:10.1f} us/call  ({sklearn_us / compiled_us:.0f}x)")
+
+    start = time.perf_counter()
+    forest.predict_proba(features)
+    sklearn_s = time.perf_counter() - start
+    start = time.perf_counter()
+    compiled.predict_proba(features.to_numpy())
+    compiled_s = time.perf_counter() - start
+    print(f"Batch {args.batch:,} sklearn : {sklearn_s:8.3f}s")
+    print(f"Batch {args.batch:,} compiled: {compiled_s:8.3f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+Concurrent single-profile scoring: one predict_proba per request vs. the
+micro-batching scoring service, with N threads standing in for sessions.
+
+    python benchmarks/bench_service.py --threads 16 --requests 200
+"""
+import argparse
+import threading
+import time
+
+import numpy as np
+
+from _common import synthetic_forest, synthetic_profiles
+from forest_compiler import compile_forest
+from scoring import HIGH_RISK_CLASS, predict_risk_scores
+from scoring_service import InProcessScoringService, batch_scorer
+
+
+def run_threads(score, rows, threads):
+    """Each thread scores its share of rows one at a time; returns (seconds, latencies in ms, scores)."""
+    latencies = np.zeros(len(rows))
+    scores = np.zeros(len(rows), dtype=np.int64)
+
+    def worker(indices):
+        for i in indices:
+            start = time.perf_counter()
+            scores[i] = score(rows[i])
+            latencies[i] = (time.perf_counter() - start) * 1e3
+
+    workers = [threading.Thread(target=worker, args=(range(t, len(rows), threads),)) for t in range(threads)]
+    start = time.perf_counter()
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    return time.perf_counter() - start, latencies, scores
+
+
+def report(label, seconds, latencies, n):
+    p50, p99 = np.percentile(latencies, [50, 99])
+    print(f"{label:<28} {n / seconds:9,.0f} req/s   p50 {p50:7.2f} ms   p99 {p99:7.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--threads', type=int, default=16, help="Concurrent sessions")
+    parser.add_argument('--requests', type=int, default=200, help="Requests per session")
+    parser.add_argument('--max-wait-ms', type=float, default=2.0, help="Service batching window")
+    args = parser.parse_args()
+
+    forest = synthetic_forest()
+    rows = [tuple(row) for row in synthetic_profiles(args.threads * args.requests).itertuples(index=False)]
+    expected = predict_risk_scores(forest, rows, HIGH_RISK_CLASS)
+
+    for engine, model in (('sklearn', forest), ('compiled', compile_forest(forest))):
+        inline = batch_scorer(lambda: (model, HIGH_RISK_CLASS))
+        seconds, latencies, scores = run_threads(lambda row: int(inline([row])[0]), rows, args.threads)
+        assert np.array_equal(scores, expected)
+        report(f"{engine} inline", seconds, latencies, len(rows))
+
+        service = InProcessScoringService(inline, max_wait=args.max_wait_ms / 1e3)
+        seconds, latencies, scores = run_threads(service.score, rows, args.threads)
+        batches = service.batcher.batches
+        service.close()
+        assert np.array_equal(scores, expected)
+        report(f"{engine} service", seconds, latencies, len(rows))
+        print(f"{'':<28} {len(rows) / batches:.1f} requests per model call")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+"""
+Checks that worker processes share one copy of the compiled model (Linux only).
+
+Starts N processes that each load the same model file with load_shared_forest
+(as every Streamlit worker does through load_model) and score a batch, so all
+node arrays are touched. While every worker is alive, each reads
+/proc/self/smaps for the mappings of the compiled forest files. The check
+passes if all workers map the same files (device, inode), none of the pages
+are private, and each worker's proportional share (PSS) is its resident size
+divided by N: the kernel counts those pages once for the whole group.
+
+    python benchmarks/check_shared_model.py --workers 4
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+
+from _common import synthetic_forest, synthetic_profiles
+from forest_compiler import load_shared_forest
+from model_artifact import build_artifact, save_artifact
+from scoring import predict_risk_scores
+
+SMAPS_FIELDS = ('Rss', 'Pss', 'Shared_Clean', 'Shared_Dirty', 'Private_Clean', 'Private_Dirty')
+
+
+def mapped_file_usage(directory):
+    """Sums the smaps fields (kB) of this process's mappings of files in `directory`, plus their (dev, inode)."""
+    totals = dict.fromkeys(SMAPS_FIELDS, 0)
+    files = set()
+    current = None
+    with open('/proc/self/smaps') as fh:
+        for line in fh:
+            key = line.split(None, 1)[0]
+            if not key.endswith(':'):
+                # Mapping header: address perms offset dev inode [path]
+                parts = line.split(None, 5)
+                path = parts[5].strip() if len(parts) > 5 else ''
+                current = os.path.dirname(path) == directory
+                if current:
+                    files.add((parts[3], parts[4]))
+            elif current and key[:-1] in totals:
+                totals[key[:-1]] += int(line.split()[1])
+    return totals, files
+
+
+def worker(model_path, cache_dir, barrier, results):
+    model, high_risk_index, _ = load_shared_forest(model_path, cache_dir)
+    predict_risk_scores(model, synthetic_profiles(20000, seed=os.getpid()), high_risk_index)
+    directory = os.path.realpath(os.path.join(cache_dir, model.metadata['source_sha256'][:16]))
+    node_bytes = sum(getattr(model, name).nbytes for name in ('feature', 'threshold', 'children', 'value'))
+    # Measure only once every worker holds its mapping, so PSS reflects the whole group
+    barrier.wait()
+    totals, files = mapped_file_usage(directory)
+    results.put((os.getpid(), node_bytes, totals, sorted(files)))
+    barrier.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--workers', type=int, default=4, help="Worker processes")
+    parser.add_argument('--trees', type=int, default=200, help="Trees in the synthetic forest")
+    parser.add_argument('--train-rows', type=int, default=20000, help="Training rows (controls tree size)")
+    args = parser.parse_args()
+    if not os.path.exists('/proc/self/smaps'):
+        sys.exit("This check reads /proc/self/smaps and only runs on Linux.")
+
+    ctx = multiprocessing.get_context('spawn')
+    with tempfile.TemporaryDirectory() as tmp:
+        model_path = os.path.join(tmp, 'model_artifact.joblib')
+        save_artifact(build_artifact(synthetic_forest(n_estimators=args.trees, n_train=args.train_rows)), model_path)
+        cache_dir = os.path.join(tmp, 'compiled_forest')
+
+        barrier = ctx.Barrier(args.workers)
+        results = ctx.Queue()
+        procs = [ctx.Process(target=worker, args=(model_path, cache_dir, barrier, results)) for _ in range(args.workers)]
+        for p in procs:
+            p.start()
+        reports = [results.get() for _ in procs]
+        for p in procs:
+            p.join()
+
+    failures = []
+    print(f"{'pid':>8} {'Rss kB':>10} {'Pss kB':>10} {'Shared kB':>10} {'Private kB':>10}")
+    for pid, node_bytes, totals, files in reports:
+        shared = totals['Shared_Clean'] + totals['Shared_Dirty']
+        private = totals['Private_Clean'] + totals['Private_Dirty']
+        print(f"{pid:>8} {totals['Rss']:>10,} {totals['Pss']:>10,} {shared:>10,} {private:>10,}")
+        if files != reports[0][3]:
+            failures.append(f"pid {pid} maps different files than pid {reports[0][0]}")
+        if totals['Private_Dirty']:
+            failures.append(f"pid {pid} has {totals['Private_Dirty']} kB of private dirty model pages")
+        if totals['Rss'] == 0 or totals['Pss'] > totals['Rss'] / args.workers * 1.1 + 8:
+            failures.append(f"pid {pid} does not share its pages (Pss {totals['Pss']} kB, Rss {totals['Rss']} kB)")
+
+    node_kb = reports[0][1] // 1024
+    print(f"\nNode arrays: {node_kb:,} kB per model; {len(reports[0][3])} mapped files shared by {args.workers} workers.")
+    print(f"Private copies would cost {node_kb * args.workers:,} kB; shared they cost "
+          f"{sum(r[2]['Pss'] for r in reports):,} kB in total.")
+    if failures:
+        sys.exit("FAILED:\n" + "\n".join(failures))
+    print("OK: every worker maps the same pages.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""
+Column mapping from the cohort export layout to app profiles.
+
+Counselling exports follow the notebook's "Students Social Media Addiction.csv"
+layout (Student_ID, Age, Gender, Academic_Level, ..., Conflicts_Over_Social_Media,
+Addicted_Score). This module maps those columns onto the seven profile fields
+predict_risk_score takes.
+"""
+import numpy as np
+import pandas as pd
+
+COHORT_CSV_PATH = 'Students Social Media Addiction.csv'
+ID_COLUMN = 'Student_ID'
+
+# Export column -> profile field
+COHORT_COLUMNS = {
+    'Avg_Daily_Usage_Hours': 'usage',
+    'Sleep_Hours_Per_Night': 'sleep',
+    'Mental_Health_Score': 'mental',
+    'Conflicts_Over_Social_Media': 'stress',
+    'Academic_Level': 'academic',
+}
+
+# The export has no late-night / FOMO answers; optional columns can supply them
+TRUTHY = {'yes', 'y', 'true', '1'}
+
+
+def _flag(values):
+    return values.astype(str).str.strip().str.lower().isin(TRUTHY).to_numpy()
+
+
+def _number(values):
+    """Float column; non-numeric entries become NaN so callers can skip the row."""
+    return pd.to_numeric(values, errors='coerce').to_numpy(dtype=float)
+
+
+def _levels(values):
+    """Whitespace-stripped categorical column; strings are stripped once per distinct value."""
+    levels = pd.Categorical(values)
+    stripped_codes, stripped = pd.factorize(levels.categories.astype(str).str.strip())
+    # Trailing -1 keeps missing values (code -1) missing
+    return pd.Categorical.from_codes(np.append(stripped_codes, -1)[levels.codes], stripped)
+
+
+def cohort_to_profiles(chunk, late_night_column=None, fomo_column=None):
+    """
+    Maps an export chunk to a profile DataFrame (PROFILE_COLUMNS order).
+
+    Conflicts (0-5) are doubled back onto the 1-10 stress scale, the inverse of
+    predict_risk_score's stress / 2. Academic level is categorical, so the
+    feature transformer maps its codes instead of every row's string.
+    Late-night and FOMO flags default to False unless a Yes/No column is named for them.
+    """
+    missing = [col for col in COHORT_COLUMNS if col not in chunk.columns]
+    if missing:
+        raise ValueError(f"Cohort file is missing columns: {missing}")
+
+    n = len(chunk)
+    return pd.DataFrame({
+        'usage': _number(chunk['Avg_Daily_Usage_Hours']),
+        'sleep': _number(chunk['Sleep_Hours_Per_Night']),
+        'mental': _number(chunk['Mental_Health_Score']),
+        'stress': _number(chunk['Conflicts_Over_Social_Media']) * 2.0,
+        'academic': _levels(chunk['Academic_Level']),
+        'late_night': _flag(chunk[late_night_column]) if late_night_column else np.zeros(n, dtype=bool),
+        'fomo': _flag(chunk[fomo_column]) if fomo_column else np.zeros(n, dtype=bool),
+    }, index=chunk.index)
@@ -0,0 +1,365 @@
+"""
+Precomputed cohort aggregates for the Insights page.
+
+The store is a small Parquet table with one row per (dimension, group) -
+the whole cohort, each platform, each age and each academic level - holding
+additive statistics: row count, sum and sum of squares of every metric, and
+a histogram of Addicted_Score. Means, standard deviations, medians,
+threshold counts and one-way ANOVA are all derived from these, so the page
+reads a few dozen rows however large the cohort is.
+
+Because the statistics are additive, appending rows to the cohort CSV only
+requires aggregating the new rows and adding them to the stored table. The
+store remembers how many bytes of the CSV it has consumed and a SHA-256 of
+those bytes (header included), and resumes from there; if the consumed bytes
+changed in any way - an edited row, a new header, a shorter file - the store
+is rebuilt from scratch. The hash is carried forward while the new rows are
+read, so an update reads the file once and parses only the new rows.
+
+A last line without a trailing newline may still be being written, so it is
+only aggregated once the file has not been modified for SETTLE_SECONDS.
+
+    python cohort_stats.py "Students Social Media Addiction.csv"
+"""
+import argparse
+import hashlib
+import io
+import json
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from cohort import COHORT_CSV_PATH
+
+COHORT_STATS_PATH = 'cohort_stats.parquet'
+STORE_VERSION = 1
+DEFAULT_CHUNKSIZE = 200000
+# Block size for hashing and scanning the CSV
+READ_BLOCK_BYTES = 1 << 20
+# An unterminated last line is aggregated once the CSV has been unmodified this long
+SETTLE_SECONDS = 5.0
+
+# Export column -> metric name
+METRIC_COLUMNS = {
+    'Avg_Daily_Usage_Hours': 'usage',
+    'Sleep_Hours_Per_Night': 'sleep',
+    'Mental_Health_Score': 'mental',
+    'Conflicts_Over_Social_Media': 'conflicts',
+    'Addicted_Score': 'addicted',
+}
+METRICS = list(METRIC_COLUMNS.values())
+# Export column -> dimension name ('all' is the whole cohort)
+DIMENSION_COLUMNS = {
+    'Most_Used_Platform': 'platform',
+    'Age': 'age',
+    'Academic_Level': 'academic_level',
+}
+SCORE_BINS = np.arange(0, 11)
+HIST_COLUMNS = [f'addicted_{score}' for score in SCORE_BINS]
+SHORT_SLEEP_HOURS = 6.0
+HIGH_ADDICTION_SCORE = 4
+
+STAT_COLUMNS = (['n'] + [f'{m}_sum' for m in METRICS] + [f'{m}_sumsq' for m in METRICS]
+                + HIST_COLUMNS + ['short_sleep'])
+REQUIRED_COLUMNS = list(METRIC_COLUMNS) + list(DIMENSION_COLUMNS)
+
+
+# ====================== AGGREGATION ======================
+def chunk_stats(chunk):
+    """Sufficient statistics of one export chunk, indexed by (dimension, group)."""
+    missing = [col for col in REQUIRED_COLUMNS if col not in chunk.columns]
+    if missing:
+        raise ValueError(f"Cohort file is missing columns: {missing}")
+
+    # Rows with a missing or non-numeric metric are skipped, so every statistic covers the same rows
+    values = pd.DataFrame({metric: pd.to_numeric(chunk[col], errors='coerce').to_numpy(dtype=float)
+                           for col, metric in METRIC_COLUMNS.items()}, index=chunk.index)
+    complete = values.notna().all(axis=1).to_numpy()
+    chunk, values = chunk[complete], values[complete]
+    scores = np.clip(np.round(values['addicted'].to_numpy()), 0, 10).astype(np.int64)
+
+    per_row = pd.DataFrame({'n': np.ones(len(chunk), dtype=np.int64)})
+    for metric in METRICS:
+        per_row[f'{metric}_sum'] = values[metric].to_numpy()
+        per_row[f'{metric}_sumsq'] = values[metric].to_numpy() ** 2
+    hist = np.zeros((len(chunk), len(SCORE_BINS)), dtype=np.int64)
+    hist[np.arange(len(chunk)), scores] = 1
+    per_row[HIST_COLUMNS] = hist
+    per_row['short_sleep'] = (values['sleep'].to_numpy() <= SHORT_SLEEP_HOURS).astype(np.int64)
+
+    keys = {'all': np.full(len(chunk), 'all', dtype=object)}
+    for col, dimension in DIMENSION_COLUMNS.items():
+        keys[dimension] = chunk[col].astype(str).str.strip().to_numpy(dtype=object)
+
+    parts = []
+    for dimension, group in keys.items():
+        part = per_row.groupby(group, sort=False).sum()
+        part.index = pd.MultiIndex.from_product([[dimension], part.index], names=['dimension', 'group'])
+        parts.append(part)
+    return pd.concat(parts)[STAT_COLUMNS]
+
+
+def merge_stats(left, right):
+    """Adds two statistics tables (groups missing on one side count as zero)."""
+    if left is None:
+        return right
+    merged = left.add(right, fill_value=0)
+    int_columns = ['n'] + HIST_COLUMNS + ['short_sleep']
+    merged[int_columns] = merged[int_columns].astype(np.int64)
+    return merged[STAT_COLUMNS]
+
+
+# ====================== STORE ======================
+def _prefix_digest(fh, length):
+    """SHA-256 object over the first `length` bytes of an open file (left positioned at `length`)."""
+    digest = hashlib.sha256()
+    fh.seek(0)
+    remaining = length
+    while remaining > 0:
+        block = fh.read(min(READ_BLOCK_BYTES, remaining))
+        if not block:
+            break
+        digest.update(block)
+        remaining -= len(block)
+    return digest
+
+
+def _complete_bytes(path):
+    """Size of the file up to and including its last newline (a partial last line is left for later)."""
+    size = os.path.getsize(path)
+    with open(path, 'rb') as fh:
+        position = size
+        while position > 0:
+            step = min(READ_BLOCK_BYTES, position)
+            fh.seek(position - step)
+            block = fh.read(step)
+            newline = block.rfind(b'\n')
+            if newline >= 0:
+                return position - step + newline + 1
+            position -= step
+    return 0
+
+
+def _source_end(path, settle_seconds=SETTLE_SECONDS):
+    """
+    Bytes of the CSV holding finished rows: the whole file once it has been
+    unmodified for `settle_seconds`, otherwise up to its last newline.
+    """
+    if time.time() - os.path.getmtime(path) >= settle_seconds:
+        return os.path.getsize(path)
+    return _complete_bytes(path)
+
+
+class _ByteRange(io.RawIOBase):
+    """Read-only view of the next `length` bytes of a file, fed to `digest` as they are read."""
+
+    def __init__(self, fh, length, digest):
+        self._fh = fh
+        self._remaining = length
+        self._digest = digest
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        size = min(len(buffer), self._remaining)
+        data = self._fh.read(size)
+        buffer[:len(data)] = data
+        self._digest.update(data)
+        self._remaining -= len(data)
+        return len(data)
+
+
+def save_store(stats, path, meta):
+    """Writes the statistics table to Parquet with the build metadata in the schema."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    table = pa.Table.from_pandas(stats.reset_index(), preserve_index=False)
+    table = table.replace_schema_metadata({b'cohort_stats': json.dumps(meta).encode('utf-8')})
+    tmp_path = f"{path}.tmp"
+    pq.write_table(table, tmp_path)
+    os.replace(tmp_path, path)
+
+
+def load_store(path):
+    """Returns (stats, meta), or (None, None) if the store is missing or from another version."""
+    import pyarrow.parquet as pq
+
+    if not os.path.exists(path):
+        return None, None
+    table = pq.read_table(path)
+    meta = json.loads((table.schema.metadata or {}).get(b'cohort_stats', b'{}'))
+    if meta.get('version') != STORE_VERSION:
+        return None, None
+    stats = table.to_pandas().set_index(['dimension', 'group'])
+    return stats, meta
+
+
+def update_store(csv_path=COHORT_CSV_PATH, store_path=COHORT_STATS_PATH, chunksize=DEFAULT_CHUNKSIZE, rebuild=False,
+                 settle_seconds=SETTLE_SECONDS):
+    """
+    Brings the store up to date with the CSV and returns (stats, rows_added, full_rebuild).
+
+    Only rows appended since the last update are parsed, unless the bytes the
+    store was built from changed (edited rows, a new header, a shorter file),
+    the store is missing, or `rebuild` is set.
+    """
+    stats, meta = (None, None) if rebuild else load_store(store_path)
+    end = _source_end(csv_path, settle_seconds)
+
+    with open(csv_path, 'rb') as fh:
+        digest, resumable = None, False
+        if meta is not None and meta.get('source') == os.path.basename(csv_path) and 0 < meta.get('source_bytes', 0) <= end:
+            offset = meta['source_bytes']
+            digest = _prefix_digest(fh, offset)
+            # A last line counted without its newline must not have been extended since
+            fh.seek(offset - 1)
+            boundary = fh.read(2)
+            resumable = (digest.hexdigest() == meta.get('source_sha256')
+                         and (boundary[:1] == b'\n' or boundary[1:] in (b'', b'\n', b'\r')))
+
+        fh.seek(0)
+        header_line = fh.readline()
+        header = pd.read_csv(io.BytesIO(header_line), nrows=0).columns.tolist()
+        if resumable:
+            fh.seek(offset)
+        else:
+            stats, offset = None, len(header_line)
+            digest = hashlib.sha256(header_line)
+        added = 0
+        if offset < end:
+            rows = io.BufferedReader(_ByteRange(fh, end - offset, digest))
+            for chunk in pd.read_csv(rows, header=None, names=header, chunksize=chunksize):
+                stats = merge_stats(stats, chunk_stats(chunk))
+                added += len(chunk)
+
+    if stats is None:
+        raise ValueError(f"{csv_path} has no data rows")
+    meta = {
+        'version': STORE_VERSION,
+        'source': os.path.basename(csv_path),
+        'columns': header,
+        'source_bytes': end,
+        'source_sha256': digest.hexdigest(),
+        'rows': int(stats.loc[('all', 'all'), 'n']),
+    }
+    save_store(stats, store_path, meta)
+    return stats, added, not resumable
+
+
+# ====================== SUMMARY FOR THE INSIGHTS PAGE ======================
+# Values from the notebook run on the 705-student dataset, shown when no store has been built
+NOTEBOOK_SUMMARY = {
+    'rows': 705,
+    'platform_scores': [("WhatsApp", 7.46), ("Snapchat", 7.46), ("TikTok", 7.43), ("Instagram", 6.55),
+                        ("YouTube", 6.1), ("Facebook", 5.67), ("Twitter/X", 5.5), ("LinkedIn", 3.81)],
+    'age_high_counts': [("Age 18", 13), ("Age 19", 126), ("Age 20", 132), ("Age 21", 120),
+                        ("Age 22", 119), ("Age 23", 23), ("Age 24", 15)],
+    'academic_levels': [("High School", 7.5, 8), ("Undergraduate", 6.9, 7), ("Graduate", 6.2, 6),
+                        ("PhD/Doctoral", 5.8, 6)],
+    'academic_anova_p': 0.0,
+    'usage_mean': 4.9,
+    'usage_std': 1.26,
+    'sleep_mean': 6.9,
+    'addicted_mean': 6.4,
+    'addicted_median': 7,
+    'short_sleep_share': 0.25,
+    'conflicts_mean': 2.85,
+}
+
+
+def _histogram_median(hist):
+    """Median of integer scores from their histogram (mean of the middle pair for even counts)."""
+    cumulative = np.cumsum(hist)
+    n = cumulative[-1]
+    lower = int(np.searchsorted(cumulative, (n - 1) // 2 + 1))
+    upper = int(np.searchsorted(cumulative, n // 2 + 1))
+    return float(SCORE_BINS[lower] + SCORE_BINS[upper]) / 2
+
+
+def _anova_p_value(groups):
+    """One-way ANOVA p-value of Addicted_Score across the groups' sufficient statistics."""
+    from scipy.stats import f
+
+    n = groups['n'].to_numpy(dtype=float)
+    sums = groups['addicted_sum'].to_numpy()
+    sumsq = groups['addicted_sumsq'].to_numpy()
+    k, total = len(n), n.sum()
+    if k < 2 or total <= k:
+        return float('nan')
+    grand_mean = sums.sum() / total
+    between = (sums ** 2 / n).sum() - total * grand_mean ** 2
+    within = sumsq.sum() - (sums ** 2 / n).sum()
+    if within <= 0:
+        return 0.0
+    f_stat = (between / (k - 1)) / (within / (total - k))
+    return float(f.sf(f_stat, k - 1, total - k))
+
+
+def cohort_summary(stats):
+    """Every figure the Insights page shows, derived from a statistics table."""
+    def dimension(name):
+        return stats.xs(name, level='dimension')
+
+    overall = dimension('all').iloc[0]
+    n = overall['n']
+
+    platforms = dimension('platform')
+    platform_means = (platforms['addicted_sum'] / platforms['n']).sort_values(ascending=False, kind='stable')
+
+    ages = dimension('age')
+    ages = ages.loc[sorted(ages.index, key=lambda a: (float(a) if a.replace('.', '', 1).isdigit() else float('inf'), a))]
+    high_counts = ages[[f'addicted_{s}' for s in SCORE_BINS if s >= HIGH_ADDICTION_SCORE]].sum(axis=1)
+
+    levels = dimension('academic_level')
+    level_means = (levels['addicted_sum'] / levels['n']).sort_values(ascending=False, kind='stable')
+
+    usage_var = (overall['usage_sumsq'] - overall['usage_sum'] ** 2 / n) / (n - 1) if n > 1 else 0.0
+    return {
+        'rows': int(n),
+        'platform_scores': [(name, round(float(mean), 2)) for name, mean in platform_means.items()],
+        'age_high_counts': [(f"Age {age}", int(count)) for age, count in high_counts.items()],
+        'academic_levels': [(name, round(float(mean), 1), _histogram_median(levels.loc[name, HIST_COLUMNS].to_numpy()))
+                            for name, mean in level_means.items()],
+        'academic_anova_p': _anova_p_value(levels),
+        'usage_mean': float(overall['usage_sum'] / n),
+        'usage_std': float(np.sqrt(max(usage_var, 0.0))),
+        'sleep_mean': float(overall['sleep_sum'] / n),
+        'addicted_mean': float(overall['addicted_sum'] / n),
+        'addicted_median': _histogram_median(overall[HIST_COLUMNS].to_numpy()),
+        'short_sleep_share': float(overall['short_sleep'] / n),
+        'conflicts_mean': float(overall['conflicts_sum'] / n),
+    }
+
+
+def load_summary(path=COHORT_STATS_PATH):
+    """Summary from the store at `path`, or NOTEBOOK_SUMMARY when there is no usable store."""
+    stats, _ = load_store(path)
+    if stats is None:
+        return NOTEBOOK_SUMMARY
+    return cohort_summary(stats)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or incrementally update the cohort aggregate store.")
+    parser.add_argument('csv', nargs='?', default=COHORT_CSV_PATH, help="Cohort CSV export")
+    parser.add_argument('--output', default=COHORT_STATS_PATH, help="Parquet store to create or update")
+    parser.add_argument('--chunksize', type=int, default=DEFAULT_CHUNKSIZE, help="Rows aggregated per chunk")
+    parser.add_argument('--rebuild', action='store_true', help="Ignore the existing store and rebuild from scratch")
+    args = parser.parse_args()
+
+    try:
+        stats, added, full = update_store(args.csv, args.output, args.chunksize, args.rebuild)
+    except (OSError, ValueError) as e:
+        sys.exit(str(e))
+    total = int(stats.loc[('all', 'all'), 'n'])
+    mode = "rebuilt" if full else "updated"
+    print(f"{args.output} {mode}: {added:,} new rows, {total:,} rows total, {len(stats)} groups")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,292 @@
+"""
+Compiles a fitted random forest into flat NumPy node arrays.
+
+For one interactive prediction, most of `predict_proba`'s time goes to pandas
+and scikit-learn input validation rather than to walking the trees. The
+compiled form stores every tree's nodes back to back (feature, threshold,
+left/right children, leaf value) and evaluates all trees at once with a handful of
+array gathers, for one 7-feature vector or a whole batch.
+
+Results match the forest's `predict_proba` exactly: inputs are cast to
+float32 like scikit-learn does, missing values (NaN) follow each split's
+learned missing-value direction (`missing_go_to_left`, scikit-learn >= 1.3),
+and tree probabilities are summed in tree order before dividing by the
+number of trees.
+
+Export and verify a compiled forest with:
+
+    python forest_compiler.py random_forest_social_media_model.joblib compiled_forest/
+
+`load_shared_forest` is what the app uses: the first process to load a model
+file compiles it into COMPILED_FOREST_DIR/<model hash>/ and every process then
+memory-maps those read-only files. Several Streamlit workers on one machine
+therefore share one copy of the node arrays in the OS page cache instead of
+each holding its own.
+"""
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+import numpy as np
+
+TREE_LEAF = -1
+# Rows evaluated together; keeps the (rows x trees) node matrix cache-resident
+ROW_BLOCK = 1024
+ARRAY_NAMES = ('feature', 'threshold', 'children', 'missing_left', 'value', 'roots')
+COMPILED_FOREST_DIR = os.environ.get('COMPILED_FOREST_DIR', 'compiled_forest')
+
+
+class CompiledForest:
+    """
+    Flat-array random forest with a scikit-learn style predict_proba.
+
+    children[node] holds (right, left), so the next node is
+    children[node, x <= threshold]. Leaves point to themselves (both children
+    are the leaf, threshold +inf), so every tree can be advanced max_depth
+    times without branching. A NaN feature value fails every comparison, so
+    rows with NaN take missing_left[node] instead, like scikit-learn.
+    """
+
+    def __init__(self, feature, threshold, children, missing_left, value, roots, max_depth, classes, n_features,
+                 metadata=None):
+        self.feature = feature
+        self.threshold = threshold
+        self.children = children
+        self.missing_left = missing_left
+        self.value = value
+        self.roots = roots
+        self.max_depth = int(max_depth)
+        self.classes_ = np.asarray(classes)
+        self.n_features_in_ = int(n_features)
+        self.metadata = dict(metadata or {})
+
+    @property
+    def n_estimators(self):
+        return len(self.roots)
+
+    @property
+    def left(self):
+        return self.children[:, 1]
+
+    @property
+    def right(self):
+        return self.children[:, 0]
+
+    def apply(self, X):
+        """Leaf node index reached by every row in every tree, shape (n_rows, n_trees)."""
+        X = np.asarray(X, dtype=np.float32)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        if X.shape[1] != self.n_features_in_:
+            raise ValueError(f"X has {X.shape[1]} features, but the forest expects {self.n_features_in_}")
+
+        # Flat 1-D takes are much cheaper than 2-D fancy indexing
+        flat_X = np.ascontiguousarray(X).ravel()
+        row_offsets = (np.arange(X.shape[0]) * X.shape[1])[:, np.newaxis]
+        flat_children = self.children.ravel()
+        nodes = np.broadcast_to(self.roots, (X.shape[0], len(self.roots))).copy()
+        has_missing = np.isnan(flat_X).any()
+        for _ in range(self.max_depth):
+            values = flat_X.take(row_offsets + self.feature.take(nodes))
+            go_left = values <= self.threshold.take(nodes)
+            if has_missing:
+                go_left |= np.isnan(values) & self.missing_left.take(nodes)
+            nodes = flat_children.take(nodes * 2 + go_left)
+        return nodes
+
+    def predict_proba(self, X):
+        """Class probabilities averaged over trees, identical to the source forest."""
+        X = np.asarray(X, dtype=np.float32)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        proba = np.zeros((X.shape[0], self.value.shape[1]), dtype=np.float64)
+        for start in range(0, X.shape[0], ROW_BLOCK):
+            leaf_values = self.value[self.apply(X[start:start + ROW_BLOCK])]
+            block = proba[start:start + ROW_BLOCK]
+            for tree in range(leaf_values.shape[1]):
+                block += leaf_values[:, tree]
+        proba /= len(self.roots)
+        return proba
+
+    def predict(self, X):
+        return self.classes_[np.argmax(self.predict_proba(X), axis=1)]
+
+    def save(self, directory):
+        """Writes one .npy per array plus meta.json (last), so load() can memory-map them."""
+        os.makedirs(directory, exist_ok=True)
+        for name in ARRAY_NAMES:
+            np.save(os.path.join(directory, f'{name}.npy'), np.ascontiguousarray(getattr(self, name)))
+        meta = {
+            'max_depth': self.max_depth,
+            'classes': self.classes_.tolist(),
+            'n_features': self.n_features_in_,
+            'metadata': self.metadata,
+        }
+        with open(os.path.join(directory, 'meta.json'), 'w') as fh:
+            json.dump(meta, fh, indent=2)
+
+    @classmethod
+    def load(cls, directory, mmap_mode='r'):
+        """Loads a saved forest; with mmap_mode the node arrays stay in the OS page cache."""
+        with open(os.path.join(directory, 'meta.json')) as fh:
+            meta = json.load(fh)
+        arrays = {name: np.load(os.path.join(directory, f'{name}.npy'), mmap_mode=mmap_mode) for name in ARRAY_NAMES}
+        return cls(max_depth=meta['max_depth'], classes=meta['classes'], n_features=meta['n_features'],
+                   metadata=meta.get('metadata'), **arrays)
+
+
+def _tree_leaf_values(tree, n_classes):
+    """Per-node class probabilities as the tree's predict_proba returns them."""
+    value = np.array(tree.value[:, 0, :n_classes], dtype=np.float64)
+    normalizer = value.sum(axis=1, keepdims=True)
+    if not np.allclose(normalizer, 1.0):
+        # Older scikit-learn stores class counts and normalizes at predict time
+        normalizer[normalizer == 0.0] = 1.0
+        value /= normalizer
+    return value
+
+
+def compile_forest(forest):
+    """Flattens a fitted RandomForestClassifier / ExtraTreesClassifier into a CompiledForest."""
+    if not hasattr(forest, 'estimators_') or getattr(forest, 'n_outputs_', 1) != 1:
+        raise TypeError(f"Cannot compile {type(forest).__name__}: expected a fitted single-output tree ensemble")
+
+    n_classes = len(forest.classes_)
+    features, thresholds, children, missing_left, values, roots = [], [], [], [], [], []
+    offset = 0
+    max_depth = 0
+    for estimator in forest.estimators_:
+        tree = estimator.tree_
+        own = np.arange(tree.node_count) + offset
+        is_leaf = tree.children_left == TREE_LEAF
+
+        features.append(np.where(is_leaf, 0, tree.feature).astype(np.intp))
+        thresholds.append(np.where(is_leaf, np.inf, tree.threshold).astype(np.float64))
+        left = np.where(is_leaf, own, tree.children_left + offset)
+        right = np.where(is_leaf, own, tree.children_right + offset)
+        children.append(np.stack([right, left], axis=1).astype(np.intp))
+        # scikit-learn < 1.3 rejects NaN inputs and has no learned direction
+        missing_go_to_left = getattr(tree, 'missing_go_to_left', np.zeros(tree.node_count))
+        missing_left.append(np.asarray(missing_go_to_left, dtype=bool) & ~is_leaf)
+        values.append(_tree_leaf_values(tree, n_classes))
+        roots.append(offset)
+
+        offset += tree.node_count
+        max_depth = max(max_depth, tree.max_depth)
+
+    return CompiledForest(
+        feature=np.concatenate(features),
+        threshold=np.concatenate(thresholds),
+        children=np.concatenate(children),
+        missing_left=np.concatenate(missing_left),
+        value=np.concatenate(values),
+        roots=np.asarray(roots, dtype=np.intp),
+        max_depth=max_depth,
+        classes=forest.classes_,
+        n_features=forest.n_features_in_,
+    )
+
+
+def _sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _publish(compiled, directory):
+    """Saves into a temporary sibling and renames it into place, so no process ever maps a half-written forest."""
+    parent = os.path.dirname(os.path.abspath(directory))
+    os.makedirs(parent, exist_ok=True)
+    staging = tempfile.mkdtemp(prefix='.staging-', dir=parent)
+    try:
+        compiled.save(staging)
+        os.rename(staging, directory)
+    except OSError:
+        # Another worker published first (or the directory is unusable); the caller re-reads it
+        shutil.rmtree(staging, ignore_errors=True)
+
+
+def load_shared_forest(model_path, cache_dir=COMPILED_FOREST_DIR):
+    """
+    Returns (model, high_risk_index, status) like load_estimator, with the forest
+    compiled and memory-mapped read-only from cache_dir/<model sha256 prefix>/.
+
+    A cache hit does not unpickle the estimator at all. If the model cannot be
+    compiled, the scikit-learn estimator is returned; if the cache directory is
+    not writable, this process serves a private compiled copy. The model's
+    FeatureTransformer spec is kept in the export's metadata
+    ('feature_transformer'), so a cache hit needs nothing else from the model file.
+    """
+    from model_artifact import load_estimator, load_transformer
+
+    fingerprint = _sha256(model_path)
+    directory = os.path.join(cache_dir, fingerprint[:16])
+
+    def load_cached():
+        try:
+            forest = CompiledForest.load(directory, mmap_mode='r')
+        except (OSError, ValueError, KeyError):
+            return None
+        return forest if forest.metadata.get('source_sha256') == fingerprint else None
+
+    forest = load_cached()
+    if forest is None:
+        estimator, high_risk_index, status = load_estimator(model_path)
+        if estimator is None:
+            return None, high_risk_index, status
+        try:
+            compiled = compile_forest(estimator)
+        except TypeError as e:
+            return estimator, high_risk_index, f"Compiled engine unavailable ({e}); using scikit-learn."
+        compiled.metadata = {'source_sha256': fingerprint, 'high_risk_index': int(high_risk_index), 'status': status,
+                             'feature_transformer': load_transformer(model_path).to_dict()}
+        # Another worker may have published while this one compiled
+        forest = load_cached()
+        if forest is None:
+            if os.path.isdir(directory):
+                # Damaged export for this hash
+                shutil.rmtree(directory, ignore_errors=True)
+            _publish(compiled, directory)
+            forest = load_cached()
+        if forest is None:
+            return compiled, high_risk_index, status
+    return forest, forest.metadata['high_risk_index'], forest.metadata.get('status')
+
+
+def main():
+    import pandas as pd
+    from model_artifact import load_estimator
+
+    parser = argparse.ArgumentParser(description="Export a model file's forest as flat NumPy arrays.")
+    parser.add_argument('model', help="Model artifact or legacy container")
+    parser.add_argument('output', help="Directory for the .npy arrays")
+    parser.add_argument('--verify-rows', type=int, default=10000, help="Random rows used to check predict_proba parity")
+    args = parser.parse_args()
+
+    estimator, _, message = load_estimator(args.model, mmap_mode=None)
+    if estimator is None:
+        sys.exit(message)
+    compiled = compile_forest(estimator)
+
+    rng = np.random.default_rng(0)
+    X = rng.uniform(0, 12, size=(args.verify_rows, compiled.n_features_in_))
+    if hasattr(estimator.estimators_[0].tree_, 'missing_go_to_left'):
+        # Also check the missing-value routing on a share of NaN cells
+        X[rng.random(X.shape) < 0.05] = np.nan
+    if hasattr(estimator, 'feature_names_in_'):
+        X = pd.DataFrame(X, columns=estimator.feature_names_in_)
+    if not np.array_equal(compiled.predict_proba(X), estimator.predict_proba(X)):
+        sys.exit("Compiled forest does not match predict_proba; not exporting.")
+
+    compiled.save(args.output)
+    print(f"Wrote {args.output}: {compiled.n_estimators} trees, {len(compiled.feature):,} nodes, depth {compiled.max_depth}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+"""
+Smallest habit changes that bring a profile's risk score down to a target.
+
+The controllable inputs are daily usage (cut in 0.5 h steps), sleep (added in
+0.5 h steps) and, optionally, giving up late-night use. Candidates only move
+in the healthy direction and are ranked by effort, a weighted sum of the
+changes. They are scored in batches with predict_risk_scores (the same
+feature mapping as predict_risk_score), cheapest first, and any candidate
+that changes everything at least as much as an option already found is
+skipped without scoring: it cannot be a minimal change. The search stops
+once enough options are found or the time budget runs out.
+"""
+import time
+
+import numpy as np
+import pandas as pd
+
+from scoring import HIGH_RISK_CLASS, predict_risk_scores
+
+# Search space: usage can go down to USAGE_FLOOR, sleep up to SLEEP_CEILING (the What-If slider limits)
+STEP = 0.5
+USAGE_FLOOR = 1.0
+SLEEP_CEILING = 10.0
+
+# Effort per hour of usage cut, per extra hour of sleep, and for giving up late-night use
+USAGE_EFFORT = 1.0
+SLEEP_EFFORT = 1.0
+LATE_NIGHT_EFFORT = 1.0
+
+BATCH_SIZE = 64
+TIME_BUDGET = 0.5
+MAX_OPTIONS = 5
+
+
+def _targets(start, stop, step):
+    """`start` followed by grid points from the next step up to `stop` (either direction)."""
+    direction = 1 if stop >= start else -1
+    first = (np.floor(start / step) + 1) * step if direction > 0 else (np.ceil(start / step) - 1) * step
+    grid = np.arange(first, stop + direction * step / 2, direction * step)
+    grid = grid[(grid - stop) * direction <= 1e-9]
+    return np.concatenate([[start], grid])
+
+
+def candidate_changes(usage, sleep, late_night, allow_late_night=True):
+    """
+    All healthy-direction changes as a DataFrame (usage, sleep, late_night, effort),
+    cheapest first; the unchanged profile is the first row.
+    """
+    usage_values = _targets(float(usage), min(float(usage), USAGE_FLOOR), STEP)
+    sleep_values = _targets(float(sleep), max(float(sleep), SLEEP_CEILING), STEP)
+    late_night_values = [True, False] if (late_night and allow_late_night) else [bool(late_night)]
+
+    u, s, ln = np.meshgrid(usage_values, sleep_values, late_night_values, indexing='ij')
+    candidates = pd.DataFrame({'usage': u.ravel(), 'sleep': s.ravel(), 'late_night': ln.ravel()})
+    candidates['effort'] = ((usage - candidates['usage']) * USAGE_EFFORT
+                            + (candidates['sleep'] - sleep) * SLEEP_EFFORT
+                            + (bool(late_night) & ~candidates['late_night']) * LATE_NIGHT_EFFORT)
+    return candidates.sort_values(['effort', 'usage'], ascending=[True, False], kind='stable').reset_index(drop=True)
+
+
+def _dominated(usage, sleep, late_night, found):
+    """Rows that change every input at least as much as some option in `found`."""
+    if not found:
+        return np.zeros(len(usage), dtype=bool)
+    f_usage = np.array([o['usage'] for o in found])
+    f_sleep = np.array([o['sleep'] for o in found])
+    f_late = np.array([o['late_night'] for o in found])
+    return ((usage[:, None] <= f_usage + 1e-9)
+            & (sleep[:, None] >= f_sleep - 1e-9)
+            & (late_night[:, None] <= f_late)).any(axis=1)
+
+
+def find_minimal_changes(model, profile, target, high_risk_index=HIGH_RISK_CLASS, allow_late_night=True,
+                         max_options=MAX_OPTIONS, batch_size=BATCH_SIZE, time_budget=TIME_BUDGET, transformer=None):
+    """
+    Searches for the least-effort changes to `profile` (a dict with the
+    PROFILE_COLUMNS fields) that score at or below `target`, building features
+    with the model's FeatureTransformer.
+
+    Returns (options, complete): options is a list of dicts (usage, sleep,
+    late_night, risk, effort) in increasing effort, none of which is a larger
+    change than another; complete is False if the time budget ran out first.
+    """
+    deadline = time.perf_counter() + time_budget
+    candidates = candidate_changes(profile['usage'], profile['sleep'], profile['late_night'], allow_late_night)
+    usage = candidates['usage'].to_numpy()
+    sleep = candidates['sleep'].to_numpy()
+    late_night = candidates['late_night'].to_numpy()
+    effort = candidates['effort'].to_numpy()
+
+    found = []
+    start = 0
+    while start < len(candidates) and len(found) < max_options:
+        if time.perf_counter() > deadline:
+            return found, False
+        batch = np.arange(start, min(start + batch_size, len(candidates)))
+        start = batch[-1] + 1
+        batch = batch[~_dominated(usage[batch], sleep[batch], late_night[batch], found)]
+        if len(batch) == 0:
+            continue
+
+        n = len(batch)
+        profiles = pd.DataFrame({
+            'usage': usage[batch],
+            'sleep': sleep[batch],
+            'mental': np.full(n, profile['mental']),
+            'stress': np.full(n, profile['stress']),
+            'academic': np.full(n, profile['academic'], dtype=object),
+            'late_night': late_night[batch],
+            'fomo': np.full(n, bool(profile['fomo'])),
+        })
+        risks = predict_risk_scores(model, profiles, high_risk_index, transformer)
+
+        # Batch rows are in effort order, so checking each hit against earlier hits keeps only minimal ones
+        for i in np.flatnonzero(risks <= target):
+            row = batch[i]
+            if _dominated(usage[[row]], sleep[[row]], late_night[[row]], found)[0]:
+                continue
+            found.append({
+                'usage': float(usage[row]),
+                'sleep': float(sleep[row]),
+                'late_night': bool(late_night[row]),
+                'risk': int(risks[i]),
+                'effort': float(effort[row]),
+            })
+            if len(found) == max_options:
+                break
+    return found, True
@@ -0,0 +1,162 @@
+"""
+Server-side history of Assessment submissions in an embedded SQLite database.
+
+Submissions are keyed by a pseudonymous user ID (a random token, no personal
+data) and a timestamp, with an index on (user_id, ts) so a user's trend is an
+index range scan however large the table grows. The database runs in WAL
+mode, so readers never block the writer.
+
+`record()` only enqueues. One writer thread per process takes everything that
+queued up while the previous transaction was committing and writes it with a
+single executemany and commit (group commit): a burst of submissions costs
+one disk sync instead of one per form. With synchronous=NORMAL, commits
+survive an app crash; the last moments before a power loss may not. A batch
+that fails to write (locked database, full disk, bad row) is logged and
+dropped, and the writer carries on with the next one.
+"""
+import atexit
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+HISTORY_DB_PATH = os.environ.get('ASSESSMENT_HISTORY_DB', 'assessment_history.db')
+# Most rows written per transaction
+MAX_BATCH = 1000
+# Longest flush() waits by default, in seconds
+FLUSH_TIMEOUT = 10.0
+
+logger = logging.getLogger(__name__)
+
+FIELDS = ['usage', 'sleep', 'mental', 'stress', 'academic', 'late_night', 'fomo', 'risk_score']
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS assessments (
+    id INTEGER PRIMARY KEY,
+    user_id TEXT NOT NULL,
+    ts REAL NOT NULL,
+    usage REAL NOT NULL,
+    sleep REAL NOT NULL,
+    mental INTEGER NOT NULL,
+    stress INTEGER NOT NULL,
+    academic TEXT NOT NULL,
+    late_night INTEGER NOT NULL,
+    fomo INTEGER NOT NULL,
+    risk_score INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_assessments_user_ts ON assessments (user_id, ts);
+"""
+INSERT = f"INSERT INTO assessments (user_id, ts, {', '.join(FIELDS)}) VALUES ({', '.join('?' * (len(FIELDS) + 2))})"
+
+
+class HistoryStore:
+    """Batched writer and indexed reader for one history database; share one per process."""
+
+    def __init__(self, path=HISTORY_DB_PATH, max_batch=MAX_BATCH):
+        self.path = path
+        self.max_batch = max_batch
+        self._queue = queue.Queue()
+        self._local = threading.local()
+        self._closed = False
+        # Rows lost to failed transactions since the store opened
+        self.failed_rows = 0
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+        self._writer = threading.Thread(target=self._run, name='history-writer', daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    # ---------------- writes ----------------
+    def record(self, user_id, usage, sleep, mental, stress, academic, late_night, fomo, risk_score, ts=None):
+        """Queues one submission for the writer thread and returns immediately."""
+        if self._closed:
+            raise RuntimeError("History store is closed")
+        row = (str(user_id), time.time() if ts is None else float(ts), float(usage), float(sleep), int(mental),
+               int(stress), str(academic), int(bool(late_night)), int(bool(fomo)), int(risk_score))
+        self._queue.put(row)
+
+    def flush(self, timeout=FLUSH_TIMEOUT):
+        """
+        Blocks until everything queued before this call has been written (or
+        dropped after a failed commit); returns False if `timeout` ran out first.
+        """
+        if self._closed:
+            raise RuntimeError("History store is closed")
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self):
+        """Commits pending rows and stops the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._writer.join()
+
+    def _run(self):
+        conn = self._connect()
+        stop = False
+        while not stop:
+            items = [self._queue.get()]
+            # Group commit: take whatever queued up meanwhile, up to max_batch rows
+            while len(items) < self.max_batch:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            rows = [item for item in items if isinstance(item, tuple)]
+            if rows:
+                self._write(conn, rows)
+            for item in items:
+                if item is None:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    item.set()
+        conn.close()
+
+    def _write(self, conn, rows):
+        """
+        Commits `rows` in one transaction. Never raises: later submissions and
+        flush() waiters still need the writer thread. If a row is rejected, the
+        rows are retried one by one so only the bad ones are dropped; database
+        errors (locked, disk full) drop the whole batch.
+        """
+        try:
+            with conn:
+                conn.executemany(INSERT, rows)
+            return
+        except sqlite3.OperationalError:
+            logger.exception("Dropped %d assessment rows: writing to %s failed", len(rows), self.path)
+            self.failed_rows += len(rows)
+            return
+        except Exception:
+            if len(rows) == 1:
+                logger.exception("Dropped an assessment row %r rejected by %s", rows[0], self.path)
+                self.failed_rows += 1
+                return
+        for row in rows:
+            self._write(conn, [row])
+
+    # ---------------- reads ----------------
+    def _reader(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        return conn
+
+    def user_history(self, user_id, limit=50):
+        """The user's most recent submissions as a list of dicts (ts plus FIELDS), oldest first."""
+        cursor = self._reader().execute(
+            f"SELECT ts, {', '.join(FIELDS)} FROM assessments WHERE user_id = ? ORDER BY ts DESC LIMIT ?",
+            (str(user_id), int(limit)))
+        columns = ['ts'] + FIELDS
+        return [dict(zip(columns, row)) for row in reversed(cursor.fetchall())]
@@ -0,0 +1,296 @@
+"""
+Streaming statistics over Assessment submissions for operators.
+
+Enable with LIVE_STATS=1. Every submission updates constant-memory
+accumulators in this process: a per-day assessment count and, for each metric
+(usage, sleep, mental, stress, risk_score), Welford running moments (count,
+mean, variance, min, max) plus a fixed-resolution histogram that answers
+quantile queries. Nothing is recomputed from stored submissions.
+
+All metrics come from bounded sliders, so the histogram's bins cover each
+metric's whole range: quantiles are exact for the integer scores and within
+half a bin (0.05 h) for hours, and two histograms merge by adding their
+counts. Moments merge with Chan's parallel formula, so per-process
+accumulators combine into exactly the statistics of all submissions.
+
+Each process writes its accumulators to its own shard,
+LIVE_STATS_DIR/<host>-<pid>-<id>.json, at most every LIVE_STATS_INTERVAL
+seconds and at exit. `merged_stats()` combines every shard with this
+process's live state. Print the merged summary with:
+
+    python live_stats.py live_stats/
+"""
+import argparse
+import atexit
+import datetime
+import glob
+import json
+import math
+import os
+import socket
+import sys
+import threading
+import time
+import uuid
+
+import numpy as np
+
+ENABLED = os.environ.get('LIVE_STATS') == '1'
+STATS_DIR = os.environ.get('LIVE_STATS_DIR', 'live_stats')
+PERSIST_INTERVAL = float(os.environ.get('LIVE_STATS_INTERVAL', '30'))
+STATS_VERSION = 1
+# Days of assessment counts kept
+DAYS_KEPT = 30
+QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+
+# Histogram range and bin width per metric (the Assessment slider domains, with headroom for hours)
+METRICS = {
+    'usage': (0.0, 24.0, 0.1),
+    'sleep': (0.0, 24.0, 0.1),
+    'mental': (1, 10, 1),
+    'stress': (1, 10, 1),
+    'risk_score': (0, 10, 1),
+}
+
+
+# ====================== ACCUMULATORS ======================
+class RunningMoments:
+    """Welford's online count, mean and variance, plus min and max."""
+
+    def __init__(self, n=0, mean=0.0, m2=0.0, minimum=math.inf, maximum=-math.inf):
+        self.n = n
+        self.mean = mean
+        self.m2 = m2
+        self.min = minimum
+        self.max = maximum
+
+    def update(self, x):
+        x = float(x)
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (x - self.mean)
+        self.min = min(self.min, x)
+        self.max = max(self.max, x)
+
+    def merge(self, other):
+        """Adds another accumulator's observations (Chan et al. pairwise update)."""
+        if other.n == 0:
+            return
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        self.mean += delta * other.n / n
+        self.m2 += other.m2 + delta * delta * self.n * other.n / n
+        self.n = n
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def variance(self):
+        """Sample variance (n - 1 denominator); nan below two observations."""
+        return self.m2 / (self.n - 1) if self.n > 1 else math.nan
+
+    @property
+    def std(self):
+        return math.sqrt(self.variance)
+
+    def to_dict(self):
+        return {'n': self.n, 'mean': self.mean, 'm2': self.m2,
+                'min': self.min if self.n else None, 'max': self.max if self.n else None}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data['n'], data['mean'], data['m2'],
+                   math.inf if data['min'] is None else data['min'],
+                   -math.inf if data['max'] is None else data['max'])
+
+
+class HistogramSketch:
+    """
+    Fixed-width histogram over [low, high] used as a mergeable quantile sketch.
+    Values outside the range count in the first or last bin.
+    """
+
+    def __init__(self, low, high, width, counts=None):
+        self.low = low
+        self.high = high
+        self.width = width
+        n_bins = int(round((high - low) / width)) + 1
+        self.counts = np.zeros(n_bins, dtype=np.int64) if counts is None else np.asarray(counts, dtype=np.int64)
+        if len(self.counts) != n_bins:
+            raise ValueError(f"Expected {n_bins} histogram bins, got {len(self.counts)}")
+
+    def update(self, x):
+        index = int(round((float(x) - self.low) / self.width))
+        self.counts[min(max(index, 0), len(self.counts) - 1)] += 1
+
+    def merge(self, other):
+        if (other.low, other.high, other.width) != (self.low, self.high, self.width):
+            raise ValueError("Cannot merge histograms with different bins")
+        self.counts += other.counts
+
+    def quantiles(self, qs):
+        """Bin value at each quantile in `qs` (nan while empty)."""
+        total = self.counts.sum()
+        if total == 0:
+            return [math.nan] * len(qs)
+        cumulative = np.cumsum(self.counts)
+        indices = np.searchsorted(cumulative, np.maximum(np.asarray(qs) * total, 1), side='left')
+        return [round(float(self.low + i * self.width), 6) for i in indices]
+
+    def to_dict(self):
+        return {'low': self.low, 'high': self.high, 'width': self.width, 'counts': self.counts.tolist()}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data['low'], data['high'], data['width'], data['counts'])
+
+
+class LiveStats:
+    """Per-day counts plus moments and a histogram per metric; thread-safe and mergeable."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.daily = {}
+        self.moments = {name: RunningMoments() for name in METRICS}
+        self.sketches = {name: HistogramSketch(*spec) for name, spec in METRICS.items()}
+
+    def record(self, day=None, **values):
+        """Adds one submission; `values` holds every metric in METRICS."""
+        day = day or datetime.date.today().isoformat()
+        with self._lock:
+            self.daily[day] = self.daily.get(day, 0) + 1
+            for name in METRICS:
+                self.moments[name].update(values[name])
+                self.sketches[name].update(values[name])
+            self._trim_days()
+
+    def _trim_days(self):
+        for day in sorted(self.daily)[:-DAYS_KEPT]:
+            del self.daily[day]
+
+    def merge(self, other):
+        with self._lock:
+            for day, n in other.daily.items():
+                self.daily[day] = self.daily.get(day, 0) + n
+            for name in METRICS:
+                self.moments[name].merge(other.moments[name])
+                self.sketches[name].merge(other.sketches[name])
+            self._trim_days()
+
+    @property
+    def total(self):
+        return self.moments['risk_score'].n
+
+    def summary(self, quantiles=QUANTILES):
+        """One row per metric: n, mean, std, min, max and the requested quantiles."""
+        with self._lock:
+            rows = []
+            for name in METRICS:
+                moments = self.moments[name]
+                empty = moments.n == 0
+                row = {'metric': name, 'n': moments.n, 'mean': math.nan if empty else moments.mean, 'std': moments.std,
+                       'min': math.nan if empty else moments.min, 'max': math.nan if empty else moments.max}
+                row.update({f"p{round(q * 100)}": v for q, v in zip(quantiles, self.sketches[name].quantiles(quantiles))})
+                rows.append(row)
+            return rows
+
+    def to_dict(self):
+        with self._lock:
+            return {
+                'version': STATS_VERSION,
+                'daily': dict(self.daily),
+                'moments': {name: m.to_dict() for name, m in self.moments.items()},
+                'sketches': {name: s.to_dict() for name, s in self.sketches.items()},
+            }
+
+    @classmethod
+    def from_dict(cls, data):
+        if data.get('version') != STATS_VERSION:
+            raise ValueError(f"Unsupported live stats version {data.get('version')} (expected {STATS_VERSION})")
+        stats = cls()
+        stats.daily = dict(data['daily'])
+        stats.moments = {name: RunningMoments.from_dict(data['moments'][name]) for name in METRICS}
+        stats.sketches = {name: HistogramSketch.from_dict(data['sketches'][name]) for name in METRICS}
+        return stats
+
+
+# ====================== PROCESS ACCUMULATOR AND SHARDS ======================
+stats = LiveStats()
+SHARD_PATH = os.path.join(STATS_DIR, f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}.json")
+_last_persist = 0.0
+
+
+def _record(usage, sleep, mental, stress, risk_score):
+    global _last_persist
+    stats.record(usage=usage, sleep=sleep, mental=mental, stress=stress, risk_score=risk_score)
+    if time.time() - _last_persist >= PERSIST_INTERVAL:
+        _last_persist = time.time()
+        persist()
+
+
+def _noop(*args, **kwargs):
+    pass
+
+
+record = _record if ENABLED else _noop
+
+
+def persist(path=None):
+    """Writes this process's accumulators to its shard (atomically replaced)."""
+    path = path or SHARD_PATH
+    if stats.total == 0:
+        return
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as fh:
+        json.dump(stats.to_dict(), fh)
+    os.replace(tmp_path, path)
+
+
+if ENABLED:
+    atexit.register(persist)
+
+
+def load_shards(directory=STATS_DIR, exclude=()):
+    """Merges every shard in `directory` (except paths in `exclude`) into one LiveStats."""
+    merged = LiveStats()
+    for path in sorted(glob.glob(os.path.join(directory, '*.json'))):
+        if os.path.abspath(path) in {os.path.abspath(p) for p in exclude}:
+            continue
+        try:
+            with open(path) as fh:
+                merged.merge(LiveStats.from_dict(json.load(fh)))
+        except (OSError, ValueError, KeyError):
+            # A shard from an incompatible version or a torn copy; skip it
+            continue
+    return merged
+
+
+def merged_stats(directory=STATS_DIR):
+    """All processes' statistics: other workers' shards plus this process's live accumulators."""
+    merged = load_shards(directory, exclude=[SHARD_PATH])
+    merged.merge(LiveStats.from_dict(stats.to_dict()))
+    return merged
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Print Assessment statistics merged across worker shards.")
+    parser.add_argument('directory', nargs='?', default=STATS_DIR, help="Directory of per-process shards")
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.directory):
+        sys.exit(f"No live stats directory at {args.directory}")
+    merged = load_shards(args.directory)
+    print(f"{merged.total:,} assessments")
+    for day, n in sorted(merged.daily.items())[-7:]:
+        print(f"  {day}: {n:,}")
+    rows = merged.summary()
+    columns = list(rows[0])
+    print("\n" + " ".join(f"{c:>10}" for c in columns))
+    for row in rows:
+        print(" ".join(f"{v:>10}" if isinstance(v, str) else f"{v:>10.3g}" for v in row.values()))
+
+
+if __name__ == '__main__':
+    main()
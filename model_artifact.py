@@ -0,0 +1,233 @@
+"""
+Versioned model artifact format for the risk model.
+
+An artifact is a plain dict saved with joblib (uncompressed, so it can be
+loaded with `mmap_mode`) holding:
+
+- format / version: identify the layout
+- estimator: the fitted classifier (must have predict_proba)
+- feature_columns: ordered feature list the estimator was trained on
+- class_labels: {class value: label}, e.g. {0: 'High Risk', 1: 'Low Risk'}
+- schema_hash: SHA-256 over feature_columns + class_labels
+- feature_transformer: scoring.FeatureTransformer spec (plain dict) that built
+  the training features; serving rebuilds the same transformer from it.
+  Artifacts written before it was stored are served with DEFAULT_TRANSFORMER
+- metadata: free-form training info (accuracy, training date, ...)
+
+Check or convert files from the command line:
+
+    python model_artifact.py check random_forest_social_media_model.joblib
+    python model_artifact.py convert notebook_package.joblib model_artifact.joblib
+"""
+import argparse
+import hashlib
+import json
+import sys
+
+import joblib
+import pandas as pd
+
+from scoring import DEFAULT_TRANSFORMER, FEATURE_COLUMNS, HIGH_RISK_CLASS, FeatureTransformer
+
+ARTIFACT_FORMAT = 'digital-wellbeing-risk-model'
+ARTIFACT_VERSION = 1
+HIGH_RISK_LABEL = 'High Risk'
+
+# The notebook label-encodes mental_health_risk_level alphabetically
+NOTEBOOK_CLASS_LABELS = {0: 'High Risk', 1: 'Low Risk'}
+
+
+class ArtifactError(ValueError):
+    """Raised when a model file does not match what predict_risk_score expects."""
+
+
+def schema_hash(feature_columns, class_labels):
+    """Stable hash of the serving contract (ordered features + class mapping)."""
+    payload = json.dumps({
+        'feature_columns': list(feature_columns),
+        'class_labels': {str(k): v for k, v in sorted(class_labels.items(), key=lambda kv: str(kv[0]))},
+    }, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def build_artifact(estimator, class_labels=None, feature_columns=None, metadata=None, transformer=None):
+    """Wraps a fitted estimator, and the FeatureTransformer its inputs came from, in the versioned artifact dict."""
+    class_labels = dict(class_labels if class_labels is not None else NOTEBOOK_CLASS_LABELS)
+    feature_columns = list(feature_columns if feature_columns is not None else FEATURE_COLUMNS)
+    artifact = {
+        'format': ARTIFACT_FORMAT,
+        'version': ARTIFACT_VERSION,
+        'estimator': estimator,
+        'feature_columns': feature_columns,
+        'class_labels': class_labels,
+        'schema_hash': schema_hash(feature_columns, class_labels),
+        'feature_transformer': (transformer or DEFAULT_TRANSFORMER).to_dict(),
+        'metadata': dict(metadata or {}),
+    }
+    validate_artifact(artifact)
+    return artifact
+
+
+def save_artifact(artifact, path):
+    """Saves an artifact uncompressed so numpy arrays inside can be memory-mapped on load."""
+    validate_artifact(artifact)
+    joblib.dump(artifact, path, compress=0)
+
+
+def high_risk_index(artifact):
+    """Column of predict_proba holding the High Risk probability."""
+    labels = artifact['class_labels']
+    classes = list(artifact['estimator'].classes_)
+    for index, value in enumerate(classes):
+        if labels.get(value, labels.get(str(value))) == HIGH_RISK_LABEL:
+            return index
+    raise ArtifactError(f"No class labelled '{HIGH_RISK_LABEL}' in {labels}")
+
+
+def artifact_transformer(artifact):
+    """The artifact's FeatureTransformer (DEFAULT_TRANSFORMER if it predates stored transformers)."""
+    spec = artifact.get('feature_transformer')
+    if spec is None:
+        return DEFAULT_TRANSFORMER
+    try:
+        return FeatureTransformer.from_dict(spec)
+    except ValueError as e:
+        raise ArtifactError(f"Feature transformer: {e}") from e
+
+
+def validate_artifact(artifact):
+    """Raises ArtifactError if the artifact does not match the serving contract."""
+    if not isinstance(artifact, dict) or artifact.get('format') != ARTIFACT_FORMAT:
+        raise ArtifactError("Not a versioned model artifact")
+    if artifact.get('version') != ARTIFACT_VERSION:
+        raise ArtifactError(f"Unsupported artifact version {artifact.get('version')} (expected {ARTIFACT_VERSION})")
+
+    estimator = artifact.get('estimator')
+    if not hasattr(estimator, 'predict_proba'):
+        raise ArtifactError("Artifact estimator has no predict_proba method")
+
+    feature_columns = artifact.get('feature_columns')
+    if list(feature_columns or []) != FEATURE_COLUMNS:
+        raise ArtifactError(f"Feature columns {feature_columns} do not match the app's features {FEATURE_COLUMNS}")
+    n_features = getattr(estimator, 'n_features_in_', len(FEATURE_COLUMNS))
+    if n_features != len(FEATURE_COLUMNS):
+        raise ArtifactError(f"Estimator expects {n_features} features, the app provides {len(FEATURE_COLUMNS)}")
+
+    class_labels = artifact.get('class_labels') or {}
+    if artifact.get('schema_hash') != schema_hash(feature_columns, class_labels):
+        raise ArtifactError("Schema hash does not match the artifact's features and class labels")
+    classes = list(getattr(estimator, 'classes_', []))
+    if sorted(map(str, classes)) != sorted(map(str, class_labels)):
+        raise ArtifactError(f"Estimator classes {classes} do not match class labels {class_labels}")
+    high_risk_index(artifact)
+    artifact_transformer(artifact)
+
+
+def load_artifact(path, mmap_mode='r'):
+    """Loads and validates a versioned artifact; raises ArtifactError on any mismatch."""
+    try:
+        artifact = joblib.load(path, mmap_mode=mmap_mode)
+    except Exception as e:
+        raise ArtifactError(f"Could not read {path}: {e}") from e
+    validate_artifact(artifact)
+    return artifact
+
+
+def load_transformer(path):
+    """
+    FeatureTransformer for a model file: the one stored in a valid artifact,
+    DEFAULT_TRANSFORMER for legacy containers or unreadable files (which
+    load_estimator serves with that mapping or the heuristic anyway).
+    """
+    try:
+        return artifact_transformer(load_artifact(path))
+    except ArtifactError:
+        return DEFAULT_TRANSFORMER
+
+
+def load_estimator(path, mmap_mode='r'):
+    """
+    Returns (estimator, high_risk_index, message) for any supported model file.
+
+    Versioned artifacts are validated strictly. Legacy containers (a Series
+    keyed 'Model', a dict keyed 'model', or a bare estimator) are still
+    accepted with HIGH_RISK_CLASS assumed. When no usable estimator is found
+    the estimator is None and `message` explains why, so callers can report
+    degraded (heuristic) mode.
+    """
+    try:
+        artifact = load_artifact(path, mmap_mode=mmap_mode)
+        return artifact['estimator'], high_risk_index(artifact), None
+    except ArtifactError as e:
+        artifact_error = e
+
+    try:
+        loaded_object = joblib.load(path)
+    except Exception as e:
+        return None, HIGH_RISK_CLASS, f"Error loading model: {e}"
+
+    if isinstance(loaded_object, dict) and loaded_object.get('format') == ARTIFACT_FORMAT:
+        # A versioned artifact that failed validation must not be used
+        return None, HIGH_RISK_CLASS, f"Model artifact rejected: {artifact_error}"
+    # Unwrap nested containers, e.g. the notebook's {'model': Series(['Model', ...])} metrics package
+    while not hasattr(loaded_object, 'predict_proba'):
+        if isinstance(loaded_object, pd.Series) and 'Model' in loaded_object:
+            loaded_object = loaded_object['Model']
+        elif isinstance(loaded_object, dict) and 'model' in loaded_object:
+            loaded_object = loaded_object['model']
+        else:
+            break
+
+    if not hasattr(loaded_object, 'predict_proba'):
+        return None, HIGH_RISK_CLASS, (
+            f"{path} does not contain a fitted estimator (found {type(loaded_object).__name__} "
+            f"{str(loaded_object)[:40]!r}). Save a fitted estimator with model_artifact.save_artifact."
+        )
+    return loaded_object, HIGH_RISK_CLASS, "Legacy model container: High Risk class assumed to be label 1."
+
+
+def _describe(artifact):
+    estimator = artifact['estimator']
+    return "\n".join([
+        f"format      : {artifact['format']} v{artifact['version']}",
+        f"estimator   : {type(estimator).__name__} ({getattr(estimator, 'n_estimators', 1)} estimators)",
+        f"features    : {', '.join(artifact['feature_columns'])}",
+        f"classes     : {artifact['class_labels']} (High Risk column {high_risk_index(artifact)})",
+        f"schema hash : {artifact['schema_hash']}",
+        f"transformer : {artifact_transformer(artifact)!r}",
+        f"metadata    : {artifact['metadata']}",
+    ])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check or convert risk model artifacts.")
+    sub = parser.add_subparsers(dest='command', required=True)
+    check = sub.add_parser('check', help="Validate an artifact and print its summary")
+    check.add_argument('path')
+    convert = sub.add_parser('convert', help="Wrap a legacy container's estimator in a versioned artifact")
+    convert.add_argument('source')
+    convert.add_argument('output')
+    convert.add_argument('--class-labels', default=','.join(NOTEBOOK_CLASS_LABELS.values()),
+                         help="Comma-separated labels for classes 0, 1, ... (default: notebook encoding)")
+    args = parser.parse_args()
+
+    if args.command == 'check':
+        try:
+            print(_describe(load_artifact(args.path)))
+        except ArtifactError as e:
+            sys.exit(f"INVALID: {e}")
+        return
+
+    estimator, _, message = load_estimator(args.source, mmap_mode=None)
+    if estimator is None:
+        sys.exit(message)
+    labels = dict(enumerate(label.strip() for label in args.class_labels.split(',')))
+    try:
+        save_artifact(build_artifact(estimator, class_labels=labels, metadata={'converted_from': args.source}), args.output)
+    except ArtifactError as e:
+        sys.exit(f"Cannot convert {args.source}: {e}")
+    print(f"Wrote {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,163 @@
+"""
+Incremental refresh of the risk forest from newly collected, labelled assessments.
+
+Instead of retraining on the whole history, a refresh grows the existing
+forest with warm_start: the oldest `retire` trees can be dropped, then `add`
+new trees are fitted on the new rows only. The cost therefore scales with the
+size of the new data, not with the history.
+
+Before anything is published, the refreshed forest is scored against the
+current one on two slices:
+
+- a stratified holdout of the new data (never used to fit the new trees);
+- the artifact's reference set, the validation rows saved by train.py, plus
+  the holdouts of earlier refreshes, capped at REFERENCE_ROWS.
+
+The new artifact replaces the old one, with model_version bumped and the
+refresh recorded in its metadata, only if accuracy on both slices stays
+within `tolerance` of the current model. Otherwise the model file is left
+untouched.
+
+    python model_refresh.py new_assessments.csv
+    python model_refresh.py new_assessments.csv --add-trees 100 --retire-trees 50
+"""
+import argparse
+import copy
+import os
+import sys
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from cohort import cohort_to_profiles
+from model_artifact import ArtifactError, artifact_transformer, build_artifact, load_artifact, save_artifact
+from train import LABEL_COLUMN, OUTPUT_PATH, RANDOM_STATE, label_stage, load_stage
+
+ADD_TREES = 50
+HOLDOUT = 0.2
+# Largest accuracy drop accepted on either validation slice
+TOLERANCE = 0.01
+# Most rows kept in the artifact's reference set (newest kept)
+REFERENCE_ROWS = 1000
+
+
+class RefreshRejected(ValueError):
+    """Raised when the refreshed forest does not hold accuracy; nothing is published."""
+
+
+def labelled_features(csv_path, class_labels, transformer):
+    """
+    Serving features, built with the artifact's FeatureTransformer, and class codes for a new
+    export. Uses its mental_health_risk_level column when present, otherwise labels the rows
+    with the notebook's clustering rule.
+    """
+    data = load_stage(csv_path)
+    if LABEL_COLUMN not in data.columns:
+        data = label_stage(data)['data']
+    codes = {label: code for code, label in class_labels.items()}
+    unknown = sorted(set(data[LABEL_COLUMN]) - set(codes))
+    if unknown:
+        raise ValueError(f"Unknown risk levels {unknown}; the model knows {sorted(codes)}")
+    X = transformer.frame(transformer.transform(cohort_to_profiles(data)))
+    return X, data[LABEL_COLUMN].map(codes).to_numpy()
+
+
+def refresh_forest(artifact, X_new, y_new, add=ADD_TREES, retire=0, holdout=HOLDOUT, tolerance=TOLERANCE):
+    """
+    Returns (refreshed artifact, report) for new rows X_new / y_new; raises
+    RefreshRejected if accuracy drops by more than `tolerance` on the new
+    data's holdout or on the reference set. `artifact` is not modified.
+    """
+    from sklearn.metrics import accuracy_score
+    from sklearn.model_selection import train_test_split
+
+    current = artifact['estimator']
+    if not hasattr(current, 'estimators_') or not hasattr(current, 'warm_start'):
+        raise ValueError(f"Cannot refresh {type(current).__name__}: expected a fitted random forest")
+    if not 0 <= retire < len(current.estimators_):
+        raise ValueError(f"Can retire 0 to {len(current.estimators_) - 1} of {len(current.estimators_)} trees, not {retire}")
+    if len(set(y_new)) < len(current.classes_):
+        raise ValueError("New data must contain every risk level to grow trees on it")
+
+    X_fit, X_hold, y_fit, y_hold = train_test_split(
+        X_new, y_new, test_size=holdout, random_state=RANDOM_STATE, stratify=y_new)
+
+    metadata = copy.deepcopy(artifact['metadata'])
+    version = int(metadata.get('model_version', 1)) + 1
+    forest = copy.deepcopy(current)
+    forest.estimators_ = forest.estimators_[retire:]
+    # A fresh seed per version, so new trees never repeat an earlier refresh's bootstrap draws
+    forest.set_params(warm_start=True, n_estimators=len(forest.estimators_) + add,
+                      random_state=RANDOM_STATE + version)
+    forest.fit(X_fit, y_fit)
+    forest.set_params(warm_start=False)
+
+    reference = metadata.get('reference_set') or {'X': [], 'y': []}
+    slices = {'new_holdout': (X_hold.to_numpy(), np.asarray(y_hold))}
+    if reference['y']:
+        slices['reference'] = (np.asarray(reference['X'], dtype=float), np.asarray(reference['y']))
+    report = {'version': version, 'rows': int(len(y_new)), 'fit_rows': int(len(y_fit)), 'added': add,
+              'retired': retire, 'trees': len(forest.estimators_)}
+    for name, (X, y) in slices.items():
+        X = pd.DataFrame(X, columns=X_new.columns)
+        before = float(accuracy_score(y, current.predict(X)))
+        after = float(accuracy_score(y, forest.predict(X)))
+        report[name] = {'rows': int(len(y)), 'before': before, 'after': after}
+        if after < before - tolerance:
+            raise RefreshRejected(f"Accuracy on {name} would drop from {before:.3f} to {after:.3f}; not publishing.")
+
+    # This refresh's holdout joins the reference set for future refreshes
+    metadata['reference_set'] = {
+        'X': (reference['X'] + X_hold.to_numpy().tolist())[-REFERENCE_ROWS:],
+        'y': (reference['y'] + np.asarray(y_hold).tolist())[-REFERENCE_ROWS:],
+    }
+    metadata['model_version'] = version
+    metadata['refreshed'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    metadata['refresh_history'] = metadata.get('refresh_history', []) + [dict(report, date=metadata['refreshed'])]
+    refreshed = build_artifact(forest, class_labels=artifact['class_labels'],
+                               feature_columns=artifact['feature_columns'], metadata=metadata,
+                               transformer=artifact_transformer(artifact))
+    return refreshed, report
+
+
+def publish(artifact, path):
+    """Writes the artifact next to `path` and renames it into place, so loaders never see a partial file."""
+    tmp_path = f"{path}.tmp"
+    save_artifact(artifact, tmp_path)
+    os.replace(tmp_path, path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Grow the risk forest on newly labelled assessments.")
+    parser.add_argument('csv', help="New assessments in the notebook's CSV layout")
+    parser.add_argument('--model', default=OUTPUT_PATH, help="Current model artifact")
+    parser.add_argument('--output', help="Where to publish the refreshed artifact (default: replace --model)")
+    parser.add_argument('--add-trees', type=int, default=ADD_TREES, help="Trees fitted on the new data")
+    parser.add_argument('--retire-trees', type=int, default=0, help="Oldest trees dropped first")
+    parser.add_argument('--holdout', type=float, default=HOLDOUT, help="Share of new rows held out for validation")
+    parser.add_argument('--tolerance', type=float, default=TOLERANCE, help="Largest accuracy drop accepted")
+    args = parser.parse_args()
+
+    try:
+        artifact = load_artifact(args.model, mmap_mode=None)
+        X_new, y_new = labelled_features(args.csv, artifact['class_labels'], artifact_transformer(artifact))
+        refreshed, report = refresh_forest(artifact, X_new, y_new, args.add_trees, args.retire_trees,
+                                           args.holdout, args.tolerance)
+    except RefreshRejected as e:
+        sys.exit(f"REJECTED: {e}")
+    except (OSError, ValueError, ArtifactError) as e:
+        sys.exit(str(e))
+
+    output = args.output or args.model
+    publish(refreshed, output)
+    for name in ('new_holdout', 'reference'):
+        if name in report:
+            r = report[name]
+            print(f"{name:<12} {r['rows']:>6} rows  accuracy {r['before']:.3f} -> {r['after']:.3f}")
+    print(f"Published version {report['version']} to {output}: +{report['added']} trees on {report['fit_rows']:,} rows, "
+          f"-{report['retired']} retired, {report['trees']} trees.")
+
+
+if __name__ == '__main__':
+    main()
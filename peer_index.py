@@ -0,0 +1,128 @@
+"""
+Sorted cohort index for percentile ranks on the Peer Comparison page.
+
+Each metric (usage, sleep, mental health, risk score) is stored as one sorted
+float32 row of a (metrics x students) array, so the percentile of any value is
+two binary searches: O(log n), a few microseconds even for millions of
+students. Risk scores are computed with the same model the app serves; the
+JSON sidecar records that model's fingerprint so a stale index never mixes
+two models' scores.
+
+Build the index from the cohort export with:
+
+    python peer_index.py "Students Social Media Addiction.csv" --model random_forest_social_media_model.joblib
+"""
+import argparse
+import json
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+from cohort import COHORT_CSV_PATH, cohort_to_profiles
+from model_artifact import load_estimator, load_transformer
+from risk_table import file_fingerprint
+from scoring import HIGH_RISK_CLASS, predict_risk_scores
+
+PEER_INDEX_PATH = 'peer_index.npy'
+INDEX_VERSION = 1
+DEFAULT_CHUNKSIZE = 200000
+# Row order of the index array
+METRICS = ['usage', 'sleep', 'mental', 'risk']
+
+
+def build_peer_index(csv_path, model=None, high_risk_index=HIGH_RISK_CLASS, chunksize=DEFAULT_CHUNKSIZE, transformer=None):
+    """Streams the export and returns the sorted (len(METRICS), n) float32 index."""
+    columns = {metric: [] for metric in METRICS}
+    for chunk in pd.read_csv(csv_path, chunksize=chunksize):
+        profiles = cohort_to_profiles(chunk)
+        profiles = profiles[profiles[['usage', 'sleep', 'mental', 'stress']].notna().all(axis=1)]
+        for metric in ('usage', 'sleep', 'mental'):
+            columns[metric].append(profiles[metric].to_numpy(dtype=np.float32))
+        columns['risk'].append(predict_risk_scores(model, profiles, high_risk_index, transformer).astype(np.float32))
+
+    index = np.vstack([np.concatenate(columns[metric]) for metric in METRICS])
+    if index.shape[1] == 0:
+        raise ValueError(f"{csv_path} has no complete rows")
+    index.sort(axis=1)
+    return index
+
+
+def _meta_path(path):
+    return os.path.splitext(path)[0] + '.json'
+
+
+def save_peer_index(index, path, model_fingerprint):
+    """Writes the index (.npy) and a JSON sidecar with the metric order, means and model fingerprint."""
+    np.save(path, index)
+    meta = {
+        'version': INDEX_VERSION,
+        'metrics': METRICS,
+        'rows': int(index.shape[1]),
+        'means': {metric: float(index[i].mean(dtype=np.float64)) for i, metric in enumerate(METRICS)},
+        'model_sha256': model_fingerprint,
+    }
+    with open(_meta_path(path), 'w') as fh:
+        json.dump(meta, fh, indent=2)
+
+
+def load_peer_index(path, model_fingerprint):
+    """
+    Memory-maps a saved index and returns (index, meta), or (None, None) if it is
+    missing or from another version. Risk percentiles are only valid when the
+    index was built with the serving model: meta['risk_valid'] says whether they are.
+    """
+    if not (os.path.exists(path) and os.path.exists(_meta_path(path))):
+        return None, None
+    with open(_meta_path(path)) as fh:
+        meta = json.load(fh)
+    if meta.get('version') != INDEX_VERSION or meta.get('metrics') != METRICS:
+        return None, None
+    index = np.load(path, mmap_mode='r')
+    if index.ndim != 2 or index.shape != (len(METRICS), meta.get('rows')):
+        return None, None
+    meta['risk_valid'] = meta.get('model_sha256') == model_fingerprint
+    return index, meta
+
+
+def percentile_rank(index, metric, value):
+    """
+    Share of the cohort (0-100) below `value`, counting ties as half - the
+    mid-rank ECDF, so a value everyone shares ranks at 50.
+    """
+    values = index[METRICS.index(metric)]
+    # Search with the index's dtype; a float64 needle would make NumPy upcast the whole row first
+    value = values.dtype.type(value)
+    below = np.searchsorted(values, value, side='left')
+    not_above = np.searchsorted(values, value, side='right')
+    return 100.0 * (below + not_above) / (2 * len(values))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the sorted cohort index behind Peer Comparison percentiles.")
+    parser.add_argument('csv', nargs='?', default=COHORT_CSV_PATH, help="Cohort CSV export")
+    parser.add_argument('--model', default='random_forest_social_media_model.joblib',
+                        help="Model file the app serves (missing file: heuristic scores, as the app uses)")
+    parser.add_argument('--output', default=PEER_INDEX_PATH, help="Where to write the .npy index")
+    parser.add_argument('--chunksize', type=int, default=DEFAULT_CHUNKSIZE, help="Rows read per chunk")
+    args = parser.parse_args()
+
+    model, high_risk_index, fingerprint, transformer = None, HIGH_RISK_CLASS, None, None
+    if os.path.exists(args.model):
+        model, high_risk_index, _ = load_estimator(args.model, mmap_mode=None)
+        if model is not None:
+            fingerprint = file_fingerprint(args.model)
+            transformer = load_transformer(args.model)
+
+    try:
+        index = build_peer_index(args.csv, model, high_risk_index, args.chunksize, transformer)
+    except (OSError, ValueError) as e:
+        sys.exit(str(e))
+    save_peer_index(index, args.output, fingerprint)
+    scoring = "model" if model is not None else "heuristic"
+    print(f"Wrote {args.output}: {index.shape[1]:,} students ({index.nbytes / 1024:.0f} KB, {scoring} risk scores)")
+
+
+if __name__ == '__main__':
+    main()
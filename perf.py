@@ -0,0 +1,165 @@
+"""
+Lightweight rerun instrumentation for the Streamlit app.
+
+Enable with PERF_METRICS=1. Each rerun of app.py is split into named sections
+with `lap(name)`, which charges the time since the previous lap to `name`
+(repeated names within one rerun add up). Functions wrapped with `timed(name)`
+record one sample per call, and `count(name)` bumps a counter, e.g. how often
+predict_risk_score used the model or fell back to the heuristic.
+`end_rerun(page)` files everything under the page that was rendered.
+
+Samples live in a process-wide registry, so they are aggregated across all
+sessions served by the process. `snapshot()` reports p50/p95/p99 per page and
+section; with PERF_METRICS_FILE set the snapshot is also written to that JSON
+file at most every PERF_EXPORT_INTERVAL seconds.
+
+When disabled, `lap`, `count`, `start_rerun` and `end_rerun` are empty
+functions and `timed` returns the function unchanged.
+"""
+import functools
+import json
+import os
+import threading
+import time
+from collections import defaultdict, deque
+
+import numpy as np
+
+ENABLED = os.environ.get('PERF_METRICS') == '1'
+EXPORT_PATH = os.environ.get('PERF_METRICS_FILE')
+EXPORT_INTERVAL = float(os.environ.get('PERF_EXPORT_INTERVAL', '30'))
+# Most recent samples kept per (page, section); older ones are dropped
+MAX_SAMPLES = 5000
+TOTAL = 'total'
+
+
+class PerfRegistry:
+    """Thread-safe store of timing samples (ms) and counters keyed by (page, name)."""
+
+    def __init__(self, max_samples=MAX_SAMPLES):
+        self.max_samples = max_samples
+        self._lock = threading.Lock()
+        self._samples = defaultdict(lambda: deque(maxlen=self.max_samples))
+        self._counts = defaultdict(int)
+        self.reruns = 0
+        self.started = time.time()
+
+    def record(self, page, sections, calls, counts):
+        with self._lock:
+            self.reruns += 1
+            for name, ms in sections.items():
+                self._samples[(page, name)].append(ms)
+            for name, samples in calls.items():
+                self._samples[(page, name)].extend(samples)
+            for name, n in counts.items():
+                self._counts[(page, name)] += n
+
+    def snapshot(self):
+        """Percentiles per (page, section) and counters, as a JSON-ready dict."""
+        with self._lock:
+            samples = {key: np.fromiter(values, dtype=float) for key, values in self._samples.items()}
+            counts = dict(self._counts)
+            reruns = self.reruns
+
+        timings = []
+        for (page, name), values in sorted(samples.items()):
+            p50, p95, p99 = np.percentile(values, [50, 95, 99])
+            timings.append({
+                'page': page, 'section': name, 'n': int(values.size),
+                'mean_ms': float(values.mean()), 'p50_ms': float(p50), 'p95_ms': float(p95), 'p99_ms': float(p99),
+            })
+        return {
+            'since': time.strftime('%Y-%m-%dT%H:%M:%S%z', time.localtime(self.started)),
+            'generated': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'reruns': reruns,
+            'timings': timings,
+            'counters': [{'page': page, 'counter': name, 'count': n} for (page, name), n in sorted(counts.items())],
+        }
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+            self._counts.clear()
+            self.reruns = 0
+            self.started = time.time()
+
+
+registry = PerfRegistry()
+# Streamlit runs each session's reruns on its own thread; the in-progress rerun is thread-local
+_current = threading.local()
+_last_export = 0.0
+
+
+def _start_rerun():
+    now = time.perf_counter()
+    _current.started = now
+    _current.last = now
+    _current.sections = defaultdict(float)
+    _current.calls = defaultdict(list)
+    _current.counts = defaultdict(int)
+
+
+def _lap(name):
+    now = time.perf_counter()
+    if not hasattr(_current, 'last'):
+        return
+    _current.sections[name] += (now - _current.last) * 1e3
+    _current.last = now
+
+
+def _count(name, n=1):
+    if hasattr(_current, 'counts'):
+        _current.counts[name] += n
+
+
+def _end_rerun(page):
+    global _last_export
+    if not hasattr(_current, 'started'):
+        return
+    _current.sections[TOTAL] = (time.perf_counter() - _current.started) * 1e3
+    registry.record(page, _current.sections, _current.calls, _current.counts)
+    del _current.started, _current.last
+
+    if EXPORT_PATH and time.time() - _last_export >= EXPORT_INTERVAL:
+        _last_export = time.time()
+        export(EXPORT_PATH)
+
+
+def _noop(*args, **kwargs):
+    pass
+
+
+def timed(name):
+    """Decorator recording each call's duration under `name` (identity when disabled)."""
+    def decorate(fn):
+        if not ENABLED:
+            return fn
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                if hasattr(_current, 'calls'):
+                    _current.calls[name].append((time.perf_counter() - start) * 1e3)
+        return wrapper
+    return decorate
+
+
+if ENABLED:
+    start_rerun, lap, count, end_rerun = _start_rerun, _lap, _count, _end_rerun
+else:
+    start_rerun = lap = count = end_rerun = _noop
+
+
+def snapshot():
+    return registry.snapshot()
+
+
+def export(path):
+    """Writes the current snapshot to `path` as JSON (atomically replaced)."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as fh:
+        json.dump(snapshot(), fh, indent=2)
+    os.replace(tmp_path, path)
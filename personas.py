@@ -0,0 +1,190 @@
+"""
+Digital persona assignment (Casual Scroller, Night Owl, Deep Diver).
+
+Shared by the Your Personas page and batch scoring so both assign personas
+the same way. With a fitted centroid model (persona_centroids.json) a profile
+gets the persona of its nearest KMeans centroid over the notebook's risk
+features: usage, sleep risk (8 - sleep), toxicity (mean z-score of addiction
+and conflicts) and mental-health risk (10 - mental). Assignment is a few
+array operations on the saved scaler and centroids, for one profile or a
+whole cohort, and never calls the risk model. Without the file, the built-in
+prototype centroids (PERSONA_PROTOTYPES) are used the same way.
+
+Fit the centroids on the cohort export with:
+
+    python personas.py "Students Social Media Addiction.csv"
+"""
+import argparse
+import json
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+from scoring import heuristic_scores
+
+PERSONAS = ["Casual", "NightOwl", "DeepDiver"]
+
+PERSONA_NAMES = {
+    "Casual": "Casual Scroller",
+    "NightOwl": "Night Owl",
+    "DeepDiver": "Deep Diver",
+}
+
+
+# ====================== CENTROID MODEL ======================
+PERSONA_MODEL_PATH = 'persona_centroids.json'
+PERSONA_MODEL_VERSION = 1
+CENTROID_FEATURES = ['avg_daily_usage_hours', 'sleep_risk_factor', 'toxicity_score', 'mental_health_risk_factor']
+
+# Built-in centroids when no fitted model exists: (usage h, sleep h, mental 1-10, conflicts 0-5, addicted 1-10)
+PERSONA_PROTOTYPES = {
+    "Casual": (3.0, 8.0, 8, 1, 4),
+    "NightOwl": (5.0, 7.0, 6, 3, 7),
+    "DeepDiver": (7.5, 5.5, 4, 4, 9),
+}
+
+
+def _toxicity(conflicts, addicted, toxicity_scaler):
+    """Notebook toxicity_score: mean of the standardized addiction and conflicts scores."""
+    addicted_z = (addicted - toxicity_scaler['addicted_mean']) / toxicity_scaler['addicted_std']
+    conflicts_z = (conflicts - toxicity_scaler['conflicts_mean']) / toxicity_scaler['conflicts_std']
+    return (addicted_z + conflicts_z) / 2
+
+
+def centroid_features(usage, sleep, mental, conflicts, addicted, toxicity_scaler):
+    """(n, 4) array of CENTROID_FEATURES; conflicts are 0-5, addicted is a 1-10 score."""
+    usage, sleep, mental, conflicts, addicted = (np.atleast_1d(np.asarray(v, dtype=float))
+                                                 for v in (usage, sleep, mental, conflicts, addicted))
+    return np.column_stack([usage, 8 - sleep, _toxicity(conflicts, addicted, toxicity_scaler), 10 - mental])
+
+
+def addiction_stand_in(usage, sleep, mental, stress):
+    """
+    1-10 stand-in for the addiction score, which the app does not ask for:
+    the app's heuristic risk formula over the form inputs (no model call).
+    """
+    return np.clip(heuristic_scores(usage, sleep, mental, stress), 1, 10)
+
+
+def prototype_persona_model():
+    """Centroid model over PERSONA_PROTOTYPES, scaled by the prototypes' own spread."""
+    usage, sleep, mental, conflicts, addicted = (np.array(column, dtype=float)
+                                                 for column in zip(*(PERSONA_PROTOTYPES[p] for p in PERSONAS)))
+    toxicity_scaler = {
+        'addicted_mean': float(addicted.mean()), 'addicted_std': float(addicted.std()),
+        'conflicts_mean': float(conflicts.mean()), 'conflicts_std': float(conflicts.std()),
+    }
+    features = centroid_features(usage, sleep, mental, conflicts, addicted, toxicity_scaler)
+    mean, scale = features.mean(axis=0), features.std(axis=0)
+    return {
+        'version': PERSONA_MODEL_VERSION,
+        'features': CENTROID_FEATURES,
+        'toxicity_scaler': toxicity_scaler,
+        'mean': mean,
+        'scale': scale,
+        'centroids': (features - mean) / scale,
+        'personas': PERSONAS,
+    }
+
+
+def fit_persona_model(usage, sleep, mental, conflicts, addicted, random_state=42):
+    """
+    Fits the notebook's scaling and a 3-centroid KMeans on cohort arrays.
+    Centroids are ordered by overall risk (sum of standardized coordinates) and
+    labelled Casual, NightOwl, DeepDiver in that order.
+    """
+    from sklearn.cluster import KMeans
+
+    conflicts = np.asarray(conflicts, dtype=float)
+    addicted = np.asarray(addicted, dtype=float)
+    toxicity_scaler = {
+        'addicted_mean': float(addicted.mean()), 'addicted_std': float(addicted.std()) or 1.0,
+        'conflicts_mean': float(conflicts.mean()), 'conflicts_std': float(conflicts.std()) or 1.0,
+    }
+    features = centroid_features(usage, sleep, mental, conflicts, addicted, toxicity_scaler)
+    mean, scale = features.mean(axis=0), features.std(axis=0)
+    scale[scale == 0] = 1.0
+
+    kmeans = KMeans(n_clusters=len(PERSONAS), random_state=random_state, n_init=10)
+    kmeans.fit((features - mean) / scale)
+    centroids = kmeans.cluster_centers_[np.argsort(kmeans.cluster_centers_.sum(axis=1))]
+    return {
+        'version': PERSONA_MODEL_VERSION,
+        'features': CENTROID_FEATURES,
+        'toxicity_scaler': toxicity_scaler,
+        'mean': mean.tolist(),
+        'scale': scale.tolist(),
+        'centroids': centroids.tolist(),
+        'personas': PERSONAS,
+    }
+
+
+def save_persona_model(persona_model, path=PERSONA_MODEL_PATH):
+    with open(path, 'w') as fh:
+        json.dump(persona_model, fh, indent=2)
+
+
+def load_persona_model(path=PERSONA_MODEL_PATH):
+    """
+    Loads a saved centroid model (arrays as NumPy); the prototype model if the
+    file is missing or from another version.
+    """
+    if not os.path.exists(path):
+        return prototype_persona_model()
+    with open(path) as fh:
+        persona_model = json.load(fh)
+    if persona_model.get('version') != PERSONA_MODEL_VERSION or persona_model.get('features') != CENTROID_FEATURES:
+        return prototype_persona_model()
+    for key in ('mean', 'scale', 'centroids'):
+        persona_model[key] = np.asarray(persona_model[key], dtype=float)
+    return persona_model
+
+
+def nearest_personas(persona_model, usage, sleep, mental, conflicts, addicted):
+    """Vectorized nearest-centroid persona for one profile or arrays of profiles."""
+    features = centroid_features(usage, sleep, mental, conflicts, addicted, persona_model['toxicity_scaler'])
+    scaled = (features - np.asarray(persona_model['mean'])) / np.asarray(persona_model['scale'])
+    centroids = np.asarray(persona_model['centroids'])
+    distances = ((scaled[:, None, :] - centroids[None, :, :]) ** 2).sum(axis=2)
+    return np.asarray(persona_model['personas'], dtype=object)[distances.argmin(axis=1)]
+
+
+def persona_for_profile(persona_model, usage, sleep, mental, stress):
+    """Nearest-centroid persona for one app profile (stress 1-10; addiction from addiction_stand_in)."""
+    return nearest_personas(persona_model, usage, sleep, mental, stress / 2.0,
+                            addiction_stand_in(usage, sleep, mental, stress))[0]
+
+
+def persona_profiles(persona_model):
+    """Typical usage, sleep and mental-health score of each persona's centroid, in original units."""
+    features = np.asarray(persona_model['centroids']) * persona_model['scale'] + persona_model['mean']
+    return {persona: {'usage': float(row[0]), 'sleep': float(8 - row[1]), 'mental': float(10 - row[3])}
+            for persona, row in zip(persona_model['personas'], features)}
+
+
+def main():
+    from cohort import COHORT_CSV_PATH
+
+    parser = argparse.ArgumentParser(description="Fit the persona centroid model on the cohort export.")
+    parser.add_argument('csv', nargs='?', default=COHORT_CSV_PATH, help="Cohort CSV export")
+    parser.add_argument('--output', default=PERSONA_MODEL_PATH, help="Where to write the centroid model")
+    args = parser.parse_args()
+
+    columns = ['Avg_Daily_Usage_Hours', 'Sleep_Hours_Per_Night', 'Mental_Health_Score',
+               'Conflicts_Over_Social_Media', 'Addicted_Score']
+    try:
+        cohort = pd.read_csv(args.csv, usecols=columns).dropna()
+    except (OSError, ValueError) as e:
+        sys.exit(str(e))
+    persona_model = fit_persona_model(*(cohort[col].to_numpy() for col in columns))
+    save_persona_model(persona_model, args.output)
+    counts = pd.Series(nearest_personas(persona_model, *(cohort[col].to_numpy() for col in columns))).value_counts()
+    print(f"Wrote {args.output} from {len(cohort):,} students: "
+          + ", ".join(f"{PERSONA_NAMES[p]} {counts.get(p, 0):,}" for p in PERSONAS))
+
+
+if __name__ == '__main__':
+    main()
+
@@ -0,0 +1,75 @@
+"""
+Wellness plan rules used by the Recommendations page and batch scoring.
+
+Thresholds come from the notebook findings: > 4.0 h usage is moderate risk,
+< 7.0 h sleep is below optimal and a mental health score < 7 is moderate/high risk.
+"""
+import numpy as np
+
+USAGE_THRESHOLD = 4.0
+SLEEP_THRESHOLD = 7.0
+MENTAL_THRESHOLD = 7
+
+
+def build_recommendations(usage, sleep, mental):
+    """Returns the list of recommendation dicts (title, detail, color) for one profile."""
+    recommendations_list = []
+
+    # 1. USAGE RECOMMENDATION (Threshold: > 4.0 hours is moderate risk)
+    if usage >= USAGE_THRESHOLD:
+        target_usage = max(3.5, usage - 1.0)
+        recommendations_list.append({
+            'title': f"📉 Reduce Daily Usage to {target_usage:.1f} Hours",
+            'detail': f"Your current usage of {usage:.1f} hours is high. Focus on reducing time spent on high-addiction platforms like WhatsApp and Snapchat.",
+            'color': '#4318FF'
+        })
+
+    # 2. SLEEP RECOMMENDATION (Threshold: < 7.0 hours is below optimal)
+    if sleep < SLEEP_THRESHOLD:
+        target_sleep = min(7.5, sleep + 0.5)
+        recommendations_list.append({
+            'title': f"💤 Increase Sleep to {target_sleep:.1f} Hours/Night",
+            'detail': f"Low sleep hours ({sleep:.1f}h) is a major risk factor. Implement a strict digital curfew (e.g., 11 PM) to improve rest.",
+            'color': '#5A7DFF'
+        })
+
+    # 3. MENTAL HEALTH RECOMMENDATION (Threshold: < 7 is moderate/high risk)
+    if mental < MENTAL_THRESHOLD:
+        recommendations_list.append({
+            'title': f"🧠 Prioritize Mental Wellness (Target Score: 7+)",
+            'detail': f"Your Mental Health Score ({mental}/10) is a top predictor of addiction. Seek non-digital coping strategies for stress/anxiety.",
+            'color': '#00D2AA'
+        })
+
+    return recommendations_list
+
+
+def _format_hours(values, template):
+    """Formats hour targets via their unique values (targets repeat heavily across a cohort)."""
+    unique, inverse = np.unique(values, return_inverse=True)
+    labels = np.array([template.format(value) for value in unique], dtype=object)
+    return labels[inverse.reshape(-1)]
+
+
+def recommendation_summaries(usage, sleep, mental, separator=" | "):
+    """
+    Column-wise version of build_recommendations for batch output.
+    Returns one string per profile joining the recommendation titles (without emoji).
+    """
+    usage = np.asarray(usage, dtype=float)
+    sleep = np.asarray(sleep, dtype=float)
+    mental = np.asarray(mental, dtype=float)
+
+    parts = [
+        np.where(usage >= USAGE_THRESHOLD,
+                 _format_hours(np.maximum(3.5, usage - 1.0), "Reduce Daily Usage to {:.1f} Hours"), ""),
+        np.where(sleep < SLEEP_THRESHOLD,
+                 _format_hours(np.minimum(7.5, sleep + 0.5), "Increase Sleep to {:.1f} Hours/Night"), ""),
+        np.where(mental < MENTAL_THRESHOLD, "Prioritize Mental Wellness (Target Score: 7+)", ""),
+    ]
+    summary = parts[0].astype(object)
+    for part in parts[1:]:
+        part = part.astype(object)
+        both = (summary != "") & (part != "")
+        summary = np.where(both, summary + separator + part, summary + part)
+    return summary
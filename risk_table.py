@@ -0,0 +1,169 @@
+"""
+Precomputed risk lookup table over the discrete slider input space.
+
+Every input the app collects is discrete (0.5 h sliders, integer 1-10 scores,
+an academic level and two checkboxes), so the whole input space can be scored
+once with the loaded model and stored as a compact uint8 array. Serving a
+score is then a single array index; inputs that fall off the grid return None
+so the caller can fall back to live inference.
+
+Build the table next to the model file with:
+
+    python risk_table.py --model random_forest_social_media_model.joblib
+"""
+import argparse
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from model_artifact import load_estimator, load_transformer
+from scoring import DEFAULT_TRANSFORMER, HIGH_RISK_CLASS, predict_risk_scores
+
+RISK_TABLE_PATH = 'risk_table.npy'
+TABLE_VERSION = 1
+
+# Grid axes: (start, stop, step) - covers every slider on Assessment, Your Personas and What-If Simulator
+USAGE_AXIS = (0.0, 12.0, 0.5)
+SLEEP_AXIS = (4.0, 12.0, 0.5)
+MENTAL_AXIS = (1, 10, 1)
+STRESS_AXIS = (1, 10, 1)
+
+
+def academic_representatives(transformer=None):
+    """
+    Only the affects_academic_performance_Yes flag reaches the model, so the
+    academic axis stores that flag. Returns the academic code scored for each
+    flag value under the model's FeatureTransformer: -1 (unknown level, flag 0)
+    and the first high risk level's code (flag 1).
+    """
+    transformer = transformer or DEFAULT_TRANSFORMER
+    high_risk = transformer.high_risk_academic_levels
+    return np.array([-1, transformer.academic_levels.index(high_risk[0]) if high_risk else -1])
+
+
+def _axis_values(axis):
+    start, stop, step = axis
+    return start + step * np.arange(int(round((stop - start) / step)) + 1)
+
+
+def table_shape():
+    """Shape of the table: usage x sleep x mental x stress x academic flag x late_night x fomo."""
+    return (len(_axis_values(USAGE_AXIS)), len(_axis_values(SLEEP_AXIS)),
+            len(_axis_values(MENTAL_AXIS)), len(_axis_values(STRESS_AXIS)), 2, 2, 2)
+
+
+def grid_profiles(transformer=None):
+    """All grid cells as a profile DataFrame, in the table's C order (academic as the transformer's codes)."""
+    axes = [
+        _axis_values(USAGE_AXIS),
+        _axis_values(SLEEP_AXIS),
+        _axis_values(MENTAL_AXIS),
+        _axis_values(STRESS_AXIS),
+        academic_representatives(transformer),
+        np.array([False, True]),
+        np.array([False, True]),
+    ]
+    mesh = np.meshgrid(*[np.arange(len(a)) for a in axes], indexing='ij')
+    columns = ['usage', 'sleep', 'mental', 'stress', 'academic', 'late_night', 'fomo']
+    return pd.DataFrame({col: axis[idx.ravel()] for col, axis, idx in zip(columns, axes, mesh)})
+
+
+def build_risk_table(model, high_risk_index=HIGH_RISK_CLASS, transformer=None):
+    """Scores every grid cell with one batch call (using the model's FeatureTransformer) and returns a uint8 table."""
+    scores = predict_risk_scores(model, grid_profiles(transformer), high_risk_index, transformer)
+    return np.clip(scores, 0, 255).astype(np.uint8).reshape(table_shape())
+
+
+def file_fingerprint(path):
+    """SHA-256 of a file, used to tie a table to the model it was built from."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _grid_metadata():
+    return {
+        'version': TABLE_VERSION,
+        'shape': list(table_shape()),
+        'axes': {'usage': USAGE_AXIS, 'sleep': SLEEP_AXIS, 'mental': MENTAL_AXIS, 'stress': STRESS_AXIS},
+    }
+
+
+def _meta_path(path):
+    return os.path.splitext(path)[0] + '.json'
+
+
+def save_risk_table(table, path, model_fingerprint):
+    """Writes the table (.npy) and a JSON sidecar recording the grid and model fingerprint."""
+    np.save(path, table)
+    meta = dict(_grid_metadata(), model_sha256=model_fingerprint)
+    with open(_meta_path(path), 'w') as fh:
+        json.dump(meta, fh, indent=2)
+
+
+def load_risk_table(path, model_fingerprint):
+    """
+    Memory-maps a saved table. Returns None if it is missing, was built for a
+    different model, or uses a different grid (callers then use live inference).
+    """
+    if not (os.path.exists(path) and os.path.exists(_meta_path(path))):
+        return None
+    with open(_meta_path(path)) as fh:
+        meta = json.load(fh)
+    expected = json.loads(json.dumps(_grid_metadata()))
+    if meta.get('model_sha256') != model_fingerprint or any(meta.get(k) != v for k, v in expected.items()):
+        return None
+    table = np.load(path, mmap_mode='r')
+    if table.shape != table_shape() or table.dtype != np.uint8:
+        return None
+    return table
+
+
+def _axis_index(value, axis):
+    start, stop, step = axis
+    position = (float(value) - start) / step
+    index = int(round(position))
+    if abs(position - index) > 1e-6 or not 0 <= index <= round((stop - start) / step):
+        return None
+    return index
+
+
+def lookup_risk_score(table, usage, sleep, mental, stress, academic, late_night, fomo, transformer=None):
+    """
+    O(1) table lookup, with the academic flag from the FeatureTransformer the
+    table was built with. Returns None when the inputs fall off the grid.
+    """
+    indices = (
+        _axis_index(usage, USAGE_AXIS),
+        _axis_index(sleep, SLEEP_AXIS),
+        _axis_index(mental, MENTAL_AXIS),
+        _axis_index(stress, STRESS_AXIS),
+    )
+    if any(i is None for i in indices):
+        return None
+    academic_flag = int((transformer or DEFAULT_TRANSFORMER).academic_flag(academic))
+    return int(table[indices + (academic_flag, int(bool(late_night)), int(bool(fomo)))])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompute the risk lookup table for a model file.")
+    parser.add_argument('--model', default='random_forest_social_media_model.joblib', help="Model file to score the grid with")
+    parser.add_argument('--output', default=RISK_TABLE_PATH, help="Where to write the .npy table")
+    args = parser.parse_args()
+
+    model, high_risk_index, message = load_estimator(args.model, mmap_mode=None)
+    if model is None:
+        parser.error(f"{message} The app uses the heuristic, so there is nothing to precompute.")
+
+    table = build_risk_table(model, high_risk_index, load_transformer(args.model))
+    save_risk_table(table, args.output, file_fingerprint(args.model))
+    print(f"Wrote {args.output}: {table.size:,} cells ({table.nbytes / 1024:.0f} KB)")
+
+
+if __name__ == '__main__':
+    main()
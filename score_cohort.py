@@ -0,0 +1,188 @@
+"""
+Headless scoring for large cohort exports.
+
+Streams a CSV in the notebook's "Students Social Media Addiction.csv" layout
+in fixed-size chunks, maps each chunk to the seven predict_risk_score inputs
+and scores the chunks in a process pool. Writes risk scores, personas and
+recommendations to CSV or Parquet (by output extension). At most
+2 x workers chunks are in flight, so memory stays bounded however large
+the input is.
+
+    python score_cohort.py "Students Social Media Addiction.csv" scored.parquet --workers 8
+"""
+import argparse
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from cohort import ID_COLUMN, cohort_to_profiles
+from model_artifact import load_estimator, load_transformer
+from personas import PERSONA_MODEL_PATH, addiction_stand_in, load_persona_model, nearest_personas
+from recommendations import recommendation_summaries
+from scoring import HIGH_RISK_CLASS, predict_risk_scores
+
+DEFAULT_CHUNKSIZE = 50000
+
+# Per-worker models, loaded once by the pool initializer
+_worker_model = None
+_worker_high_risk_index = None
+_worker_transformer = None
+_worker_persona_model = None
+
+
+def _init_worker(model_path, persona_model_path=PERSONA_MODEL_PATH):
+    global _worker_model, _worker_high_risk_index, _worker_transformer, _worker_persona_model
+    _worker_model, _worker_high_risk_index, _ = load_estimator(model_path)
+    _worker_transformer = load_transformer(model_path)
+    _worker_persona_model = load_persona_model(persona_model_path)
+
+
+def score_chunk(chunk, late_night_column=None, fomo_column=None, model=None, high_risk_index=HIGH_RISK_CLASS,
+                persona_model=None, transformer=None):
+    """
+    Scores one export chunk and returns the output frame (ids, scores, personas, recommendations).
+    Personas come from the nearest persona centroid, using the export's Addicted_Score
+    when it has one and the app's stand-in from the other inputs otherwise.
+    Rows with a missing or non-numeric input are written with an empty score,
+    persona and recommendation rather than a made-up one.
+    """
+    if model is None and _worker_model is not None:
+        model, high_risk_index, transformer = _worker_model, _worker_high_risk_index, _worker_transformer
+    if persona_model is None:
+        persona_model = _worker_persona_model or load_persona_model()
+
+    profiles = cohort_to_profiles(chunk, late_night_column, fomo_column)
+    if 'Addicted_Score' in chunk.columns:
+        addicted = pd.to_numeric(chunk['Addicted_Score'], errors='coerce').to_numpy(dtype=float)
+    else:
+        addicted = addiction_stand_in(profiles['usage'], profiles['sleep'], profiles['mental'], profiles['stress'])
+    # A NaN input would make every centroid distance NaN and silently pick the first persona
+    complete = np.isfinite(profiles[['usage', 'sleep', 'mental', 'stress']].to_numpy()).all(axis=1) & np.isfinite(addicted)
+    profiles, addicted = profiles[complete], addicted[complete]
+
+    scores = np.full(len(chunk), np.nan)
+    personas = np.full(len(chunk), None, dtype=object)
+    recommendations = np.full(len(chunk), None, dtype=object)
+    if complete.any():
+        scores[complete] = predict_risk_scores(model, profiles, high_risk_index, transformer)
+        personas[complete] = nearest_personas(persona_model, profiles['usage'], profiles['sleep'], profiles['mental'],
+                                              profiles['stress'] / 2.0, addicted)
+        recommendations[complete] = recommendation_summaries(profiles['usage'], profiles['sleep'], profiles['mental'])
+
+    result = pd.DataFrame(index=chunk.index)
+    if ID_COLUMN in chunk.columns:
+        result[ID_COLUMN] = chunk[ID_COLUMN].to_numpy()
+    # Nullable integers, so incomplete rows stay empty instead of becoming a number
+    result['risk_score'] = pd.Series(scores, index=chunk.index).astype('Int64')
+    result['persona'] = personas
+    result['recommendations'] = recommendations
+    return result
+
+
+class _Writer:
+    """Appends result chunks to a CSV or Parquet file."""
+
+    def __init__(self, path):
+        self.path = path
+        self.parquet = path.lower().endswith(('.parquet', '.pq'))
+        self._parquet_writer = None
+        self._first = True
+        if os.path.exists(path):
+            os.remove(path)
+
+    def write(self, frame):
+        if self.parquet:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            if self._parquet_writer is None:
+                self._parquet_writer = pq.ParquetWriter(self.path, table.schema)
+            self._parquet_writer.write_table(table)
+        else:
+            frame.to_csv(self.path, mode='a', header=self._first, index=False)
+        self._first = False
+
+    def close(self):
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+
+
+def _report(rows, started, final=False):
+    elapsed = time.perf_counter() - started
+    rate = rows / elapsed if elapsed > 0 else 0.0
+    end = "\n" if final else "\r"
+    print(f"Scored {rows:,} rows in {elapsed:,.1f}s ({rate:,.0f} rows/s)", end=end, file=sys.stderr, flush=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('input', help="Cohort CSV export")
+    parser.add_argument('output', help="Output .csv or .parquet file")
+    parser.add_argument('--model', default='random_forest_social_media_model.joblib', help="Model artifact to score with")
+    parser.add_argument('--chunksize', type=int, default=DEFAULT_CHUNKSIZE, help="Rows per chunk")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="Scoring processes (1 = no pool)")
+    parser.add_argument('--personas', default=PERSONA_MODEL_PATH,
+                        help="Persona centroid model from personas.py (default: built-in prototypes if the file is missing)")
+    parser.add_argument('--late-night-column', help="Yes/No column for late-night use (default: all No)")
+    parser.add_argument('--fomo-column', help="Yes/No column for FOMO anxiety (default: all No)")
+    args = parser.parse_args(argv)
+
+    model, high_risk_index, message = load_estimator(args.model)
+    if model is None:
+        print(f"Warning: {message} Scoring with the heuristic.", file=sys.stderr)
+    elif message:
+        print(message, file=sys.stderr)
+
+    transformer = load_transformer(args.model)
+    persona_model = load_persona_model(args.personas)
+
+    reader = pd.read_csv(args.input, chunksize=args.chunksize)
+    writer = _Writer(args.output)
+    started = time.perf_counter()
+    rows = skipped = 0
+
+    try:
+        if args.workers <= 1:
+            for chunk in reader:
+                result = score_chunk(chunk, args.late_night_column, args.fomo_column, model, high_risk_index, persona_model,
+                                     transformer)
+                writer.write(result)
+                rows += len(result)
+                skipped += int(result['persona'].isna().sum())
+                _report(rows, started)
+        else:
+            del model  # each worker loads its own copy
+            with ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker, initargs=(args.model, args.personas)) as pool:
+                pending = deque()
+                for chunk in reader:
+                    pending.append(pool.submit(score_chunk, chunk, args.late_night_column, args.fomo_column))
+                    # Bound memory: keep at most 2 chunks per worker in flight, write in input order
+                    while len(pending) >= 2 * args.workers:
+                        result = pending.popleft().result()
+                        writer.write(result)
+                        rows += len(result)
+                        skipped += int(result['persona'].isna().sum())
+                        _report(rows, started)
+                while pending:
+                    result = pending.popleft().result()
+                    writer.write(result)
+                    rows += len(result)
+                    skipped += int(result['persona'].isna().sum())
+                    _report(rows, started)
+    finally:
+        writer.close()
+
+    _report(rows, started, final=True)
+    if skipped:
+        print(f"Left {skipped:,} rows with a missing or non-numeric input unscored", file=sys.stderr)
+    print(f"Wrote {args.output}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
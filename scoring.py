@@ -0,0 +1,288 @@
+"""
+Vectorized risk scoring for the Digital Wellbeing Dashboard.
+
+The feature engineering lives in one place, `FeatureTransformer`: academic
+levels become integer codes and every feature is a whole-column array
+operation, with a scalar fast path for the single profile predict_risk_score
+scores on each rerun. train.py fits on its output and stores its spec in the
+model artifact, so the app, batch jobs and training all build the same inputs.
+It has no Streamlit dependency, so batch jobs and benchmarks can import it.
+"""
+import logging
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+# ====================== FEATURE DEFINITIONS ======================
+# Profile fields, in the same order as the predict_risk_score arguments
+PROFILE_COLUMNS = ['usage', 'sleep', 'mental', 'stress', 'academic', 'late_night', 'fomo']
+
+# Model features - COLUMN ORDER IS CRITICAL (must match predict_risk_score)
+FEATURE_COLUMNS = [
+    'avg_daily_usage_hours',
+    'mental_health_score',
+    'sleep_hours_per_night',
+    'conflicts_over_social_media',
+    'affects_academic_performance_Yes',
+    'late_night_use_Yes',
+    'FOMO_anxiety_Yes',
+]
+
+# Academic levels in the cohort export, in integer-code order; any other value gets code -1
+ACADEMIC_LEVELS = ["High School", "Undergraduate", "Graduate"]
+
+# Academic levels the Assessment form offers
+FORM_ACADEMIC_LEVELS = ["High School", "Undergraduate", "Postgraduate", "PhD"]
+
+# High School/Undergrad are the high risk academic levels (notebook insight)
+HIGH_RISK_ACADEMIC_LEVELS = ["High School", "Undergraduate"]
+
+# User's 1-10 stress is rescaled to the 1-5 conflicts_over_social_media scale
+STRESS_DIVISOR = 2.0
+
+# Assuming High Risk class label is 1 (Positive/High Risk)
+HIGH_RISK_CLASS = 1
+
+
+def _profile_columns(profiles):
+    """
+    Returns a dict of 1-D arrays keyed by PROFILE_COLUMNS.
+
+    Accepts a DataFrame (or dict of columns) with the profile columns, or a
+    2-D array (or list of rows) whose columns follow PROFILE_COLUMNS order.
+    A categorical academic column is kept as a pd.Categorical, so its codes
+    can be remapped without touching the strings.
+    """
+    if isinstance(profiles, (pd.DataFrame, dict)):
+        missing = [col for col in PROFILE_COLUMNS if col not in profiles]
+        if missing:
+            raise ValueError(f"Profiles are missing columns: {missing}")
+        cols = {col: np.asarray(profiles[col]) for col in PROFILE_COLUMNS if col != 'academic'}
+        academic = profiles['academic']
+        if isinstance(getattr(academic, 'dtype', None), pd.CategoricalDtype):
+            cols['academic'] = pd.Categorical(academic)
+        else:
+            cols['academic'] = np.asarray(academic)
+        return {col: cols[col] for col in PROFILE_COLUMNS}
+
+    rows = np.asarray(profiles, dtype=object)
+    if rows.ndim == 1:
+        rows = rows.reshape(1, -1)
+    if rows.ndim != 2 or rows.shape[1] != len(PROFILE_COLUMNS):
+        raise ValueError(f"Expected an (n, {len(PROFILE_COLUMNS)}) array of profiles, got shape {rows.shape}")
+    return {col: rows[:, i] for i, col in enumerate(PROFILE_COLUMNS)}
+
+
+class FeatureTransformer:
+    """
+    Maps profiles to the 7-feature model input (FEATURE_COLUMNS order).
+
+    stress (1-10) -> conflicts (1-5), academic level -> integer code ->
+    affects_academic_performance_Yes through a per-code lookup table,
+    late_night/fomo checkboxes -> 0/1 flags. `transform` handles any number
+    of rows with array operations; `transform_one` builds the single row for
+    predict_risk_score without creating any intermediate arrays. Both return
+    float64 arrays, and both give identical rows for the same profile.
+
+    The transformer is described by a plain dict (`to_dict` / `from_dict`),
+    which the model artifact stores, so serving rebuilds exactly the mapping
+    the model was trained with.
+    """
+
+    SPEC_VERSION = 1
+
+    def __init__(self, academic_levels=ACADEMIC_LEVELS, high_risk_academic_levels=HIGH_RISK_ACADEMIC_LEVELS,
+                 stress_divisor=STRESS_DIVISOR):
+        unknown = sorted(set(high_risk_academic_levels) - set(academic_levels))
+        if unknown:
+            raise ValueError(f"High risk academic levels {unknown} are not in the academic levels {list(academic_levels)}")
+        if not stress_divisor:
+            raise ValueError("stress_divisor must be non-zero")
+        self.academic_levels = list(academic_levels)
+        self.high_risk_academic_levels = list(high_risk_academic_levels)
+        self.stress_divisor = float(stress_divisor)
+        self.feature_columns = list(FEATURE_COLUMNS)
+        self._academic_codes = {level: code for code, level in enumerate(self.academic_levels)}
+        self._academic_index = pd.Index(self.academic_levels)
+        # One entry per code plus a trailing 0.0, which code -1 (unknown level) indexes
+        self._academic_flags = np.array(
+            [float(level in self.high_risk_academic_levels) for level in self.academic_levels] + [0.0])
+
+    def academic_codes(self, academic):
+        """
+        Integer codes (-1 for unknown levels) for an array of academic levels,
+        a pd.Categorical, or an integer array of codes already in this order.
+        Strings are hashed once per distinct value, not once per row.
+        """
+        if isinstance(academic, pd.Categorical):
+            codes, uniques = academic.codes, academic.categories
+        else:
+            values = np.asarray(academic)
+            if values.dtype.kind in 'iu':
+                return np.where((values >= 0) & (values < len(self.academic_levels)), values, -1)
+            codes, uniques = pd.factorize(values)
+        # Trailing -1 is where missing values (code -1) land
+        return np.append(self._academic_index.get_indexer(uniques), -1)[codes]
+
+    def academic_flag(self, academic):
+        """affects_academic_performance_Yes (0.0 or 1.0) for one academic level."""
+        return self._academic_flags[self._academic_codes.get(academic, -1)]
+
+    def transform(self, profiles):
+        """(n, 7) float64 feature array for a DataFrame, dict of columns or (n, 7) array of profiles."""
+        cols = _profile_columns(profiles)
+        # Column-major, so each feature is written as one contiguous column
+        X = np.empty((len(self.feature_columns), len(cols['usage'])), dtype=np.float64).T
+        X[:, 0] = cols['usage']
+        X[:, 1] = cols['mental']
+        X[:, 2] = cols['sleep']
+        np.divide(cols['stress'].astype(np.float64), self.stress_divisor, out=X[:, 3])
+        X[:, 4] = self._academic_flags[self.academic_codes(cols['academic'])]
+        X[:, 5] = cols['late_night'].astype(bool)
+        X[:, 6] = cols['fomo'].astype(bool)
+        return X
+
+    def transform_one(self, usage, sleep, mental, stress, academic, late_night, fomo):
+        """(1, 7) float64 feature array for one profile given as predict_risk_score arguments."""
+        return np.array([[
+            usage,
+            mental,
+            sleep,
+            stress / self.stress_divisor,
+            self.academic_flag(academic),
+            1.0 if late_night else 0.0,
+            1.0 if fomo else 0.0,
+        ]], dtype=np.float64)
+
+    def frame(self, X):
+        """Wraps a transform result in a DataFrame with the feature names (for estimators fitted on DataFrames)."""
+        return pd.DataFrame(X, columns=self.feature_columns)
+
+    def to_dict(self):
+        """Plain-data description of the transformer, stored in the model artifact."""
+        return {
+            'version': self.SPEC_VERSION,
+            'feature_columns': list(self.feature_columns),
+            'academic_levels': list(self.academic_levels),
+            'high_risk_academic_levels': list(self.high_risk_academic_levels),
+            'stress_divisor': self.stress_divisor,
+        }
+
+    @classmethod
+    def from_dict(cls, spec):
+        """Rebuilds a transformer from `to_dict` output; raises ValueError if this code cannot reproduce it."""
+        if not isinstance(spec, dict) or spec.get('version') != cls.SPEC_VERSION:
+            raise ValueError(f"Unsupported feature transformer spec {spec!r:.80}")
+        if list(spec.get('feature_columns') or []) != FEATURE_COLUMNS:
+            raise ValueError(f"Transformer features {spec.get('feature_columns')} do not match {FEATURE_COLUMNS}")
+        try:
+            return cls(spec['academic_levels'], spec['high_risk_academic_levels'], spec['stress_divisor'])
+        except KeyError as e:
+            raise ValueError(f"Feature transformer spec is missing {e}") from e
+
+    def __repr__(self):
+        return (f"FeatureTransformer(academic_levels={self.academic_levels}, "
+                f"high_risk_academic_levels={self.high_risk_academic_levels}, stress_divisor={self.stress_divisor})")
+
+
+# The mapping the app has always used; artifacts without a stored spec are served with it
+DEFAULT_TRANSFORMER = FeatureTransformer()
+
+
+def model_input(model, X, transformer=DEFAULT_TRANSFORMER):
+    """Transform output as the model wants it: named columns for estimators fitted on a DataFrame, else the array."""
+    return transformer.frame(X) if hasattr(model, 'feature_names_in_') else X
+
+
+def engineer_features(profiles, transformer=DEFAULT_TRANSFORMER):
+    """
+    Builds the 7-feature model input for many profiles at once, as a DataFrame
+    in FEATURE_COLUMNS order (see FeatureTransformer for the mapping).
+    """
+    return transformer.frame(transformer.transform(profiles))
+
+
+def heuristic_scores(usage, sleep, mental, stress):
+    """
+    Vectorized form of the original heuristic used when the model is unavailable.
+    Truncates like int() so results match the scalar fallback row for row; the
+    result is float, with NaN for rows that have a missing input.
+    """
+    usage = np.asarray(usage, dtype=float)
+    sleep = np.asarray(sleep, dtype=float)
+    mental = np.asarray(mental, dtype=float)
+    stress = np.asarray(stress, dtype=float)
+    raw = (usage * 1.8 + (12 - sleep) * 1.2 + (10 - mental) * 0.8 + stress * 0.7) / 4.5
+    return np.trunc(raw)
+
+
+def probabilities_to_scores(proba):
+    """Scales High Risk probabilities (0.0 to 1.0) to 1-10 risk scores, rounding up."""
+    scores = np.ceil(np.asarray(proba, dtype=float) * 10).astype(np.int64)
+    return np.clip(scores, 1, 10)
+
+
+def _high_risk_proba(model, X, high_risk_index, transformer):
+    """
+    High Risk probability for every row of X, NaN where the model fails or
+    returns a non-finite value. If the batch call fails, rows are retried one
+    at a time so only the rows that cause the failure lose their score.
+    """
+    try:
+        proba = np.asarray(model.predict_proba(model_input(model, X, transformer))[:, high_risk_index], dtype=float)
+    except Exception:
+        if len(X) == 1:
+            return np.full(1, np.nan)
+        logger.warning("Batch prediction failed; retrying %d rows one at a time", len(X), exc_info=True)
+        return np.concatenate([_high_risk_proba(model, X[i:i + 1], high_risk_index, transformer)
+                               for i in range(len(X))])
+    proba[~np.isfinite(proba)] = np.nan
+    return proba
+
+
+def predict_risk_scores(model, profiles, high_risk_index=HIGH_RISK_CLASS, transformer=None):
+    """
+    Predicts 1-10 risk scores for a batch of profiles with one predict_proba call.
+
+    `profiles` is a DataFrame with PROFILE_COLUMNS or an (n, 7) array in that
+    order; `high_risk_index` is the predict_proba column of the High Risk class;
+    `transformer` is the model's FeatureTransformer (default: DEFAULT_TRANSFORMER).
+    Returns a float array of whole scores. Rows the model cannot score fall
+    back to the heuristic, like predict_risk_score does (every row when there
+    is no model); rows with a missing or non-numeric usage, sleep, mental or
+    stress value cannot be scored at all and get NaN. Both are logged.
+    """
+    cols = _profile_columns(profiles)
+    for col in ('usage', 'sleep', 'mental', 'stress'):
+        cols[col] = pd.to_numeric(cols[col], errors='coerce').astype(np.float64)
+    n = len(cols['usage'])
+    scores = np.full(n, np.nan)
+    if n == 0:
+        return scores
+
+    complete = np.isfinite(np.column_stack([cols['usage'], cols['sleep'], cols['mental'], cols['stress']])).all(axis=1)
+    if not complete.all():
+        logger.warning("%d of %d profiles have a missing or non-numeric input and were not scored",
+                       n - complete.sum(), n)
+
+    if model is not None and complete.any():
+        transformer = transformer or DEFAULT_TRANSFORMER
+        try:
+            X = transformer.transform(cols)[complete]
+        except Exception:
+            logger.exception("Could not build model features; scoring %d profiles with the heuristic", complete.sum())
+        else:
+            proba = _high_risk_proba(model, X, high_risk_index, transformer)
+            scored = np.isfinite(proba)
+            scores[np.flatnonzero(complete)[scored]] = probabilities_to_scores(proba[scored])
+            if not scored.all():
+                logger.warning("Model could not score %d of %d profiles; using the heuristic for them",
+                               len(scored) - scored.sum(), n)
+
+    fallback = complete & np.isnan(scores)
+    scores[fallback] = heuristic_scores(cols['usage'][fallback], cols['sleep'][fallback],
+                                        cols['mental'][fallback], cols['stress'][fallback])
+    return scores
@@ -0,0 +1,304 @@
+"""
+Micro-batching risk scoring service shared by concurrent sessions.
+
+Every Streamlit session runs its script on its own thread, and each
+predict_risk_score call pays the full fixed cost of one predict_proba. The
+service collects the requests that arrive within `max_wait` seconds of each
+other (up to `max_batch`) and scores them with one predict_risk_scores call,
+so under load many sessions share one model call.
+
+Two deployments:
+
+- in process: `InProcessScoringService` runs the batcher on an asyncio event
+  loop in a daemon thread and scores with the model the caller provides;
+- separate process: `python scoring_service.py --socket /tmp/risk.sock` loads
+  one model and serves every Streamlit process on the machine over a Unix
+  socket (newline-delimited JSON); `UnixSocketScoringClient` talks to it.
+
+serving.py routes predict_risk_score through either when SCORING_SERVICE is
+set ('inprocess' or 'unix:/path/to.sock').
+"""
+import argparse
+import asyncio
+import concurrent.futures
+import json
+import math
+import os
+import socket
+import sys
+import threading
+
+import numpy as np
+
+from scoring import ACADEMIC_LEVELS, FORM_ACADEMIC_LEVELS, HIGH_RISK_CLASS, PROFILE_COLUMNS, predict_risk_scores
+
+DEFAULT_MAX_BATCH = 64
+DEFAULT_MAX_WAIT = 0.002
+REQUEST_TIMEOUT = 5.0
+# Academic levels a request may name: the Assessment form's and the cohort export's
+KNOWN_ACADEMIC_LEVELS = sorted(set(FORM_ACADEMIC_LEVELS) | set(ACADEMIC_LEVELS))
+
+
+def _check_row(row):
+    """
+    Converts and validates a request before it is queued, so a malformed row is
+    rejected on its own instead of failing the batch it would have joined.
+    Returns the row as (4 floats, academic level, 2 bools).
+    """
+    row = tuple(row)
+    if len(row) != len(PROFILE_COLUMNS):
+        raise ValueError(f"Expected a profile with {len(PROFILE_COLUMNS)} fields {PROFILE_COLUMNS}, got {len(row)}")
+
+    numbers = []
+    for name, value in zip(PROFILE_COLUMNS[:4], row[:4]):
+        if isinstance(value, (bool, np.bool_)) or not isinstance(value, (int, float, np.integer, np.floating)):
+            raise ValueError(f"{name} must be a number, got {value!r}")
+        if not math.isfinite(value):
+            raise ValueError(f"{name} must be finite, got {value!r}")
+        numbers.append(float(value))
+
+    academic = row[4]
+    if not isinstance(academic, str) or academic.strip() not in KNOWN_ACADEMIC_LEVELS:
+        raise ValueError(f"academic must be one of {KNOWN_ACADEMIC_LEVELS}, got {academic!r}")
+
+    flags = []
+    for name, value in zip(PROFILE_COLUMNS[5:], row[5:]):
+        if not isinstance(value, (bool, np.bool_)) and value not in (0, 1):
+            raise ValueError(f"{name} must be a boolean, got {value!r}")
+        flags.append(bool(value))
+    return (*numbers, academic.strip(), *flags)
+
+
+def batch_scorer(get_model, get_transformer=None):
+    """
+    score_batch function over rows in PROFILE_COLUMNS order; get_model() returns
+    (model, high_risk_index) and get_transformer() the model's FeatureTransformer.
+    """
+    def score_batch(rows):
+        model, high_risk_index = get_model()
+        transformer = get_transformer() if get_transformer is not None else None
+        return predict_risk_scores(model, np.array(rows, dtype=object), high_risk_index, transformer)
+    return score_batch
+
+
+def _resolve(future, score=None, error=None):
+    """Completes a request's future with its score or error (skipped if the caller already gave up)."""
+    if future.done():
+        return
+    if error is None and not math.isfinite(score):
+        error = ValueError("Profile could not be scored")
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(int(score))
+
+
+class MicroBatcher:
+    """
+    Collects scoring requests on an asyncio loop and answers each micro-batch
+    with one score_batch call. The first request of a batch waits at most
+    max_wait for company; a full batch is scored immediately.
+    """
+
+    def __init__(self, score_batch, max_batch=DEFAULT_MAX_BATCH, max_wait=DEFAULT_MAX_WAIT):
+        self.score_batch = score_batch
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.batches = 0
+        self.requests = 0
+        self._queue = None
+
+    async def run(self):
+        """Batching loop; runs until cancelled."""
+        self._queue = asyncio.Queue()
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                if self._queue.empty():
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+                else:
+                    batch.append(self._queue.get_nowait())
+            self._score(batch)
+
+    def _score(self, batch):
+        self.batches += 1
+        self.requests += len(batch)
+        try:
+            scores = self.score_batch([row for row, _ in batch])
+        except Exception as e:
+            if len(batch) == 1:
+                _resolve(batch[0][1], error=e)
+                return
+            # Score each row on its own, so the error only reaches the request that caused it
+            for row, future in batch:
+                try:
+                    score = self.score_batch([row])[0]
+                except Exception as e:
+                    _resolve(future, error=e)
+                else:
+                    _resolve(future, score)
+            return
+        for (_, future), score in zip(batch, scores):
+            _resolve(future, score)
+
+    def put(self, row, future):
+        """Queues a checked request (call on the loop thread); `future` receives the score."""
+        self._queue.put_nowait((row, future))
+
+    async def score(self, row):
+        """Awaitable score for one row, from a coroutine on the batcher's loop."""
+        future = asyncio.get_running_loop().create_future()
+        self.put(_check_row(row), future)
+        return await future
+
+
+class InProcessScoringService:
+    """MicroBatcher on a background event loop, callable from any thread."""
+
+    def __init__(self, score_batch, max_batch=DEFAULT_MAX_BATCH, max_wait=DEFAULT_MAX_WAIT):
+        self.batcher = MicroBatcher(score_batch, max_batch, max_wait)
+        self._loop = asyncio.new_event_loop()
+        started = threading.Event()
+
+        def run_loop():
+            asyncio.set_event_loop(self._loop)
+            self._task = self._loop.create_task(self.batcher.run())
+            self._loop.call_soon(started.set)
+            self._loop.run_forever()
+
+        self._thread = threading.Thread(target=run_loop, name='scoring-service', daemon=True)
+        self._thread.start()
+        started.wait()
+
+    def score(self, row, timeout=REQUEST_TIMEOUT):
+        """Risk score for one row in PROFILE_COLUMNS order; blocks the calling thread until its batch is scored."""
+        future = concurrent.futures.Future()
+        self._loop.call_soon_threadsafe(self.batcher.put, _check_row(row), future)
+        return future.result(timeout)
+
+    def close(self):
+        """Stops the batching loop and its thread; requests still queued time out."""
+        async def stop():
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._loop.stop()
+
+        asyncio.run_coroutine_threadsafe(stop(), self._loop)
+        self._thread.join()
+        self._loop.close()
+
+
+# ====================== UNIX SOCKET SERVER / CLIENT ======================
+async def _handle_client(batcher, reader, writer):
+    """One connection: each line is {"profile": [...]}, answered in order with {"score": n} or {"error": "..."}."""
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            try:
+                response = {'score': await batcher.score(json.loads(line)['profile'])}
+            except Exception as e:
+                response = {'error': f"{type(e).__name__}: {e}"}
+            writer.write(json.dumps(response).encode('utf-8') + b'\n')
+            await writer.drain()
+    finally:
+        writer.close()
+
+
+async def serve_unix(path, batcher):
+    """Serves the batcher on a Unix socket until cancelled."""
+    if os.path.exists(path):
+        os.remove(path)
+    server = await asyncio.start_unix_server(lambda r, w: _handle_client(batcher, r, w), path=path)
+    batch_task = asyncio.create_task(batcher.run())
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        batch_task.cancel()
+
+
+class UnixSocketScoringClient:
+    """Client for `scoring_service.py --socket`; one connection per calling thread."""
+
+    def __init__(self, path, timeout=REQUEST_TIMEOUT):
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            sock.connect(self.path)
+            conn = self._local.conn = (sock, sock.makefile('rb'))
+        return conn
+
+    def _reset(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn[1].close()
+            conn[0].close()
+        self._local.conn = None
+
+    def score(self, row):
+        """Risk score for one row in PROFILE_COLUMNS order (reconnects once if the connection dropped)."""
+        request = json.dumps({'profile': [v.item() if isinstance(v, np.generic) else v for v in row]}).encode('utf-8') + b'\n'
+        for attempt in range(2):
+            try:
+                sock, stream = self._connection()
+                sock.sendall(request)
+                line = stream.readline()
+                if not line:
+                    raise ConnectionError("Scoring service closed the connection")
+                break
+            except OSError:
+                self._reset()
+                if attempt:
+                    raise
+        response = json.loads(line)
+        if 'error' in response:
+            raise RuntimeError(response['error'])
+        return response['score']
+
+
+def main():
+    from forest_compiler import load_shared_forest
+    from model_artifact import load_estimator, load_transformer
+
+    parser = argparse.ArgumentParser(description="Serve micro-batched risk scores over a Unix socket.")
+    parser.add_argument('--socket', required=True, help="Unix socket path to listen on")
+    parser.add_argument('--model', default='random_forest_social_media_model.joblib', help="Model file to serve")
+    parser.add_argument('--engine', choices=['compiled', 'sklearn'], default=os.environ.get('SERVING_ENGINE', 'compiled'))
+    parser.add_argument('--max-batch', type=int, default=DEFAULT_MAX_BATCH, help="Most requests per model call")
+    parser.add_argument('--max-wait-ms', type=float, default=DEFAULT_MAX_WAIT * 1e3,
+                        help="Longest a request waits for others to share its batch")
+    args = parser.parse_args()
+
+    model, high_risk_index, status = (load_shared_forest if args.engine == 'compiled' else load_estimator)(args.model)
+    if model is None:
+        print(f"Warning: {status} Serving heuristic scores.", file=sys.stderr)
+        high_risk_index = HIGH_RISK_CLASS
+
+    transformer = load_transformer(args.model)
+    batcher = MicroBatcher(batch_scorer(lambda: (model, high_risk_index), lambda: transformer),
+                           args.max_batch, args.max_wait_ms / 1e3)
+    print(f"Scoring service listening on {args.socket}", file=sys.stderr)
+    try:
+        asyncio.run(serve_unix(args.socket, batcher))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
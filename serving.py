@@ -0,0 +1,243 @@
+"""
+Model loading and single-profile risk scoring for the Streamlit pages.
+
+app.py calls `init()` at the top of every rerun; it fills the module globals
+from the st.cache_resource loaders, so page modules under views/ can import
+`predict_risk_score` without reloading anything.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+import perf
+from forest_compiler import COMPILED_FOREST_DIR, CompiledForest, load_shared_forest
+from habit_optimizer import find_minimal_changes
+from model_artifact import load_estimator, load_transformer
+from risk_table import RISK_TABLE_PATH, file_fingerprint, load_risk_table, lookup_risk_score
+from scoring import DEFAULT_TRANSFORMER, HIGH_RISK_CLASS, FeatureTransformer, model_input, predict_risk_scores
+from scoring_service import InProcessScoringService, UnixSocketScoringClient, batch_scorer
+
+# ====================== 10. MODEL LOADING AND PREDICTION FUNCTION ======================
+MODEL_PATH = 'random_forest_social_media_model.joblib'
+# HIGH_RISK_CLASS (label 1) is only assumed for legacy containers; versioned artifacts carry their class mapping
+# Serving engine: 'compiled' (flat NumPy forest, see forest_compiler.py) or 'sklearn' (estimator.predict_proba)
+SERVING_ENGINE = os.environ.get('SERVING_ENGINE', 'compiled')
+# Micro-batching scoring service (see scoring_service.py): '' (score inline), 'inprocess' or 'unix:/path/to.sock'
+SCORING_SERVICE = os.environ.get('SCORING_SERVICE', '')
+
+# Filled by init() on every rerun
+model = None
+HIGH_RISK_INDEX = HIGH_RISK_CLASS
+model_status = None
+feature_transformer = DEFAULT_TRANSFORMER
+risk_lookup = None
+
+@st.cache_resource
+def load_model(path, engine=SERVING_ENGINE, compiled_dir=COMPILED_FOREST_DIR):
+    """
+    Loads the risk model and returns (model, high_risk_index, status).
+
+    Versioned artifacts (see model_artifact.py) are validated against the features
+    predict_risk_score builds and memory-mapped on load. Legacy containers (Series
+    keyed 'Model', dict keyed 'model', bare estimator) are still accepted.
+    model is None in degraded mode, and status explains why predictions use the heuristic.
+    With engine='compiled' the forest is flattened into NumPy arrays, which match
+    predict_proba exactly but skip pandas/scikit-learn overhead on every call.
+    The arrays are memory-mapped from `compiled_dir`, so every worker process on
+    the machine shares one copy of them.
+    """
+    if not os.path.exists(path):
+        return None, HIGH_RISK_CLASS, f"Model file not found at: {path}. Please ensure 'random_forest_social_media_model.joblib' is in the same directory."
+    if engine == 'compiled':
+        return load_shared_forest(path, compiled_dir)
+    return load_estimator(path)
+
+@st.cache_resource
+def load_feature_transformer(path):
+    """
+    The FeatureTransformer the loaded model was trained with (see scoring.py).
+    A compiled forest carries its spec in the export metadata, so the model
+    file is only read again for the scikit-learn engine or older exports.
+    """
+    spec = model.metadata.get('feature_transformer') if isinstance(model, CompiledForest) else None
+    if spec is not None:
+        try:
+            return FeatureTransformer.from_dict(spec)
+        except ValueError:
+            pass
+    if model is None or not os.path.exists(path):
+        return DEFAULT_TRANSFORMER
+    return load_transformer(path)
+
+@st.cache_resource
+def load_risk_lookup(table_path, model_path):
+    """
+    Memory-maps the precomputed risk table (built with `python risk_table.py`).
+    Returns None if there is no model, no table, or the table was built for a different model file.
+    """
+    if model is None or not os.path.exists(model_path):
+        return None
+    return load_risk_table(table_path, file_fingerprint(model_path))
+
+@st.cache_resource
+def scoring_service(spec):
+    """
+    One scoring service per process for `spec` (see SCORING_SERVICE), or None.
+    The in-process service scores each micro-batch with whatever model init() loaded last.
+    """
+    if spec == 'inprocess':
+        return InProcessScoringService(batch_scorer(lambda: (model, HIGH_RISK_INDEX), lambda: feature_transformer))
+    if spec.startswith('unix:'):
+        return UnixSocketScoringClient(spec[len('unix:'):])
+    return None
+
+def init():
+    """Loads the cached model, its feature transformer and the risk table into the module globals; returns (model, status)."""
+    global model, HIGH_RISK_INDEX, model_status, feature_transformer, risk_lookup
+    model, HIGH_RISK_INDEX, model_status = load_model(MODEL_PATH)
+    feature_transformer = load_feature_transformer(MODEL_PATH)
+    risk_lookup = load_risk_lookup(RISK_TABLE_PATH, MODEL_PATH)
+    return model, model_status
+
+@perf.timed('predict_risk_score')
+def predict_risk_score(usage, sleep, mental, stress, academic, late_night, fomo):
+    """
+    Predicts a 1-10 risk score using the Random Forest model's probability.
+
+    Features assumed (7 total, based on notebook top 5 and available inputs):
+    1. avg_daily_usage_hours (float) -> usage
+    2. mental_health_score (int) -> mental
+    3. sleep_hours_per_night (float) -> sleep
+    4. conflicts_over_social_media (float, normalized stress) -> stress (1-10) -> (1-5)
+    5. affects_academic_performance_Yes (binary) -> 1 if High School or Undergraduate
+    6. late_night_use_Yes (binary) -> from late_night checkbox
+    7. FOMO_anxiety_Yes (binary) -> from fomo checkbox
+    The mapping is the model's FeatureTransformer, shared with batch scoring and training.
+    """
+    if model is None:
+        # Fallback to the original heuristic if the model failed to load or extract
+        perf.count('predict.heuristic')
+        return int((usage * 1.8 + (12-sleep)*1.2 + (10-mental)*0.8 + stress*0.7) / 4.5)
+
+    # Fast path: O(1) lookup in the precomputed table (None if the inputs are off the 0.5-step grid)
+    if risk_lookup is not None:
+        cached_score = lookup_risk_score(risk_lookup, usage, sleep, mental, stress, academic, late_night, fomo,
+                                         feature_transformer)
+        if cached_score is not None:
+            perf.count('predict.table')
+            return cached_score
+
+    # Shared service: concurrent sessions' requests are scored together in micro-batches
+    service = scoring_service(SCORING_SERVICE) if SCORING_SERVICE else None
+    if service is not None:
+        try:
+            service_score = service.score((usage, sleep, mental, stress, academic, late_night, fomo))
+            perf.count('predict.service')
+            return service_score
+        except Exception:
+            # Service unreachable or timed out: score inline below
+            perf.count('predict.service_error')
+
+    # Feature Engineering based on notebook insights (one row, no DataFrame unless the estimator needs names)
+    feature_input = model_input(model, feature_transformer.transform_one(
+        usage, sleep, mental, stress, academic, late_night, fomo), feature_transformer)
+
+    try:
+        # Get probability of the High Risk class (column resolved from the class mapping)
+        proba = model.predict_proba(feature_input)[:, HIGH_RISK_INDEX][0]
+        
+        # Scale probability (0.0 to 1.0) to a 1-10 risk score, rounding up
+        risk_score = int(np.ceil(proba * 10))
+        risk_score = min(max(risk_score, 1), 10) # Ensure it's between 1 and 10
+        perf.count('predict.model')
+        return risk_score
+    except Exception as e:
+        # Fallback to the original heuristic if prediction fails (e.g., mismatched columns)
+        perf.count('predict.fallback')
+        return int((usage * 1.8 + (12-sleep)*1.2 + (10-mental)*0.8 + stress*0.7) / 4.5)
+
+
+def predict_risk_scores_batch(profiles):
+    """
+    Batch counterpart of predict_risk_score for scoring many profiles at once.
+    `profiles` is a DataFrame with columns usage, sleep, mental, stress, academic,
+    late_night, fomo (or an array in that order). Returns an array of 1-10 scores.
+    """
+    return predict_risk_scores(model, profiles, HIGH_RISK_INDEX, feature_transformer)
+
+
+@st.cache_resource(show_spinner=False, max_entries=256)
+def _risk_surface(model_key, usage_values, sleep_values, mental, stress, academic, late_night, fomo):
+    sleep_grid, usage_grid = np.meshgrid(sleep_values, usage_values, indexing='ij')
+    n = sleep_grid.size
+    profiles = pd.DataFrame({
+        'usage': usage_grid.ravel(),
+        'sleep': sleep_grid.ravel(),
+        'mental': np.full(n, mental),
+        'stress': np.full(n, stress),
+        'academic': np.full(n, academic, dtype=object),
+        'late_night': np.full(n, bool(late_night)),
+        'fomo': np.full(n, bool(fomo)),
+    })
+    surface = predict_risk_scores(model, profiles, HIGH_RISK_INDEX, feature_transformer).reshape(sleep_grid.shape)
+    surface.flags.writeable = False
+    return surface
+
+
+def predict_risk_surface(usage_values, sleep_values, mental, stress, academic, late_night, fomo):
+    """
+    Risk scores over a usage x sleep grid for one baseline profile, in one batch call.
+    Returns a read-only (len(sleep_values), len(usage_values)) array, cached per
+    baseline and loaded model, so repeated calls are a dictionary lookup.
+    """
+    model_key = (id(model), HIGH_RISK_INDEX)
+    return _risk_surface(model_key, tuple(usage_values), tuple(sleep_values), mental, stress, academic, late_night, fomo)
+
+
+@st.cache_resource(show_spinner=False, max_entries=256)
+def _habit_changes(model_key, profile, target, allow_late_night):
+    options, _ = find_minimal_changes(model, dict(profile), target, HIGH_RISK_INDEX, allow_late_night=allow_late_night,
+                                      transformer=feature_transformer)
+    return tuple(options)
+
+
+def suggest_habit_changes(usage, sleep, mental, stress, academic, late_night, fomo, target, allow_late_night=True):
+    """
+    Least-effort usage/sleep/late-night changes that bring the profile to `target`
+    or below (see habit_optimizer.py), cheapest first; cached per profile and target.
+    """
+    profile = (('usage', usage), ('sleep', sleep), ('mental', mental), ('stress', stress),
+               ('academic', academic), ('late_night', bool(late_night)), ('fomo', bool(fomo)))
+    return _habit_changes((id(model), HIGH_RISK_INDEX), profile, target, allow_late_night)
+
+
+@st.cache_resource(show_spinner=False, max_entries=256)
+def _risk_curves(model_key, profile, axes):
+    base = dict(profile)
+    # One block of rows per input: that input swept over its axis, the rest held at the profile
+    blocks = []
+    for name, values in axes:
+        block = pd.DataFrame({field: [value] * len(values) for field, value in base.items()})
+        block[name] = list(values)
+        blocks.append(block)
+    scores = predict_risk_scores(model, pd.concat(blocks, ignore_index=True), HIGH_RISK_INDEX, feature_transformer)
+    curves, start = {}, 0
+    for name, values in axes:
+        curves[name] = (values, tuple(int(s) for s in scores[start:start + len(values)]))
+        start += len(values)
+    return curves
+
+
+def predict_risk_curves(usage, sleep, mental, stress, academic, late_night, fomo, axes):
+    """
+    Per-user partial dependence: for each (input, values) in `axes`, the risk score
+    as that input takes each value while the others stay at the profile. All
+    variations are scored in one batch call; cached per profile and model.
+    Returns {input: (values, scores)}.
+    """
+    profile = (('usage', usage), ('sleep', sleep), ('mental', mental), ('stress', stress),
+               ('academic', academic), ('late_night', bool(late_night)), ('fomo', bool(fomo)))
+    return _risk_curves((id(model), HIGH_RISK_INDEX), profile, axes)
+
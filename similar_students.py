@@ -0,0 +1,141 @@
+"""
+"Students like you": nearest cohort neighbours in the model's feature space.
+
+The cohort export is mapped to the same seven features predict_risk_score
+builds (scoring.engineer_features), standardized so hours, scores and 0/1
+flags weigh alike, and saved with each student's Addicted_Score as one
+float32 .npy (features in the first columns, score in the last). The app
+memory-maps it and builds a KD-tree once per process, so a k-nearest query
+is a few tree descents instead of a scan over the cohort.
+
+Build the index from the cohort export with:
+
+    python similar_students.py "Students Social Media Addiction.csv"
+"""
+import argparse
+import json
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+from cohort import COHORT_CSV_PATH, cohort_to_profiles
+from scoring import FEATURE_COLUMNS, engineer_features
+
+SIMILAR_STUDENTS_PATH = 'similar_students.npy'
+INDEX_VERSION = 1
+DEFAULT_CHUNKSIZE = 200000
+SCORE_COLUMN = 'Addicted_Score'
+LEAF_SIZE = 40
+
+
+def build_similar_students(csv_path, chunksize=DEFAULT_CHUNKSIZE):
+    """
+    Streams the export and returns (rows, mean, std): rows is an (n, 8) float32
+    array of standardized features plus Addicted_Score.
+    """
+    features, scores = [], []
+    for chunk in pd.read_csv(csv_path, chunksize=chunksize):
+        if SCORE_COLUMN not in chunk.columns:
+            raise ValueError(f"Cohort file is missing columns: {[SCORE_COLUMN]}")
+        profiles = cohort_to_profiles(chunk)
+        chunk_features = engineer_features(profiles).to_numpy(dtype=np.float64)
+        chunk_scores = pd.to_numeric(chunk[SCORE_COLUMN], errors='coerce').to_numpy(dtype=np.float64)
+        complete = np.isfinite(chunk_features).all(axis=1) & np.isfinite(chunk_scores)
+        features.append(chunk_features[complete])
+        scores.append(chunk_scores[complete])
+
+    features = np.concatenate(features)
+    if len(features) == 0:
+        raise ValueError(f"{csv_path} has no complete rows")
+    mean = features.mean(axis=0)
+    std = features.std(axis=0)
+    # Constant features (e.g. no late-night column in the export) carry no distance
+    std[std == 0] = 1.0
+    rows = np.column_stack([(features - mean) / std, np.concatenate(scores)]).astype(np.float32)
+    return rows, mean, std
+
+
+def _meta_path(path):
+    return os.path.splitext(path)[0] + '.json'
+
+
+def save_similar_students(rows, mean, std, path):
+    """Writes the rows (.npy) and a JSON sidecar with the feature order and scaling."""
+    np.save(path, rows)
+    meta = {
+        'version': INDEX_VERSION,
+        'features': FEATURE_COLUMNS,
+        'rows': int(rows.shape[0]),
+        'mean': mean.tolist(),
+        'std': std.tolist(),
+    }
+    with open(_meta_path(path), 'w') as fh:
+        json.dump(meta, fh, indent=2)
+
+
+class SimilarStudents:
+    """KD-tree over a saved cohort; build once per process and share it between sessions."""
+
+    def __init__(self, rows, meta):
+        from sklearn.neighbors import KDTree
+
+        n_features = len(FEATURE_COLUMNS)
+        self.mean = np.asarray(meta['mean'])
+        self.std = np.asarray(meta['std'])
+        self.scores = rows[:, n_features]
+        self.tree = KDTree(rows[:, :n_features], leaf_size=LEAF_SIZE)
+
+    def __len__(self):
+        return len(self.scores)
+
+    def query(self, profile, k):
+        """
+        The k cohort students closest to one profile (a dict or row with the
+        PROFILE_COLUMNS fields). Returns a DataFrame of their features in
+        original units, Addicted_Score and distance, nearest first.
+        """
+        if isinstance(profile, dict):
+            profile = {key: [value] for key, value in profile.items()}
+        point = (engineer_features(profile).to_numpy(dtype=np.float64) - self.mean) / self.std
+        k = min(k, len(self))
+        distances, indices = self.tree.query(point, k=k)
+        indices = indices[0]
+        neighbours = pd.DataFrame(np.asarray(self.tree.data)[indices] * self.std + self.mean, columns=FEATURE_COLUMNS)
+        neighbours[SCORE_COLUMN] = self.scores[indices]
+        neighbours['distance'] = distances[0]
+        return neighbours
+
+
+def load_similar_students(path=SIMILAR_STUDENTS_PATH):
+    """Memory-maps a saved index and builds its tree; None if it is missing or from another version."""
+    if not (os.path.exists(path) and os.path.exists(_meta_path(path))):
+        return None
+    with open(_meta_path(path)) as fh:
+        meta = json.load(fh)
+    if meta.get('version') != INDEX_VERSION or meta.get('features') != FEATURE_COLUMNS:
+        return None
+    rows = np.load(path, mmap_mode='r')
+    if rows.shape != (meta.get('rows'), len(FEATURE_COLUMNS) + 1):
+        return None
+    return SimilarStudents(rows, meta)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the nearest-neighbour index behind 'Students like you'.")
+    parser.add_argument('csv', nargs='?', default=COHORT_CSV_PATH, help="Cohort CSV export")
+    parser.add_argument('--output', default=SIMILAR_STUDENTS_PATH, help="Where to write the .npy index")
+    parser.add_argument('--chunksize', type=int, default=DEFAULT_CHUNKSIZE, help="Rows read per chunk")
+    args = parser.parse_args()
+
+    try:
+        rows, mean, std = build_similar_students(args.csv, args.chunksize)
+    except (OSError, ValueError) as e:
+        sys.exit(str(e))
+    save_similar_students(rows, mean, std, args.output)
+    print(f"Wrote {args.output}: {rows.shape[0]:,} students ({rows.nbytes / 1024:.0f} KB)")
+
+
+if __name__ == '__main__':
+    main()
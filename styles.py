@@ -0,0 +1,61 @@
+"""
+The app's stylesheet, served as a static, content-hashed asset.
+
+All CSS lives in static/app.css. With `server.enableStaticServing` (see
+.streamlit/config.toml) Streamlit serves it at app/static/app.css, so each
+rerun only sends a short <link> tag whose ?v= query is the file's content
+hash: the browser downloads the stylesheet once, revalidates it from cache
+afterwards, and picks up edits as soon as the hash changes.
+
+The link is only used from Streamlit 1.66 on: earlier (Tornado-based)
+releases serve static .css files as text/plain with nosniff, which browsers
+refuse to apply. On those, or when static serving is off, the CSS is inlined
+in a <style> block as before.
+"""
+import hashlib
+import os
+import re
+
+import streamlit as st
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static')
+STYLESHEET = 'app.css'
+# First Streamlit release whose static file handler sends .css as text/css
+STATIC_CSS_MIN_VERSION = (1, 66)
+
+# name -> ((mtime, size), css, content hash); re-read only when the file changes
+_stylesheets = {}
+
+
+def _read_stylesheet(name):
+    path = os.path.join(STATIC_DIR, name)
+    stat = os.stat(path)
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _stylesheets.get(name)
+    if cached is None or cached[0] != key:
+        with open(path, 'rb') as fh:
+            data = fh.read()
+        cached = (key, data.decode('utf-8'), hashlib.sha256(data).hexdigest()[:12])
+        _stylesheets[name] = cached
+    return cached[1], cached[2]
+
+
+def stylesheet_href(name=STYLESHEET):
+    """Relative URL of a static stylesheet, versioned by its content hash."""
+    _, digest = _read_stylesheet(name)
+    return f"app/static/{name}?v={digest}"
+
+
+def _serves_static_css():
+    """Whether this Streamlit serves app/static/*.css with a content type browsers will apply."""
+    version = tuple(int(part) for part in re.findall(r'\d+', st.__version__)[:2])
+    return st.get_option('server.enableStaticServing') and version >= STATIC_CSS_MIN_VERSION
+
+
+def inject_stylesheet(name=STYLESHEET):
+    """Links the static stylesheet (or inlines it when static CSS serving is unavailable)."""
+    if _serves_static_css():
+        st.markdown(f'<link rel="stylesheet" href="{stylesheet_href(name)}">', unsafe_allow_html=True)
+    else:
+        css, _ = _read_stylesheet(name)
+        st.markdown(f"<style>\n{css}</style>", unsafe_allow_html=True)
@@ -0,0 +1,404 @@
+"""
+Reproducible training pipeline for the risk model.
+
+Runs the notebook's modelling steps (SocialMediaLifeStyle_FinalDraft.ipynb)
+as one command and writes the serving artifact (see model_artifact.py):
+
+1. load      - read the cohort export, drop rows with missing values and duplicates
+2. label     - toxicity_score (mean z-score of Addicted_Score and conflicts),
+               VIF check, 2-cluster KMeans and the median rule for High/Low Risk
+3. features  - the 7 serving features, built with the app's own mapping
+               (cohort_to_profiles + scoring.FeatureTransformer), so the model
+               is trained on exactly what predict_risk_score sends it; the
+               transformer's spec is saved in the artifact
+4. split     - stratified 70/10/20 train/validation/test split
+5. search    - one cross-validated grid search per model family (logistic
+               regression, decision tree, random forest), fits spread over
+               every core
+6. artifact  - the chosen family's best estimator, scored on the test split
+
+Every stage's output is cached in TRAIN_CACHE_DIR under a key hashing the
+stage's code, its parameters and its inputs' keys (the first input key is
+the CSV's content hash). The code hash follows the stage into every train.py
+helper and constant it uses, and covers the full source of any other project
+module it reaches (cohort.py, scoring.py, ...), plus PIPELINE_VERSION and the
+installed scikit-learn, numpy and pandas versions. A rerun loads unchanged stages from the cache and
+recomputes only what changed: editing one family's grid repeats that search
+alone.
+
+    python train.py "Students Social Media Addiction.csv"
+    python train.py export.csv --output model_artifact.joblib --families random_forest
+"""
+import argparse
+import hashlib
+import inspect
+import json
+import os
+import sys
+import time
+import types
+from datetime import datetime
+from importlib import metadata
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from cohort import COHORT_CSV_PATH, ID_COLUMN, cohort_to_profiles
+from model_artifact import ArtifactError, build_artifact, save_artifact
+from scoring import DEFAULT_TRANSFORMER, FeatureTransformer
+
+TRAIN_CACHE_DIR = os.environ.get('TRAIN_CACHE_DIR', '.train_cache')
+# Bump to invalidate every cached stage (e.g. when a change the code hash cannot see alters results)
+PIPELINE_VERSION = 1
+# Libraries whose version is part of every stage key
+KEY_LIBRARIES = ('scikit-learn', 'numpy', 'pandas')
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+OUTPUT_PATH = 'random_forest_social_media_model.joblib'
+RANDOM_STATE = 42
+CV_FOLDS = 3
+# Train / validation / test shares (the notebook's 70-10-20 split)
+SPLIT = (0.7, 0.1, 0.2)
+LABEL_COLUMN = 'mental_health_risk_level'
+SERVING_FAMILY = 'random_forest'
+
+# Notebook hyperparameter grids (logistic regression runs behind a StandardScaler)
+PARAM_GRIDS = {
+    'logistic_regression': [
+        {'model__penalty': ['l1'], 'model__solver': ['liblinear', 'saga'],
+         'model__C': [0.001, 0.01, 0.1, 1, 10, 100]},
+        {'model__penalty': ['l2'], 'model__solver': ['lbfgs', 'liblinear', 'newton-cg'],
+         'model__C': [0.001, 0.01, 0.1, 1, 10, 100]},
+        {'model__penalty': ['elasticnet'], 'model__solver': ['saga'],
+         'model__C': [0.001, 0.01, 0.1, 1, 10], 'model__l1_ratio': [0.1, 0.3, 0.5, 0.7, 0.9]},
+    ],
+    'decision_tree': {
+        'max_depth': [3, 5, 7, 10, 15, 20, None],
+        'min_samples_split': [2, 5, 10, 15],
+        'min_samples_leaf': [1, 2, 4, 8],
+        'criterion': ['gini', 'entropy'],
+        'max_features': ['sqrt', 'log2', None],
+    },
+    'random_forest': {
+        'n_estimators': [50, 100, 200],
+        'max_depth': [5, 10, 15, 20, None],
+        'min_samples_split': [2, 5, 10],
+        'min_samples_leaf': [1, 2, 4],
+        'max_features': ['sqrt', 'log2', None],
+        'bootstrap': [True, False],
+    },
+}
+
+
+def base_estimator(family):
+    from sklearn.ensemble import RandomForestClassifier
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.pipeline import Pipeline
+    from sklearn.preprocessing import StandardScaler
+    from sklearn.tree import DecisionTreeClassifier
+
+    if family == 'logistic_regression':
+        return Pipeline([('scale', StandardScaler()),
+                         ('model', LogisticRegression(max_iter=2000, random_state=RANDOM_STATE))])
+    if family == 'decision_tree':
+        return DecisionTreeClassifier(random_state=RANDOM_STATE)
+    if family == 'random_forest':
+        # One core per forest: the search already runs a fit per core
+        return RandomForestClassifier(random_state=RANDOM_STATE, n_jobs=1)
+    raise ValueError(f"Unknown model family: {family}")
+
+
+# ====================== STAGE CACHE ======================
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _project_module(obj):
+    """The repo module defining `obj` (or `obj` itself if it is one), else None for stdlib/third-party code."""
+    module = obj if isinstance(obj, types.ModuleType) else inspect.getmodule(obj)
+    path = getattr(module, '__file__', None)
+    return module if path and os.path.dirname(os.path.abspath(path)) == PROJECT_DIR else None
+
+
+def _global_names(code):
+    """Global names used by a code object, including its nested functions and comprehensions."""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _global_names(const)
+    return names
+
+
+def code_fingerprint(fn):
+    """
+    SHA-256 over the code a stage runs: its source, the source of every function
+    or class in the same module it reaches (transitively), the values of the
+    plain constants they read, and the full source of every other project module
+    reached on the way (with that module's own project imports).
+    """
+    home = inspect.getmodule(fn)
+    parts, seen, pending = {}, set(), [fn]
+    while pending:
+        obj = pending.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        module = _project_module(obj)
+        if module is None:
+            continue
+        if module is not home:
+            parts[f'module:{module.__name__}'] = inspect.getsource(module)
+            pending.extend(value for value in vars(module).values() if _project_module(value) not in (None, module))
+            continue
+        parts[f'{obj.__qualname__}'] = inspect.getsource(obj)
+        functions = [obj] if inspect.isfunction(obj) else [v for v in vars(obj).values() if inspect.isfunction(v)]
+        for function in functions:
+            for name in _global_names(function.__code__):
+                value = function.__globals__.get(name)
+                if isinstance(value, (bool, int, float, str, tuple, list, dict)):
+                    parts[f'const:{name}'] = repr(value)
+                elif value is not None:
+                    pending.append(value)
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def _library_versions():
+    versions = {}
+    for name in KEY_LIBRARIES:
+        try:
+            versions[name] = metadata.version(name)
+        except metadata.PackageNotFoundError:
+            versions[name] = None
+    return versions
+
+
+class StageCache:
+    """Runs pipeline stages, reusing stored outputs whose key (code + params + input keys) is unchanged."""
+
+    def __init__(self, directory=TRAIN_CACHE_DIR, enabled=True):
+        self.directory = directory
+        self.enabled = enabled
+        self.log = []
+
+    def key(self, name, fn, deps, params):
+        payload = json.dumps({
+            'stage': name,
+            'code': code_fingerprint(fn),
+            'pipeline_version': PIPELINE_VERSION,
+            'libraries': _library_versions(),
+            'deps': list(deps),
+            'params': params,
+        }, sort_keys=True, default=repr)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def run(self, name, fn, deps, *args, params=None, **kwargs):
+        """Returns (key, output) of fn(*args, **params, **kwargs); `deps` are the keys of the inputs in args."""
+        params = dict(params or {})
+        key = self.key(name, fn, deps, params)
+        path = os.path.join(self.directory, f'{name}-{key[:16]}.joblib')
+        start = time.perf_counter()
+        if self.enabled and os.path.exists(path):
+            try:
+                output = joblib.load(path)
+                self.log.append((name, 'cached', time.perf_counter() - start))
+                return key, output
+            except Exception:
+                pass
+        output = fn(*args, **params, **kwargs)
+        if self.enabled:
+            os.makedirs(self.directory, exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            joblib.dump(output, tmp_path)
+            os.replace(tmp_path, path)
+        self.log.append((name, 'ran', time.perf_counter() - start))
+        return key, output
+
+
+# ====================== STAGES ======================
+def load_stage(csv_path):
+    """The cohort export without rows missing a modelling column, and without duplicates."""
+    data = pd.read_csv(csv_path)
+    required = ['Avg_Daily_Usage_Hours', 'Sleep_Hours_Per_Night', 'Mental_Health_Score',
+                'Conflicts_Over_Social_Media', 'Addicted_Score', 'Academic_Level']
+    missing = [col for col in required if col not in data.columns]
+    if missing:
+        raise ValueError(f"{csv_path} is missing columns: {missing}")
+    data = data.dropna(subset=required)
+    return data.drop_duplicates(subset=[col for col in data.columns if col != ID_COLUMN]).reset_index(drop=True)
+
+
+def variance_inflation_factors(frame):
+    """VIF of each column: 1 / (1 - R^2) regressing it on the others plus an intercept."""
+    X = frame.to_numpy(dtype=float)
+    vifs = {}
+    for i, col in enumerate(frame.columns):
+        others = np.column_stack([np.ones(len(X)), np.delete(X, i, axis=1)])
+        coef, *_ = np.linalg.lstsq(others, X[:, i], rcond=None)
+        residual = X[:, i] - others @ coef
+        total = ((X[:, i] - X[:, i].mean()) ** 2).sum()
+        r2 = 1 - (residual ** 2).sum() / total if total else 1.0
+        vifs[col] = float(1 / (1 - r2)) if r2 < 1 else float('inf')
+    return vifs
+
+
+def label_stage(data):
+    """
+    Notebook risk labels: KMeans (k=2) over standardized usage, sleep risk (8 - sleep),
+    toxicity and mental-health risk (10 - mental); a cluster whose means reach the
+    population median on 3 or more of them is High Risk.
+    """
+    from sklearn.cluster import KMeans
+    from sklearn.preprocessing import StandardScaler
+
+    toxicity = StandardScaler().fit_transform(data[['Addicted_Score', 'Conflicts_Over_Social_Media']]).mean(axis=1)
+    clustering = pd.DataFrame({
+        'avg_daily_usage_hours': data['Avg_Daily_Usage_Hours'].astype(float),
+        'sleep_risk_factor': 8 - data['Sleep_Hours_Per_Night'].astype(float),
+        'toxicity_score': toxicity,
+        'mental_health_risk_factor': 10 - data['Mental_Health_Score'].astype(float),
+    })
+    clusters = KMeans(n_clusters=2, random_state=RANDOM_STATE).fit_predict(StandardScaler().fit_transform(clustering))
+    cluster_means = clustering.groupby(clusters).mean()
+    medians = clustering.quantile(0.5)
+    risk_mapping = {c: 'High Risk' if (cluster_means.loc[c] >= medians).sum() >= 3 else 'Low Risk'
+                    for c in cluster_means.index}
+
+    labelled = data.copy()
+    labelled[LABEL_COLUMN] = [risk_mapping[c] for c in clusters]
+    vif = variance_inflation_factors(pd.DataFrame({
+        'avg_daily_usage_hours': data['Avg_Daily_Usage_Hours'],
+        'sleep_hours_per_night': data['Sleep_Hours_Per_Night'],
+        'toxicity_score': toxicity,
+    }))
+    return {'data': labelled, 'vif': vif}
+
+
+def features_stage(labelled, transformer):
+    """
+    Serving features (scoring.FEATURE_COLUMNS) from the FeatureTransformer spec
+    `transformer`, and integer class codes (label values sorted, like LabelEncoder).
+    """
+    data = labelled['data']
+    feature_transformer = FeatureTransformer.from_dict(transformer)
+    X = feature_transformer.frame(feature_transformer.transform(cohort_to_profiles(data)))
+    class_values = sorted(data[LABEL_COLUMN].unique())
+    if len(class_values) != 2:
+        raise ValueError(f"Expected two risk levels after labelling, got {class_values}")
+    y = data[LABEL_COLUMN].map({value: code for code, value in enumerate(class_values)}).to_numpy()
+    return {'X': X, 'y': y, 'class_labels': dict(enumerate(class_values)), 'transformer': transformer}
+
+
+def split_stage(features, shares=SPLIT):
+    """Stratified train / validation / test split (the notebook's two-step train_test_split)."""
+    from sklearn.model_selection import train_test_split
+
+    X, y = features['X'], features['y']
+    X_train, X_temp, y_train, y_temp = train_test_split(
+        X, y, test_size=1 - shares[0], random_state=RANDOM_STATE, stratify=y)
+    X_val, X_test, y_val, y_test = train_test_split(
+        X_temp, y_temp, test_size=shares[2] / (shares[1] + shares[2]), random_state=RANDOM_STATE, stratify=y_temp)
+    return {'X_train': X_train, 'y_train': y_train, 'X_val': X_val, 'y_val': y_val, 'X_test': X_test, 'y_test': y_test}
+
+
+def search_stage(split, family, param_grid, cv=CV_FOLDS, n_jobs=-1):
+    """Cross-validated grid search on the training split; returns the best estimator and its scores."""
+    from sklearn.metrics import accuracy_score
+    from sklearn.model_selection import GridSearchCV
+
+    searcher = GridSearchCV(base_estimator(family), param_grid, cv=cv, scoring='accuracy', n_jobs=n_jobs)
+    searcher.fit(split['X_train'], split['y_train'])
+    best = searcher.best_estimator_
+    return {
+        'estimator': best,
+        'best_params': {k.replace('model__', ''): v for k, v in searcher.best_params_.items()},
+        'cv_accuracy': float(searcher.best_score_),
+        'val_accuracy': float(accuracy_score(split['y_val'], best.predict(split['X_val']))),
+        'test_accuracy': float(accuracy_score(split['y_test'], best.predict(split['X_test']))),
+        'candidates': len(searcher.cv_results_['params']),
+    }
+
+
+# ====================== PIPELINE ======================
+def train(csv_path, output=OUTPUT_PATH, families=tuple(PARAM_GRIDS), serve=SERVING_FAMILY,
+          cache_dir=TRAIN_CACHE_DIR, use_cache=True, n_jobs=-1):
+    """Runs every stage and saves the artifact; returns (artifact, results by family, stage log)."""
+    if serve not in families:
+        raise ValueError(f"Serving family {serve} is not among the searched families {list(families)}")
+    cache = StageCache(cache_dir, enabled=use_cache)
+    data_key = file_sha256(csv_path)
+
+    key, data = cache.run('load', load_stage, [data_key], csv_path)
+    key, labelled = cache.run('label', label_stage, [key], data)
+    key, features = cache.run('features', features_stage, [key], labelled,
+                              params={'transformer': DEFAULT_TRANSFORMER.to_dict()})
+    split_key, split = cache.run('split', split_stage, [key], features, params={'shares': SPLIT})
+
+    results = {}
+    for family in families:
+        # n_jobs changes speed, not results, so it stays out of the key
+        _, results[family] = cache.run(f'search_{family}', search_stage, [split_key], split, n_jobs=n_jobs,
+                                       params={'family': family, 'param_grid': PARAM_GRIDS[family], 'cv': CV_FOLDS})
+
+    chosen = results[serve]
+    metadata = {
+        'model_type': type(chosen['estimator']).__name__,
+        'accuracy': chosen['test_accuracy'],
+        'val_accuracy': chosen['val_accuracy'],
+        'cv_accuracy': chosen['cv_accuracy'],
+        'best_params': chosen['best_params'],
+        'training_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'training_data_sha256': data_key,
+        'n_rows': int(len(features['y'])),
+        'label_counts': {label: int((features['y'] == code).sum()) for code, label in features['class_labels'].items()},
+        'vif': labelled['vif'],
+        'families': {family: {k: v for k, v in r.items() if k != 'estimator'} for family, r in results.items()},
+        'model_version': 1,
+        # Fixed validation rows that later refreshes must still score well on (see model_refresh.py)
+        'reference_set': {'X': split['X_val'].to_numpy().tolist(), 'y': split['y_val'].tolist()},
+    }
+    if hasattr(chosen['estimator'], 'feature_importances_'):
+        metadata['feature_importances'] = dict(zip(features['X'].columns, map(float, chosen['estimator'].feature_importances_)))
+    artifact = build_artifact(chosen['estimator'], class_labels=features['class_labels'], metadata=metadata,
+                              transformer=FeatureTransformer.from_dict(features['transformer']))
+    save_artifact(artifact, output)
+    return artifact, results, cache.log
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train the risk model from a cohort export and write the serving artifact.")
+    parser.add_argument('csv', nargs='?', default=COHORT_CSV_PATH, help="Cohort export in the notebook's CSV layout")
+    parser.add_argument('--output', default=OUTPUT_PATH, help="Artifact path the app loads")
+    parser.add_argument('--families', nargs='+', choices=list(PARAM_GRIDS), default=list(PARAM_GRIDS),
+                        help="Model families to search")
+    parser.add_argument('--serve', choices=list(PARAM_GRIDS), default=SERVING_FAMILY, help="Family written to the artifact")
+    parser.add_argument('--cache-dir', default=TRAIN_CACHE_DIR, help="Stage cache directory")
+    parser.add_argument('--no-cache', action='store_true', help="Recompute every stage")
+    parser.add_argument('--jobs', type=int, default=-1, help="Parallel fits (-1: every core)")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.csv):
+        sys.exit(f"Cohort export not found at: {args.csv}")
+    start = time.perf_counter()
+    try:
+        artifact, results, log = train(args.csv, args.output, args.families, args.serve,
+                                       args.cache_dir, not args.no_cache, args.jobs)
+    except (ValueError, ArtifactError) as e:
+        sys.exit(str(e))
+
+    for name, status, seconds in log:
+        print(f"{name:<30} {status:<7} {seconds:8.2f}s")
+    print()
+    for family, result in results.items():
+        marker = '*' if family == args.serve else ' '
+        print(f"{marker} {family:<20} cv {result['cv_accuracy']:.3f}  val {result['val_accuracy']:.3f}  "
+              f"test {result['test_accuracy']:.3f}  ({result['candidates']} candidates) {result['best_params']}")
+    print(f"\nWrote {args.output} in {time.perf_counter() - start:.1f}s. Rebuild the files tied to the model "
+          f"(risk_table.py, peer_index.py) before serving it.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,25 @@
+"""
+Page registry for the sidebar navigation.
+
+Each page lives in its own module with a `render()` function and its own CSS.
+Modules are imported on first visit, so a rerun only executes (and only sends
+the styles of) the page that is selected.
+"""
+import importlib
+
+# Sidebar radio value -> module, in navigation order (Insights is before Assessment)
+PAGES = {
+    "Home": "views.home",
+    "Insights": "views.insights",
+    "Assessment": "views.assessment",
+    "Your Personas": "views.your_personas",
+    "What-If Simulator": "views.what_if",
+    "Recommendations": "views.recommendations",
+    "Peer Comparison": "views.peer_comparison",
+}
+PAGE_NAMES = list(PAGES)
+
+
+def render_page(page):
+    """Imports the page's module (cached by Python after the first visit) and renders it."""
+    importlib.import_module(PAGES[page]).render()
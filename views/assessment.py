@@ -0,0 +1,252 @@
+"""
+Assessment page.
+"""
+import uuid
+
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+from plotly.subplots import make_subplots
+
+import live_stats
+import perf
+from history import HISTORY_DB_PATH, HistoryStore
+from scoring import FORM_ACADEMIC_LEVELS
+from serving import predict_risk_curves, predict_risk_score
+
+# Past submissions shown in the trend chart
+HISTORY_LIMIT = 30
+
+ACADEMIC_LEVELS = tuple(FORM_ACADEMIC_LEVELS)
+
+# Usage and sleep slider step: the risk table's 0.5 h grid, so every submission is a table lookup
+HOURS_STEP = 0.5
+
+# Values each input is swept over for the "what moves your score" curves (the form's slider ranges)
+CURVE_AXES = (
+    ('usage', tuple(0.5 + 0.5 * i for i in range(24))),
+    ('sleep', tuple(4.0 + 0.5 * i for i in range(17))),
+    ('mental', tuple(range(1, 11))),
+    ('stress', tuple(range(1, 11))),
+    ('academic', ACADEMIC_LEVELS),
+    ('late_night', (False, True)),
+    ('fomo', (False, True)),
+)
+CURVE_NUMERIC = ['usage', 'sleep', 'mental', 'stress']
+CURVE_TOGGLES = ['academic', 'late_night', 'fomo']
+CURVE_TITLES = {
+    'usage': "Daily Usage (hours)",
+    'sleep': "Sleep (hours)",
+    'mental': "Mental Health Score",
+    'stress': "Stress Level",
+    'academic': "Academic Level",
+    'late_night': "Phone After Midnight",
+    'fomo': "Anxious Without Phone",
+}
+
+
+def _snap_hours(value, low, high):
+    """Nearest HOURS_STEP grid value within [low, high], for slider defaults carried over in session state."""
+    return float(min(max(round(float(value) / HOURS_STEP) * HOURS_STEP, low), high))
+
+
+@st.cache_resource(show_spinner=False)
+def history_store(path=HISTORY_DB_PATH):
+    """One history store (and writer thread) per process, shared by every session."""
+    return HistoryStore(path)
+
+
+def history_user_id():
+    """
+    Pseudonymous ID for this browser: the ?uid= query parameter, created on first use
+    so bookmarking the page keeps the history.
+    """
+    if 'history_user_id' not in st.session_state:
+        uid = st.query_params.get('uid')
+        if not uid:
+            uid = uuid.uuid4().hex
+            st.query_params['uid'] = uid
+        st.session_state.history_user_id = uid
+    return st.session_state.history_user_id
+
+
+def render_history(history, risk_score):
+    """Trend of the user's past risk scores plus the one just submitted."""
+    if not history:
+        return
+    trend = pd.DataFrame(history)[['ts', 'risk_score']]
+    trend.loc[len(trend)] = [pd.Timestamp.now().timestamp(), risk_score]
+    trend['time'] = pd.to_datetime(trend['ts'], unit='s')
+
+    st.markdown('<div class="content-box">', unsafe_allow_html=True)
+    st.markdown("<h3 style='color: #2B3674;'>🗓️ Your Risk Score Over Time</h3>", unsafe_allow_html=True)
+    change = risk_score - int(trend['risk_score'].iloc[-2])
+    st.markdown(f"<p style='font-size:0.95rem; color:#707EAE;'>Your last {len(trend)} assessments. Change since the previous one: <b>{change:+d}</b>.</p>", unsafe_allow_html=True)
+    fig = go.Figure(go.Scatter(x=trend['time'], y=trend['risk_score'], mode='lines+markers',
+                               line=dict(color='#4318FF', width=3), marker=dict(size=8, color='#05CD99'),
+                               hovertemplate='%{x|%b %d, %H:%M}: %{y}/10<extra></extra>'))
+    fig.update_layout(height=300, yaxis=dict(range=[0, 10.5], title="Risk Score"), margin=dict(l=0, r=0, t=10, b=0),
+                      plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)')
+    st.plotly_chart(fig, use_container_width=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+
+def render_risk_curves(profile):
+    """One curve per input: how the risk score changes as it varies and the rest stay fixed."""
+    # The user's own answer joins each numeric axis, so every curve passes through it
+    axes = tuple((name, tuple(sorted(set(values) | {profile[name]})) if name in CURVE_NUMERIC else values)
+                 for name, values in CURVE_AXES)
+    perf.lap('page')
+    curves = predict_risk_curves(**profile, axes=axes)
+    perf.lap('risk_curves')
+
+    st.markdown('<div class="content-box">', unsafe_allow_html=True)
+    st.markdown("<h3 style='color: #2B3674;'>📈 What Moves Your Score</h3>", unsafe_allow_html=True)
+    st.markdown("<p style='font-size:0.95rem; color:#707EAE;'>Your risk score as each answer changes while everything else stays as you entered it. Dots mark your answers.</p>", unsafe_allow_html=True)
+
+    fig = make_subplots(rows=2, cols=2, subplot_titles=[CURVE_TITLES[name] for name in CURVE_NUMERIC],
+                        horizontal_spacing=0.1, vertical_spacing=0.18)
+    for i, name in enumerate(CURVE_NUMERIC):
+        values, scores = curves[name]
+        row, col = i // 2 + 1, i % 2 + 1
+        fig.add_trace(go.Scatter(x=values, y=scores, mode='lines', line=dict(color='#4318FF', width=3, shape='hv'),
+                                 hovertemplate='%{x}: %{y}/10<extra></extra>'), row=row, col=col)
+        fig.add_trace(go.Scatter(x=[profile[name]], y=[scores[values.index(profile[name])]], mode='markers',
+                                 marker=dict(color='#05CD99', size=12, line=dict(color='white', width=2)),
+                                 hoverinfo='skip'), row=row, col=col)
+        fig.update_yaxes(range=[0, 10.5], row=row, col=col)
+    fig.update_layout(height=520, showlegend=False, margin=dict(l=0, r=0, t=40, b=0),
+                      plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)')
+    perf.lap('plotly_build')
+    st.plotly_chart(fig, use_container_width=True)
+    perf.lap('plotly_render')
+
+    toggles = []
+    for name in CURVE_TOGGLES:
+        values, scores = curves[name]
+        labels = [("Yes" if v else "No") if isinstance(v, bool) else v for v in values]
+        options = " · ".join(
+            f"<b>{label}: {score}/10</b>" if value == profile[name] else f"{label}: {score}/10"
+            for label, value, score in zip(labels, values, scores))
+        toggles.append(f"<li><b style='color:#2B3674;'>{CURVE_TITLES[name]}:</b> {options}</li>")
+    levers = sorted(curves, key=lambda name: max(curves[name][1]) - min(curves[name][1]), reverse=True)
+    levers = [CURVE_TITLES[name] for name in levers if max(curves[name][1]) > min(curves[name][1])][:3]
+    st.markdown(f"""
+    <ul style="font-size:0.9rem; color:#707EAE;">{''.join(toggles)}</ul>
+    <p style='font-size:0.9rem; color:#4318FF;'>💡 Biggest levers for you: {', '.join(levers) if levers else 'none - your score is stable across every answer'}.</p>
+    """, unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+
+# ====================== 6. PAGE: ASSESSMENT (ENHANCED WITH BETTER UX) ======================
+def render():
+    st.markdown("<div style='text-align:center;'><h2 class='gradient-text'>Social Media Addiction Risk Assessment</h2><p>Evidence-based evaluation tool built on analysis of 705 students</p></div>", unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div class="content-box">
+        <h3 style="margin-bottom: 20px; color: #000000;">Your Digital Lifestyle Profile</h3>
+        <p style="color: #000000;">Answer honestly for accurate risk assessment</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+
+    with st.form("wellbeing_form"):
+        
+        col1, col2 = st.columns([2, 1])
+        
+        # NOTE: Initial values for sliders now come from the global st.session_state (assessment_*)
+
+        with col1:
+            st.markdown("<b>Daily Social Media Usage</b>", unsafe_allow_html=True)
+            usage = st.slider("Hours", 0.5, 12.0, _snap_hours(st.session_state.assessment_usage, 0.5, 12.0), HOURS_STEP,
+                              key='usage_input', label_visibility="collapsed")
+            st.caption(f"Selected: {usage} hours/day (Average student: 4.9 hours)")
+            st.write("")
+
+            st.markdown("<b>Sleep Hours Per Night</b>", unsafe_allow_html=True)
+            sleep = st.slider("Hours", 4.0, 12.0, _snap_hours(st.session_state.assessment_sleep, 4.0, 12.0), HOURS_STEP,
+                              key='sleep_input', label_visibility="collapsed")
+            st.caption(f"Selected: {sleep} hours/night (Average student: 6.9 hours)")
+            st.write("")
+
+            st.markdown("<b>Mental Health Score (1-10)</b>", unsafe_allow_html=True)
+            mental = st.slider("Score", 1, 10, st.session_state.assessment_mental, key='mental_input', label_visibility="collapsed")
+            st.write("")
+
+            st.markdown("<b>Stress Level (1-10)</b>", unsafe_allow_html=True)
+            stress = st.slider("Stress", 1, 10, st.session_state.assessment_stress, key='stress_input', label_visibility="collapsed")
+
+        with col2:
+            st.markdown("<b>Demographics & Details</b>", unsafe_allow_html=True)
+            age = st.number_input("Age", 16, 40, 21)
+            academic = st.selectbox("Academic Level", list(ACADEMIC_LEVELS), index=ACADEMIC_LEVELS.index(st.session_state.assessment_academic))
+            platform = st.selectbox("Primary Platform", ["Instagram", "TikTok", "YouTube", "Twitter/X", "Snapchat"])
+            
+            st.write("")
+            late_night = st.checkbox("I use my phone after midnight", value=st.session_state.assessment_late_night)
+            fomo = st.checkbox("I feel anxious without my phone", value=st.session_state.assessment_fomo)
+
+        st.write("")
+        submitted = st.form_submit_button("Calculate Risk Profile", type="primary", use_container_width=True)
+
+    st.markdown("</div>", unsafe_allow_html=True) 
+
+    if submitted:
+        # Calculate final risk score using the Random Forest Model
+        risk_score = predict_risk_score(usage, sleep, mental, stress, academic, late_night, fomo)
+        
+        # 1. Update Assessment session state with submitted values (required for Recommendations & Peer Comparison)
+        st.session_state.assessment_usage = usage
+        st.session_state.assessment_sleep = sleep
+        st.session_state.assessment_mental = mental
+        st.session_state.assessment_stress = stress
+        st.session_state.assessment_risk = risk_score
+        st.session_state.assessment_academic = academic
+        st.session_state.assessment_late_night = late_night
+        st.session_state.assessment_fomo = fomo
+        
+        # 2. SYNC TO PERSONA SLIDERS (Page 5)
+        st.session_state.persona_usage_slider = usage
+        st.session_state.persona_sleep_slider = sleep
+        st.session_state.persona_mental_slider = mental
+        
+        # 3. SYNC TO WHAT-IF SLIDERS (Page 7)
+        # Initialize What-If sliders to the *current* assessment values
+        st.session_state.what_if_usage = usage
+        st.session_state.what_if_sleep = sleep
+        
+        # Determine risk color based on score (only for visualization)
+        if risk_score > 7:
+            risk_color = '#4318FF' # High Risk
+        elif risk_score > 4:
+            risk_color = '#5A7DFF' # Moderate Risk
+        else:
+            risk_color = '#00D2AA' # Low Risk
+
+        # UPDATED OUTPUT MARKDOWN (Removed risk category text)
+        st.markdown(f"""
+        <div class="content-box" style="text-align: center; background: linear-gradient(180deg, #fff 0%, #f0f7ff 100%);">
+            <h3>Assessment Complete</h3>
+            <div style="font-size: 4rem; font-weight: 800; color: {risk_color};">
+                {risk_score}/10
+            </div>
+            <p style="font-size: 1.2rem; font-weight: bold; color: #2B3674;">
+                Risk Score Determined by Random Forest Model
+            </p>
+            <p style='font-size:0.9rem;'>
+                This score is derived from the Random Forest model's probability of assigning your profile to its risk cluster.
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        # 4. PERSIST THE SUBMISSION (queued; the history writer commits in batches)
+        store = history_store()
+        user_id = history_user_id()
+        history = store.user_history(user_id, limit=HISTORY_LIMIT - 1)
+        store.record(user_id, usage, sleep, mental, stress, academic, late_night, fomo, risk_score)
+        live_stats.record(usage, sleep, mental, stress, risk_score)
+        perf.lap('history')
+
+        render_risk_curves(dict(usage=usage, sleep=sleep, mental=mental, stress=stress,
+                                academic=academic, late_night=late_night, fomo=fomo))
+        render_history(history, risk_score)
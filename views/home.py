@@ -0,0 +1,171 @@
+"""
+Home page.
+"""
+import streamlit as st
+
+
+# ====================== 3. PAGE: HOME ======================
+def render():
+    # Hero Section with gradient background
+    st.markdown("""
+    <div class="hero-section" style="text-align: center;">
+        <div class="hero-badge">🎓 Research-Based Digital Wellness Tool</div>
+        <h1 class="hero-title">Social Media Addiction<br>Risk Dashboard</h1>
+        <h4 class="hero-title">Evidence-based assessment tool built on comprehensive analysis of 705 students. Understand your digital habits and get personalized wellness recommendations.</h4>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Call-to-Action
+    st.markdown("""
+    <div class="cta-container">
+        <p class="cta-text">Ready to discover your digital wellness profile?</p>
+        <div class="cta-highlight">👉 Navigate to <strong>Assessment</strong> in the sidebar to begin</div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.write("") 
+
+    # Quick Stats Bar
+    st.markdown("""
+    <div class="stats-bar">
+        <div class="stat-inline">
+            <div class="stat-number">705</div>
+            <div class="stat-label">Students Studied</div>
+        </div>
+        <div class="stat-inline">
+            <div class="stat-number">92%</div>
+            <div class="stat-label">Model Accuracy</div>
+        </div>
+        <div class="stat-inline">
+            <div class="stat-number">7</div>
+            <div class="stat-label">Key Predictors</div>
+        </div>
+        <div class="stat-inline">
+            <div class="stat-number">8</div>
+            <div class="stat-label">Platforms Analyzed</div>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.write("")
+    
+    # KPI Cards Row (animated)
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.markdown("""
+        <div class="kpi-card">
+            <div class="kpi-icon" style="color: #4318FF;">👥</div>
+            <div class="kpi-value">705</div>
+            <div class="kpi-label">Students Analyzed</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("""
+        <div class="kpi-card">
+            <div class="kpi-icon" style="color: #667eea;">⚡</div>
+            <div class="kpi-value">92.0%</div>
+            <div class="kpi-label">Model Accuracy</div>
+        </div>
+        """, unsafe_allow_html=True) 
+
+    with col3:
+        st.markdown("""
+        <div class="kpi-card">
+            <div class="kpi-icon" style="color: #00D2AA;">🕒</div>
+            <div class="kpi-value">4.9hrs</div>
+            <div class="kpi-label">Avg Daily Usage</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col4:
+        st.markdown("""
+        <div class="kpi-card">
+            <div class="kpi-icon" style="color: #4318FF;">🧠</div>
+            <div class="kpi-value">8</div>
+            <div class="kpi-label">Key Platforms</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.write("")
+    st.write("")
+    
+    # Features Section with enhanced design
+    st.markdown("<h3 style='text-align: center; margin-bottom: 40px; font-size: 2rem; color: #2B3674;'>What This Dashboard Offers</h3>", unsafe_allow_html=True)
+    
+    f1, f2, f3 = st.columns(3)
+    
+    with f1:
+        st.markdown("""
+        <div class="feature-card">
+            <div class="feature-icon" style="color: #4318FF;">🛡️</div>
+            <div class="feature-title">Risk Assessment</div>
+            <p>Personalized evaluation based on your usage patterns, sleep, stress, and mental health metrics.</p>
+            <ul>
+                <li>Real-time risk calculation</li>
+                <li>Evidence-based scoring</li>
+                <li>ML-powered predictions</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with f2:
+        st.markdown("""
+        <div class="feature-card">
+            <div class="feature-icon" style="color: #667eea;">📈</div>
+            <div class="feature-title">Platform Analytics</div>
+            <p>Detailed breakdown of addiction patterns across different social media platforms.</p>
+            <ul>
+                <li>Platform addiction rankings</li>
+                <li>Usage pattern analysis</li>
+                <li>Demographic insights</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with f3:
+        st.markdown("""
+        <div class="feature-card">
+            <div class="feature-icon" style="color: #00D2AA;">📊</div>
+            <div class="feature-title">Research Insights</div>
+            <p>Access to comprehensive findings from our machine learning analysis.</p>
+            <ul>
+                <li>Statistical correlations</li>
+                <li>Behavioral patterns</li>
+                <li>Actionable recommendations</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.write("")
+    st.write("")
+    
+    # Additional interactive section - "How it Works"
+    st.markdown("""
+    <div style="background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%); padding: 40px; border-radius: 20px; margin-top: 3rem;">
+        <h3 style="text-align: center; color: #2B3674; margin-bottom: 30px;">How It Works</h3>
+        <div style="display: flex; justify-content: space-around; flex-wrap: wrap;">
+            <div style="text-align: center; flex: 1; min-width: 200px; padding: 20px;">
+                <div style="font-size: 3rem; margin-bottom: 10px;">1️⃣</div>
+                <div style="font-weight: 700; color: #2B3674; margin-bottom: 10px;">Take Assessment</div>
+                <div style="color: #707EAE; font-size: 0.9rem;">Answer questions about your digital habits</div>
+            </div>
+            <div style="text-align: center; flex: 1; min-width: 200px; padding: 20px;">
+                <div style="font-size: 3rem; margin-bottom: 10px;">2️⃣</div>
+                <div style="font-weight: 700; color: #2B3674; margin-bottom: 10px;">Get Your Score</div>
+                <div style="color: #707EAE; font-size: 0.9rem;">Receive ML-powered risk analysis</div>
+            </div>
+            <div style="text-align: center; flex: 1; min-width: 200px; padding: 20px;">
+                <div style="font-size: 3rem; margin-bottom: 10px;">3️⃣</div>
+                <div style="font-weight: 700; color: #2B3674; margin-bottom: 10px;">Discover Persona</div>
+                <div style="color: #707EAE; font-size: 0.9rem;">Find your digital wellness persona</div>
+            </div>
+            <div style="text-align: center; flex: 1; min-width: 200px; padding: 20px;">
+                <div style="font-size: 3rem; margin-bottom: 10px;">4️⃣</div>
+                <div style="font-weight: 700; color: #2B3674; margin-bottom: 10px;">Take Action</div>
+                <div style="color: #707EAE; font-size: 0.9rem;">Get personalized recommendations</div>
+            </div>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
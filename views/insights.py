@@ -0,0 +1,453 @@
+"""
+Insights page.
+"""
+import os
+
+import plotly.graph_objects as go
+import streamlit as st
+
+import perf
+from assets import asset_format, image_asset
+from cohort_stats import COHORT_STATS_PATH, load_summary
+
+FEATURE_IMPORTANCE_PATH = "feature_importance.png"
+
+# Bar colors, assigned in ranking order (cycled if the cohort has more platforms or ages)
+PLATFORM_COLORS = ('#4318FF', '#5A7DFF', '#667eea', '#7C93F5', '#05CD99', '#3CD4A0', '#66D9A6', '#B8F1D0')
+AGE_COLORS = ('#9299F5', '#7D85EC', '#667eea', '#5A7DFF', '#7D85EC', '#9299F5', '#A3AED0')
+
+# Academic level -> (card class, tag class, tag text, value color); unknown levels use the low-risk style
+ACADEMIC_STYLES = {
+    "High School": ("ac-red", "tag-high", "High Risk", "#4318FF"),
+    "Undergraduate": ("ac-yellow", "tag-med", "Moderate Risk", "#5A7DFF"),
+}
+LOW_RISK_STYLE = ("ac-green", "tag-low", "Low Risk", "#05CD99")
+
+# Shared chart styling; part of the figure cache key, so a theme change rebuilds the figures
+CHART_THEME = {
+    'background': 'rgba(0,0,0,0)',
+    'grid_color': 'rgba(200,200,200,0.2)',
+    'axis_title_color': '#707EAE',
+    'tick_color': '#2B3674',
+    'font_family': "Segoe UI, sans-serif",
+    'hover_font_family': "Segoe UI",
+}
+
+
+# ====================== COHORT SUMMARY ======================
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _cached_summary(path, mtime_ns):
+    return load_summary(path)
+
+
+def cohort_summary(path=COHORT_STATS_PATH):
+    """
+    Figures for this page from the aggregate store (build it with `python cohort_stats.py`).
+    Read once per store version; falls back to the notebook's numbers when there is no store.
+    """
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        mtime_ns = None
+    return _cached_summary(path, mtime_ns)
+
+
+def _cycle(colors, n):
+    return tuple(colors[i % len(colors)] for i in range(n))
+
+
+def _fmt(value):
+    """Formats a median (a whole or half score) without a trailing .0."""
+    return f"{value:g}"
+
+
+# ====================== FINDINGS TEXT ======================
+# Why a platform sits at the top or bottom of the ranking; only shown when the store puts it there
+HIGH_PLATFORM_REASONS = {
+    "WhatsApp": "instant messaging encourages prolonged screen use through social pressure and FOMO (Fear of Missing Out)",
+    "Snapchat": "instant messaging encourages prolonged screen use through social pressure and FOMO (Fear of Missing Out)",
+    "TikTok": "short-form video keeps users engaged with infinite scroll and algorithm-driven content",
+}
+LOW_PLATFORM_REASONS = {
+    "LinkedIn": "likely due to its professional focus and lower social pressure dynamics",
+}
+# Share of the peak age's count an age needs to join the peak age range
+PEAK_AGE_SHARE = 0.5
+
+
+def _join(names):
+    return " and ".join(names) if len(names) <= 2 else ", ".join(names[:-1]) + " and " + names[-1]
+
+
+def platform_findings(platform_scores):
+    """Key-findings bullets for the platform chart, from (platform, mean score) pairs sorted high to low."""
+    if not platform_scores:
+        return []
+    top = [name for name, _ in platform_scores[:2]]
+    reasons = {HIGH_PLATFORM_REASONS[name] for name in top if name in HIGH_PLATFORM_REASONS}
+    reason = f": {reasons.pop()}" if len(reasons) == 1 else ""
+    findings = [f"<b>{_join(top)}</b> show the highest average addiction scores "
+                f"({platform_scores[len(top) - 1][1]:.2f}/10 and above){reason}."]
+    if len(platform_scores) > 2:
+        name, score = platform_scores[-1]
+        reason = f", {LOW_PLATFORM_REASONS[name]}" if name in LOW_PLATFORM_REASONS else ""
+        findings.append(f"<b>{name} is the least addictive</b> platform ({score:.2f}/10){reason}.")
+        ranks = {name: rank for rank, (name, _) in enumerate(platform_scores, start=1)}
+        if "TikTok" in ranks and 2 < ranks["TikTok"] < len(platform_scores):
+            findings.append(f"<b>Short-form video</b> (TikTok) ranks {ranks['TikTok']} of {len(platform_scores)} "
+                            f"at {dict(platform_scores)['TikTok']:.2f}/10.")
+    return findings
+
+
+def peak_age_range(age_labels, high_counts, share=PEAK_AGE_SHARE):
+    """Contiguous ages around the peak whose high-addiction count is at least `share` of the peak's."""
+    peak = high_counts.index(max(high_counts))
+    low = high = peak
+    while low > 0 and high_counts[low - 1] >= share * high_counts[peak]:
+        low -= 1
+    while high < len(high_counts) - 1 and high_counts[high + 1] >= share * high_counts[peak]:
+        high += 1
+    first, last = (age_labels[i].replace("Age ", "") for i in (low, high))
+    return f"Age {first}" if low == high else f"Ages {first}-{last}"
+
+
+# ====================== CACHED FIGURES ======================
+# Building a go.Figure validates every property (~10 ms per chart); these charts only
+# depend on constants, so each (data, theme) combination is built once per process and
+# shared by all sessions. st.plotly_chart only copies and serializes it (well under 1 ms).
+@st.cache_resource(show_spinner=False)
+def platform_addiction_chart(platforms, scores, colors, theme):
+    """Horizontal bar chart of average addiction score per platform."""
+    fig = go.Figure(go.Bar(
+        x=scores,
+        y=platforms,
+        orientation='h',
+        marker=dict(
+            color=colors,
+            line=dict(color='rgba(255,255,255,0.3)', width=2)
+        ),
+        text=[f"<b>{s}/10</b>" for s in scores],
+        textposition='auto',
+        textfont=dict(color='white', size=15, family='Arial Black'),
+        hovertemplate='<b>%{y}</b><br>Score: %{x}/10<extra></extra>'
+    ))
+
+    fig.update_layout(
+        paper_bgcolor=theme['background'],
+        plot_bgcolor=theme['background'],
+        height=500,
+        margin=dict(l=0, r=0, t=0, b=0),
+        xaxis=dict(
+            showgrid=True, 
+            gridcolor=theme['grid_color'],
+            visible=True, 
+            range=[0, 10],
+            title=dict(text="Addiction Score", font=dict(size=14, color=theme['axis_title_color']))
+        ),
+        yaxis=dict(
+            showgrid=False, 
+            tickfont=dict(size=15, color=theme['tick_color'], family=theme['font_family'], weight='bold')
+        ),
+        hoverlabel=dict(
+            bgcolor="white",
+            font_size=14,
+            font_family=theme['hover_font_family']
+        )
+    )
+    return fig
+
+
+@st.cache_resource(show_spinner=False)
+def age_distribution_chart(ages, counts, colors, theme):
+    """Horizontal bar chart of high-addiction student counts per age."""
+    fig_age = go.Figure(go.Bar(
+        x=counts,
+        y=ages,
+        orientation='h',
+        marker=dict(
+            color=colors,
+            line=dict(color='white', width=2)
+        ),
+        text=counts,
+        textposition='auto',  # Changed from 'outside' to 'auto' - will position inside if space, outside if not
+        textfont=dict(size=14, color=theme['tick_color'], family='Arial', weight='bold'),  # Increased size and ensured visibility
+        width=0.6,
+        hovertemplate='<b>%{y}</b><br>Count: %{x} students<extra></extra>'
+    ))
+
+    fig_age.update_layout(
+        paper_bgcolor=theme['background'],
+        plot_bgcolor=theme['background'],
+        height=400,
+        margin=dict(l=0, r=80, t=0, b=0),  # Increased right margin to accommodate outside text
+        xaxis=dict(
+            showgrid=True, 
+            gridcolor=theme['grid_color'], 
+            visible=True,
+            range=[0, max(counts) * 1.15]  # Extended range to ensure text fits
+        ),
+        yaxis=dict(showgrid=False, tickfont=dict(size=14, weight='bold')),
+        hoverlabel=dict(bgcolor="white", font_size=13)
+    )
+    return fig_age
+
+
+# ====================== 4. PAGE: INSIGHTS (ENHANCED WITH ANIMATIONS & INTERACTIVITY) ======================
+def render():
+    summary = cohort_summary()
+    platforms, platform_scores = zip(*summary['platform_scores'])
+    age_labels, high_counts = zip(*summary['age_high_counts'])
+    peak_age = age_labels[high_counts.index(max(high_counts))].replace("Age ", "")
+
+    # Header with enhanced styling
+    st.markdown("""
+    <div style='text-align:center; margin-bottom: 2rem;'>
+        <h1 class='gradient-text' style='font-size: 2.5rem; margin-bottom: 10px;'>Research Insights & Analytics</h1>
+        <p style='font-size: 1.1rem; color: #707EAE;'>Key findings from comprehensive analysis of {rows:,} students</p>
+        <div style='display: inline-block; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 8px 20px; border-radius: 20px; font-size: 0.9rem; margin-top: 10px;'>
+            📊 Based on ML-Powered Analysis
+        </div>
+    </div>
+    """.format(rows=summary['rows']), unsafe_allow_html=True)
+    
+    # TABS CONFIGURATION
+    tab1, tab2, tab3, tab4 = st.tabs(["📱 Platforms", "👥 Demographics", "⏰ Patterns", "🎯 Correlations"])
+
+    # ---------------- TAB 1: PLATFORMS (Enhanced) ----------------
+    with tab1:
+        st.markdown('<div class="content-box" style="border-top: 4px solid #4318FF;">', unsafe_allow_html=True)
+        st.markdown('<h3 class="section-header" style="color: #707EAE;">📊 Platform Addiction Rankings</h3>', unsafe_allow_html=True)
+        st.markdown("<p style='font-size: 1rem; margin-bottom: 25px; color: #707EAE;'>Average addiction scores (1-10) by primary social media platform</p>", unsafe_allow_html=True)
+        
+        perf.lap('page')
+        fig = platform_addiction_chart(platforms, platform_scores, _cycle(PLATFORM_COLORS, len(platforms)), CHART_THEME)
+        perf.lap('plotly_build')
+        
+        st.plotly_chart(fig, use_container_width=True)
+        perf.lap('plotly_render')
+        
+        findings = "".join(f"<li>{finding}</li>" for finding in platform_findings(summary['platform_scores']))
+        st.markdown(f"""
+            <div class="key-findings">
+                <b style="color: #2B3674; font-size: 1.15rem;">🔍 Key Findings:</b>
+                <ul style="margin-top: 15px; margin-bottom: 0; font-size: 0.95rem; color: #707EAE;">
+                    {findings}
+                </ul>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # ---------------- TAB 2: DEMOGRAPHICS (Enhanced) ----------------
+    with tab2:
+        col_l, col_r = st.columns([3, 2])
+        
+        with col_l:
+            st.markdown('<div class="content-box" style="border-top: 4px solid #667eea;">', unsafe_allow_html=True)
+            st.markdown('<h3 class="section-header" style="color: #707EAE;">👥 Age Distribution</h3>', unsafe_allow_html=True)
+            st.markdown("<p style='font-size:0.95rem; color: #707EAE;'>Count of students with High Addiction Scores (≥4) by age group</p>", unsafe_allow_html=True)
+            
+            perf.lap('page')
+            fig_age = age_distribution_chart(age_labels, high_counts, _cycle(AGE_COLORS, len(age_labels)), CHART_THEME)
+            perf.lap('plotly_build')
+            st.plotly_chart(fig_age, use_container_width=True)
+            perf.lap('plotly_render')
+            
+            st.markdown(f"""
+            <div style="background: linear-gradient(135deg, #E6FFFA 0%, #F0FFF4 100%); padding: 20px; border-radius: 12px; border-left: 5px solid #05CD99; box-shadow: 0 5px 15px rgba(0,0,0,0.05);">
+                <strong style="color:#05CD99; font-size: 1.15rem;">📊 Peak Risk Age: {peak_age} years old</strong><br>
+                <span style="font-size:0.95rem; color: #2B3674; margin-top: 10px; display: block;">{peak_age_range(age_labels, high_counts)} show the highest concentration of addicted users.</span>
+            </div>
+            </div>
+            """, unsafe_allow_html=True)
+
+        with col_r:
+            st.markdown('<div class="content-box" style="border-top: 4px solid #05CD99;">', unsafe_allow_html=True)
+            st.markdown('<h3 class="section-header">🎓 Academic Level Analysis</h3>', unsafe_allow_html=True)
+            st.markdown(f"<p style='font-size:0.95rem; color: #707EAE;'>Risk assessment by education level (ANOVA P-Value: {summary['academic_anova_p']:.5f})</p>", unsafe_allow_html=True)
+            
+            for level, avg, median in summary['academic_levels']:
+                card, tag, tag_text, color = ACADEMIC_STYLES.get(level, LOW_RISK_STYLE)
+                st.markdown(f"""
+                <div class="academic-card {card}">
+                    <span class="tag {tag}">{tag_text}</span>
+                    <b style="font-size: 1.1rem; color: #2B3674;">{level}</b>
+                    <div style="font-size:0.9rem; color:#707EAE; margin-top:10px;">
+                        <span style="font-weight: 600;">Avg: <span style="color: {color};">{avg}</span></span>
+                        <span style="float:right; font-weight: 600;">Median: <span style="color: {color};">{_fmt(median)}</span></span>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+
+            top_level, top_avg, _ = summary['academic_levels'][0]
+            st.markdown(f"""
+            <div style="background: linear-gradient(135deg, #F0F5FF 0%, #E6F7FF 100%); padding: 15px; border-radius: 10px; font-size: 0.9rem; color: #2B3674; border-left: 5px solid #4318FF; box-shadow: 0 5px 15px rgba(0,0,0,0.05);">
+                <b style="font-size: 1rem;">💡 Critical Finding:</b><br>
+                <span style="margin-top: 8px; display: block;">{top_level} students show the highest average addiction score ({top_avg}/10), indicating systemic vulnerability.</span>
+            </div>
+            </div>
+            """, unsafe_allow_html=True)
+
+    # ---------------- TAB 3: PATTERNS (Enhanced) ----------------
+    with tab3:
+        st.markdown('<div class="content-box" style="border-top: 4px solid #05CD99;">', unsafe_allow_html=True)
+        st.markdown('<h3 class="section-header" style="color: #707EAE;">🕑 Usage Patterns & Lifestyle Metrics</h3>', unsafe_allow_html=True)
+        st.markdown("<p style='margin-bottom:30px; font-size: 1rem; color: #707EAE;'>Average student behavioral profile from the dataset</p>", unsafe_allow_html=True)
+        
+        m1, m2, m3 = st.columns(3)
+        with m1:
+            st.markdown(f"""
+            <div class="metric-box mb-blue">
+                <p class="mb-val">{summary['usage_mean']:.1f}</p>
+                <p class="mb-label">Hours Daily Usage</p>
+                <p class="mb-desc">Standard deviation: ±{summary['usage_std']:.2f} hrs</p>
+            </div>
+            """, unsafe_allow_html=True)
+        with m2:
+            st.markdown(f"""
+            <div class="metric-box mb-purple">
+                <p class="mb-val">{summary['sleep_mean']:.1f}</p>
+                <p class="mb-label">Hours Sleep/Night</p>
+                <p class="mb-desc">Below recommended 7-9 hours</p>
+            </div>
+            """, unsafe_allow_html=True)
+        with m3:
+            st.markdown(f"""
+            <div class="metric-box mb-green">
+                <p class="mb-val">{summary['addicted_mean']:.1f}<span style="font-size: 1.5rem;">/10</span></p>
+                <p class="mb-label">Avg Addiction Score</p>
+                <p class="mb-desc">Median score is {_fmt(summary['addicted_median'])}/10</p>
+            </div>
+            """, unsafe_allow_html=True)
+            
+        st.markdown("<br><h4 style='color:#2B3674; font-size: 1.3rem; margin-top: 30px; margin-bottom: 20px;'>🔍 Behavioral Insights:</h4>", unsafe_allow_html=True)
+        
+        g1, g2 = st.columns(2)
+        with g1:
+            st.markdown(f"""
+            <div class="insight-mini-card" style="border-left: 5px solid #05CD99;">
+                <b style='color:#2B3674; font-size: 1.05rem;'>😴 Sleep Deficit Risk</b><br>
+                <span style="font-size:0.9rem; color:#707EAE; margin-top: 8px; display: block;">{summary['short_sleep_share']:.0%} of students report sleeping 6 hours or less per night, creating a vicious cycle of fatigue and increased screen time.</span>
+            </div>
+            <div class="insight-mini-card" style="border-left: 5px solid #667eea;">
+                <b style='color:#2B3674; font-size: 1.05rem;'>⚡ Conflicts & Toxicity</b><br>
+                <span style="font-size:0.9rem; color:#707EAE; margin-top: 8px; display: block;">Average conflict score is {summary['conflicts_mean']:.2f}/5, indicating moderate social media-induced stress and interpersonal friction.</span>
+            </div>
+            """, unsafe_allow_html=True)
+        with g2:
+            st.markdown("""
+            <div class="insight-mini-card" style="border-left: 5px solid #4318FF;">
+                <b style='color:#2B3674; font-size: 1.05rem;'>🧠 Stress-Addiction Link</b><br>
+                <span style="font-size:0.9rem; color:#707EAE; margin-top: 8px; display: block;">High stress is a key predictor, correlating with compensatory usage patterns as a coping mechanism.</span>
+            </div>
+            <div class="insight-mini-card" style="border-left: 5px solid #9299F5;">
+                <b style='color:#2B3674; font-size: 1.05rem;'>📊 Demographic Nuance</b><br>
+                <span style="font-size:0.9rem; color:#707EAE; margin-top: 8px; display: block;">Gender and Relationship Status have zero statistical effect on addiction intensity (ANOVA P > 0.05), indicating universal susceptibility.</span>
+            </div>
+            """, unsafe_allow_html=True)
+        st.markdown("</div>", unsafe_allow_html=True)
+
+    # ---------------- TAB 4: CORRELATIONS (Enhanced) ----------------
+    with tab4:
+        st.markdown('<div class="content-box" style="border-top: 4px solid #4318FF;">', unsafe_allow_html=True)
+        st.markdown('<h3 class="section-header" style="color: #707EAE;">📈 Model Performance & Feature Importance</h3>', unsafe_allow_html=True)
+        st.markdown("<p style='font-size: 1rem; color: #707EAE; margin-bottom: 30px;'>Key model results and predictor relationships from final analysis.</p>", unsafe_allow_html=True)
+        
+        
+        st.markdown("<h4 style='color: #2B3674; font-size: 1.4rem; margin-bottom: 20px;'>🎯 Key Predictors of Addiction Risk (Random Forest Top 3)</h4>", unsafe_allow_html=True)
+        
+        # Enhanced feature importance boxes
+        st.markdown("""
+        <div style="margin-bottom: 30px;">
+            <div class="feature-item-box bg-blue-1">
+                <span class="feature-title-text">🥇 1. Avg Daily Usage Hours (~35.4%)</span>
+                <div class="feature-description">
+                    The single most important predictor. High usage is the primary driver of dependency and is strongly correlated with other negative behavioral factors including sleep deficit and mental health decline.
+                </div>
+            </div>
+            <div class="feature-item-box bg-blue-2">
+                <span class="feature-title-text">🥈 2. Mental Health Score (~28.3%)</span>
+                <div class="feature-description">
+                    Low scores are a highly significant factor, often leading to compensatory social media usage to cope with stress, anxiety, or depression—creating a reinforcing cycle.
+                </div>
+            </div>
+            <div class="feature-item-box bg-green-1">
+                <span class="feature-title-text">🥉 3. Sleep Hours/Night (~24.8%)</span>
+                <div class="feature-description">
+                    Low sleep quality is a major indicator, showing that social media usage frequently infringes on rest time. Late-night scrolling disrupts circadian rhythms and productivity.
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        
+        st.markdown("<h4 style='color: #2B3674; font-size: 1.4rem; margin-bottom: 20px;'>📊 Visual Feature Importance Ranking</h4>", unsafe_allow_html=True)
+        
+        try:
+            st.image(image_asset(FEATURE_IMPORTANCE_PATH), caption="Visual Ranking of Predictors by Random Forest Model",
+                     use_container_width=True, output_format=asset_format(FEATURE_IMPORTANCE_PATH))
+        except FileNotFoundError:
+            st.info("💡 To complete this section, please create and save your model's Feature Importance plot as **'feature_importance.png'** in the app directory.")
+
+        st.write("")
+        st.markdown("<h4 style='color: #2B3674; font-size: 1.4rem; margin-bottom: 20px; margin-top: 30px;'>🏆 Model Performance Summary</h4>", unsafe_allow_html=True)
+        
+        m1, m2, m3 = st.columns(3)
+        with m1:
+            st.markdown("""
+            <div class="model-card">
+                <div style="font-size:2.5rem; font-weight:900; background: linear-gradient(135deg, #4318FF 0%, #667eea 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent;">100%</div>
+                <div style="font-weight:bold; font-size: 1.1rem; color: #2B3674; margin-top: 10px;">Logistic Regression</div>
+                <div style="font-size:0.85rem; color: #707EAE; margin-top: 5px;">Tuned / Test Accuracy</div>
+                <div style="margin-top: 15px; padding: 8px; background: #F0F5FF; border-radius: 8px; font-size: 0.8rem; color: #4318FF;">
+                    <b>Best for:</b> Interpretability
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+        with m2:
+            st.markdown("""
+            <div class="model-card" style="border: 3px solid #667eea; background: linear-gradient(135deg, #ffffff 0%, #f0f5ff 100%);">
+                <div style="font-size:2.5rem; font-weight:900; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent;">92.0%</div>
+                <div style="font-weight:bold; font-size: 1.1rem; color: #2B3674; margin-top: 10px;">Random Forest ⭐</div>
+                <div style="font-size:0.85rem; color: #707EAE; margin-top: 5px;">Tuned / Test Accuracy</div>
+                <div style="margin-top: 15px; padding: 8px; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); border-radius: 8px; font-size: 0.8rem; color: white; font-weight: bold;">
+                    ✓ SELECTED MODEL
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+        with m3:
+            st.markdown("""
+            <div class="model-card">
+                <div style="font-size:2.5rem; font-weight:900; background: linear-gradient(135deg, #05CD99 0%, #00B386 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent;">98.5%</div>
+                <div style="font-weight:bold; font-size: 1.1rem; color: #2B3674; margin-top: 10px;">Gradient Boosting</div>
+                <div style="font-size:0.85rem; color: #707EAE; margin-top: 5px;">Tuned / Test Accuracy</div>
+                <div style="margin-top: 15px; padding: 8px; background: #E6FFFA; border-radius: 8px; font-size: 0.8rem; color: #05CD99;">
+                    <b>Risk:</b> Overfitting
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+            
+        # Enhanced final model selection rationale
+        st.markdown("""
+        <div style="background: linear-gradient(135deg, #F8F9FA 0%, #E9ECEF 100%); padding: 25px; border-radius: 15px; margin-top: 30px; border-left: 5px solid #667eea; box-shadow: 0 8px 25px rgba(0,0,0,0.08);">
+            <h4 style='color:#2B3674; font-size: 1.3rem; margin-bottom: 15px;'>🎯 Final Model Selection: Random Forest (92.0% Accuracy)</h4>
+            <div style="background: white; padding: 20px; border-radius: 10px; margin-top: 15px;">
+                <p style="color: #2B3674; font-size: 1rem; margin-bottom: 15px; line-height: 1.7;">
+                    The <b>Random Forest model</b> was selected for deployment based on its optimal balance of accuracy, generalizability, and robustness. Here's why:
+                </p>
+                <ul style="font-size: 0.95rem; color: #707EAE; margin-bottom:0; line-height: 1.8;">
+                    <li><b>High Generalizable Accuracy:</b> 92.00% test accuracy demonstrates strong predictive power without overfitting (vs. Gradient Boosting's 98.5% which showed signs of overfitting on validation data).</li>
+                    <li><b>Top 5 Critical Features:</b> <code style="background: #F0F5FF; padding: 2px 6px; border-radius: 4px; color: #4318FF;">avg_daily_usage_hours</code>, <code style="background: #F0F5FF; padding: 2px 6px; border-radius: 4px; color: #4318FF;">mental_health_score</code>, <code style="background: #F0F5FF; padding: 2px 6px; border-radius: 4px; color: #4318FF;">sleep_hours_per_night</code>, <code style="background: #F0F5FF; padding: 2px 6px; border-radius: 4px; color: #4318FF;">conflicts_over_social_media</code>, and <code style="background: #F0F5FF; padding: 2px 6px; border-radius: 4px; color: #4318FF;">affects_academic_performance_Yes</code>.</li>
+                    <li><b>Multicollinearity Resolved:</b> VIF analysis eliminated feature redundancy, reducing VIF from 10.6 to 3.4 for cleaner predictions.</li>
+                    <li><b>Cluster Validation:</b> K-Means clustering identified 2 distinct risk segments (High Risk: 384 students, Low Risk: 321 students), confirming binary classification validity.</li>
+                    <li><b>Feature Pruning:</b> Removed statistically insignificant features (gender, relationship status) with ANOVA P > 0.05, improving model efficiency.</li>
+                    <li><b>Robustness:</b> Ensemble learning approach reduces variance and handles feature noise better than single-tree models.</li>
+                </ul>
+            </div>
+            <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 15px; border-radius: 10px; margin-top: 15px; text-align: center;">
+                <span style="color: white; font-size: 0.95rem; font-weight: 600;">
+                    💡 This model powers the real-time risk assessment in the <b>Assessment</b> and <b>What-If Simulator</b> pages
+                </span>
+            </div>
+        </div>
+        </div>
+        """, unsafe_allow_html=True)
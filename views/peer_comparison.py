@@ -0,0 +1,255 @@
+"""
+Peer Comparison page.
+"""
+import os
+
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+import perf
+import serving
+from peer_index import PEER_INDEX_PATH, load_peer_index, percentile_rank
+from risk_table import file_fingerprint
+from similar_students import SCORE_COLUMN, SIMILAR_STUDENTS_PATH, load_similar_students
+
+# Study Averages (from notebook data), used when no peer index has been built
+NOTEBOOK_AVERAGES = {'usage': 4.9, 'sleep': 6.9, 'mental': 6.4}
+# How many "students like you" to show
+SIMILAR_STUDENT_COUNT = 25
+
+
+# ====================== PEER INDEX ======================
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _cached_peer_index(path, mtime_ns, model_path, model_loaded, model_mtime_ns):
+    fingerprint = file_fingerprint(model_path) if model_loaded else None
+    return load_peer_index(path, fingerprint)
+
+
+def peer_index(path=PEER_INDEX_PATH):
+    """
+    The memory-mapped cohort index (build it with `python peer_index.py`) and its metadata,
+    loaded once per process and per file version; (None, None) when there is none.
+    """
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None, None
+    model_loaded = serving.model is not None
+    model_mtime_ns = os.stat(serving.MODEL_PATH).st_mtime_ns if model_loaded else None
+    return _cached_peer_index(path, mtime_ns, serving.MODEL_PATH, model_loaded, model_mtime_ns)
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def _cached_similar_students(path, mtime_ns):
+    return load_similar_students(path)
+
+
+def similar_students(path=SIMILAR_STUDENTS_PATH):
+    """
+    The cohort KD-tree (build the file with `python similar_students.py`), built once per
+    process and per file version and shared by every session; None when there is none.
+    """
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+    return _cached_similar_students(path, mtime_ns)
+
+
+def _ordinal(n):
+    suffix = 'th' if 10 <= n % 100 <= 20 else {1: 'st', 2: 'nd', 3: 'rd'}.get(n % 10, 'th')
+    return f"{n}{suffix}"
+
+
+def percentile_status(percentile, metric, is_higher_better):
+    """One summary line for a percentile rank (share of the cohort below the user's value)."""
+    rank = _ordinal(int(round(percentile)))
+    riskier = percentile < 50 if is_higher_better else percentile > 50
+    verdict = "Riskier" if riskier else "Healthier"
+    if abs(percentile - 50) < 5:
+        return f"<b>{metric}:</b> Similar to most peers (**{rank}** percentile)."
+    return f"<b>{metric}:</b> **{rank}** percentile - higher than {percentile:.0f}% of students ({verdict})."
+
+
+# ====================== 9. PAGE: PEER COMPARISON (UPDATED) ======================
+def render():
+    st.markdown("<h2 class='gradient-text'>Peer Comparison & Risk Profiling</h2>", unsafe_allow_html=True)
+    index, index_meta = peer_index()
+    cohort_size = index_meta['rows'] if index is not None else 705
+    st.markdown(f"<p>See how your core lifestyle metrics compare to the average student in the {cohort_size:,}-person study cohort.</p>", unsafe_allow_html=True)
+
+    # Safely retrieve values from session state, defaulting to average if assessment wasn't run
+    current_usage = st.session_state.get('assessment_usage', 5.0)
+    current_sleep = st.session_state.get('assessment_sleep', 7.0)
+    current_mental = st.session_state.get('assessment_mental', 6)
+    
+    # Cohort averages from the peer index, or the notebook's when there is none
+    averages = index_meta['means'] if index is not None else NOTEBOOK_AVERAGES
+    avg_usage = round(averages['usage'], 1)
+    avg_sleep = round(averages['sleep'], 1)
+    avg_mental = round(averages['mental'], 1)
+    
+    # --- 1. DATA FOR GROUPED BAR CHART ---
+    # Metrics: We use the raw values for the bars, not the scaled/normalized values
+    metrics = ['Daily Usage (Hours)', 'Sleep (Hours)', 'Mental Health (Score)']
+    
+    comparison_data = pd.DataFrame({
+        'Metric': metrics,
+        'Your Profile': [current_usage, current_sleep, current_mental],
+        'Average Student': [avg_usage, avg_sleep, avg_mental]
+    })
+    
+    # Melt the data for Plotly Grouped Bar Chart structure
+    df_plot = comparison_data.melt(id_vars='Metric', var_name='Profile', value_name='Value')
+
+    # Create Grouped Bar Chart
+    perf.lap('page')
+    fig_bar = px.bar(
+        df_plot,
+        x='Value',
+        y='Metric',
+        color='Profile',
+        orientation='h',
+        barmode='group',
+        color_discrete_map={
+            'Your Profile': '#4318FF',
+            'Average Student': '#05CD99'
+        },
+        height=350,
+        text='Value'
+    )
+
+    # Customize the chart layout
+    fig_bar.update_traces(
+        texttemplate='%{text:.1f}', 
+        textposition='outside'
+        # Removed marker_corner_radius=5 which was causing the ValueError
+    )
+    fig_bar.update_layout(
+        xaxis_title="Score/Hours (Raw Value)",
+        yaxis_title=None,
+        legend_title=None,
+        legend=dict(orientation="h", y=1.1, yanchor="top", x=0.5, xanchor="center"),
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,1)',
+        margin=dict(l=0, r=50, t=20, b=20) # Add margin to the right for text display
+    )
+    perf.lap('plotly_build')
+    
+    col_chart, col_summary = st.columns([3, 2])
+    
+    with col_chart:
+        st.markdown('<div class="content-box">', unsafe_allow_html=True)
+        st.subheader("Raw Metric Comparison")
+        perf.lap('page')
+        st.plotly_chart(fig_bar, use_container_width=True)
+        perf.lap('plotly_render')
+        st.markdown('</div>', unsafe_allow_html=True)
+
+    with col_summary:
+        st.markdown('<div class="content-box" style="height: 100%;">', unsafe_allow_html=True)
+        st.subheader("Deviation Summary")
+        
+        # Calculate Deviation
+        usage_dev = current_usage - avg_usage
+        sleep_dev = current_sleep - avg_sleep
+        mental_dev = current_mental - avg_mental
+        
+        # Generate Status Messages
+        def get_status(dev, metric, is_higher_better):
+            if abs(dev) < 0.1:
+                return f"<b>{metric}:</b> Similar to peers."
+            
+            if is_higher_better:
+                if dev > 0:
+                    return f"<b>{metric}:</b> **{abs(dev):.1f}** points/hours higher (Healthier)."
+                else:
+                    return f"<b>{metric}:</b> **{abs(dev):.1f}** points/hours lower (Riskier)."
+            else: # Lower value is better (Usage)
+                if dev < 0:
+                    return f"<b>{metric}:</b> **{abs(dev):.1f}** hours lower (Healthier)."
+                else:
+                    return f"<b>{metric}:</b> **{abs(dev):.1f}** hours higher (Riskier)."
+
+        if index is not None:
+            # Percentile ranks against the whole cohort (binary searches in the sorted index)
+            status_messages = [
+                percentile_status(percentile_rank(index, 'usage', current_usage), "Daily Usage", is_higher_better=False),
+                percentile_status(percentile_rank(index, 'sleep', current_sleep), "Sleep Hours", is_higher_better=True),
+                percentile_status(percentile_rank(index, 'mental', current_mental), "Mental Health Score", is_higher_better=True)
+            ]
+            current_risk = st.session_state.get('assessment_risk')
+            if current_risk is not None and index_meta['risk_valid']:
+                status_messages.append(
+                    percentile_status(percentile_rank(index, 'risk', current_risk), "Risk Score", is_higher_better=False))
+        else:
+            status_messages = [
+                get_status(usage_dev, "Daily Usage", is_higher_better=False),
+                get_status(sleep_dev, "Sleep Hours", is_higher_better=True),
+                get_status(mental_dev, "Mental Health Score", is_higher_better=True)
+            ]
+            
+        st.markdown("<p style='font-size:0.95rem;'>Your assessment profile in detail:</p>", unsafe_allow_html=True)
+        
+        for msg in status_messages:
+            # Need to re-bold the status messages using HTML
+            styled_msg = msg.replace('**', '<span style="font-weight: bold;">')
+            styled_msg = styled_msg.replace('**', '</span>')
+            st.markdown(f"<p style='margin-bottom: 5px; font-size: 0.9rem;'>{styled_msg}</p>", unsafe_allow_html=True)
+        
+        st.markdown("<hr>", unsafe_allow_html=True)
+        st.markdown(f"""
+        <p style='font-size:0.85rem; color:#4318FF;'>
+        💡 Insight: The bar chart shows your raw score/hours. Remember that high Usage and low Sleep/Mental Health contribute negatively to your overall risk score.
+        </p>
+        """, unsafe_allow_html=True)
+        st.markdown('</div>', unsafe_allow_html=True)
+
+    # --- 2. STUDENTS LIKE YOU (nearest neighbours on the seven model features) ---
+    neighbours_index = similar_students()
+    if neighbours_index is None:
+        return
+    profile = {
+        'usage': current_usage,
+        'sleep': current_sleep,
+        'mental': current_mental,
+        'stress': st.session_state.get('assessment_stress', 6),
+        'academic': st.session_state.get('assessment_academic', "Undergraduate"),
+        'late_night': st.session_state.get('assessment_late_night', False),
+        'fomo': st.session_state.get('assessment_fomo', False),
+    }
+    perf.lap('page')
+    neighbours = neighbours_index.query(profile, SIMILAR_STUDENT_COUNT)
+    perf.lap('similar_students')
+    scores = neighbours[SCORE_COLUMN].round().astype(int)
+    distribution = scores.value_counts().reindex(range(scores.min(), scores.max() + 1), fill_value=0)
+
+    st.markdown('<div class="content-box">', unsafe_allow_html=True)
+    st.subheader("👥 Students Like You")
+    st.markdown(f"<p style='font-size:0.95rem;'>The {len(neighbours)} students in the cohort whose usage, sleep, mental health, conflicts, academic level and habits are closest to yours, and how addicted they reported being.</p>", unsafe_allow_html=True)
+
+    col_dist, col_stats = st.columns([3, 2])
+    with col_dist:
+        fig_dist = go.Figure(go.Bar(
+            x=distribution.index,
+            y=distribution.values,
+            marker=dict(color='#4318FF'),
+            hovertemplate='Addiction score %{x}: %{y} students<extra></extra>'
+        ))
+        fig_dist.update_layout(
+            xaxis_title="Addiction Score",
+            yaxis_title="Students",
+            height=300,
+            plot_bgcolor='rgba(0,0,0,0)',
+            paper_bgcolor='rgba(0,0,0,1)',
+            margin=dict(l=0, r=20, t=20, b=20)
+        )
+        st.plotly_chart(fig_dist, use_container_width=True)
+        perf.lap('plotly_render')
+    with col_stats:
+        st.metric("Average Addiction Score", f"{scores.mean():.1f}/10")
+        st.metric("Median Addiction Score", f"{scores.median():g}/10")
+        st.metric("Scored 7 or Higher", f"{(scores >= 7).mean():.0%}")
+    st.markdown('</div>', unsafe_allow_html=True)
@@ -0,0 +1,39 @@
+"""
+Recommendations page.
+"""
+import streamlit as st
+
+from recommendations import build_recommendations
+
+
+# ====================== 8. RECOMMENDATIONS & PEER COMPARISON ======================
+def render():
+    st.markdown("<h2 class='gradient-text'>Your Wellness Plan</h2>", unsafe_allow_html=True)
+    
+    # --- RECOMMENDATION LOGIC ---
+    # Safely retrieve values from session state, defaulting to average if assessment wasn't run
+    current_usage = st.session_state.get('assessment_usage', 5.0)
+    current_sleep = st.session_state.get('assessment_sleep', 7.0)
+    current_mental = st.session_state.get('assessment_mental', 6)
+    
+    # Usage / sleep / mental health rules live in recommendations.py (shared with batch scoring)
+    recommendations_list = build_recommendations(current_usage, current_sleep, current_mental)
+
+    if not recommendations_list:
+        st.success("🎉 You are currently in the **Low Risk Zone!** Continue maintaining healthy usage (<4 hours), good sleep (>7.5 hours), and high mental health (>7).")
+    else:
+        # Display recommendations
+        st.markdown(f"""
+        <div class="content-box">
+            <h3 style="color: #2B3674;">Top Actionable Steps Based on Your Profile</h3>
+        """, unsafe_allow_html=True)
+
+        for rec in recommendations_list:
+            st.markdown(f"""
+            <div style="background: #f9fbfc; padding: 15px; border-left: 4px solid {rec['color']}; margin: 10px 0;">
+                <b style='color:#2B3674;'>{rec['title']}</b>
+                <br><span style="color: #707EAE; font-weight:normal; font-size: 0.9rem;">{rec['detail']}</span>
+            </div>
+            """, unsafe_allow_html=True)
+            
+        st.markdown('</div>', unsafe_allow_html=True)
@@ -0,0 +1,238 @@
+"""
+What-If Simulator page.
+"""
+import numpy as np
+import plotly.graph_objects as go
+import streamlit as st
+
+import perf
+from serving import predict_risk_score, predict_risk_surface, suggest_habit_changes
+
+# Slider ranges (start, stop, step); the risk surface covers every slider position
+USAGE_RANGE = (1.0, 8.0, 0.5)
+SLEEP_RANGE = (6.0, 10.0, 0.5)
+USAGE_VALUES = tuple(np.arange(USAGE_RANGE[0], USAGE_RANGE[1] + USAGE_RANGE[2] / 2, USAGE_RANGE[2]))
+SLEEP_VALUES = tuple(np.arange(SLEEP_RANGE[0], SLEEP_RANGE[1] + SLEEP_RANGE[2] / 2, SLEEP_RANGE[2]))
+SURFACE_COLORSCALE = [[0.0, '#05CD99'], [0.5, '#5A7DFF'], [1.0, '#4318FF']]
+MODES = ["🎚️ Adjust My Habits", "🎯 Reach a Target Score"]
+
+
+def _change_text(option, usage, sleep, late_night):
+    """Human-readable list of the changes in one optimizer option."""
+    changes = []
+    if option['usage'] < usage:
+        changes.append(f"cut usage to <b>{option['usage']:.1f} h</b> (−{usage - option['usage']:.1f} h)")
+    if option['sleep'] > sleep:
+        changes.append(f"sleep <b>{option['sleep']:.1f} h</b> (+{option['sleep'] - sleep:.1f} h)")
+    if late_night and not option['late_night']:
+        changes.append("<b>stop late-night use</b>")
+    return ", ".join(changes) if changes else "no change needed"
+
+
+def render_target_mode(usage, sleep, mental, stress, academic, late_night, fomo):
+    """Target mode: the smallest usage/sleep/late-night changes that reach a chosen risk score."""
+    st.markdown('<div class="content-box">', unsafe_allow_html=True)
+    current_risk = predict_risk_score(usage, sleep, mental, stress, academic, late_night, fomo)
+    st.markdown(f"**Baseline:** {usage:.1f} h usage, {sleep:.1f} h sleep → risk **{current_risk}/10**")
+    if current_risk <= 1:
+        st.success("🎉 Your baseline is already at the lowest risk score.")
+        st.markdown('</div>', unsafe_allow_html=True)
+        return
+
+    if current_risk - 1 > 1:
+        target = st.slider("Bring my risk score down to...", 1, current_risk - 1, max(1, current_risk - 2), 1, key='what_if_target')
+    else:
+        # Only one lower score is possible, and a slider needs min < max
+        target = 1
+        st.caption("Target: risk score **1/10**, the only score below your baseline.")
+    allow_late_night = True
+    if late_night:
+        allow_late_night = st.checkbox("I could give up late-night use", value=True, key='what_if_allow_late_night')
+
+    perf.lap('page')
+    options = suggest_habit_changes(usage, sleep, mental, stress, academic, late_night, fomo, target, allow_late_night)
+    perf.lap('habit_optimizer')
+
+    if not options:
+        st.warning(f"No combination of usage (down to 1 h), sleep (up to 10 h) and late-night habits reaches {target}/10 on its own. Try a higher target, or work on stress and mental health too.")
+    else:
+        st.markdown(f"##### Smallest Changes to Reach {target}/10")
+        for rank, option in enumerate(options, start=1):
+            st.markdown(f"""
+            <div style="background: #f9fbfc; padding: 15px; border-left: 4px solid {'#05CD99' if rank == 1 else '#5A7DFF'}; margin: 10px 0;">
+                <b style='color:#2B3674;'>Option {rank}: risk {option['risk']}/10</b>
+                <br><span style="color: #707EAE; font-weight:normal; font-size: 0.9rem;">{_change_text(option, usage, sleep, late_night).capitalize()}.</span>
+            </div>
+            """, unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+
+def _grid_index(value, values):
+    """Position of `value` on a slider grid, or None if it falls between steps."""
+    matches = np.flatnonzero(np.isclose(values, value))
+    return int(matches[0]) if len(matches) else None
+
+
+# ====================== 7. WHAT-IF SIMULATOR (UPDATED LOGIC) ======================
+def render():
+    st.markdown("<h2 class='gradient-text'>Habit Simulator</h2>", unsafe_allow_html=True)
+    
+    # Determine whether an assessment has been run and set baseline risk accordingly
+    assessment_present = ('assessment_risk' in st.session_state and st.session_state.get('assessment_risk') is not None)
+    # If no assessment run yet, baseline should be 0 and UI should prompt user to run the assessment
+    baseline_risk = st.session_state.get('assessment_risk') if assessment_present else 0
+
+    # Get other required baseline features (for model consistency) with safe defaults
+    baseline_stress = st.session_state.get('assessment_stress', None)
+    if baseline_stress is None:
+        baseline_stress = 6
+    baseline_academic = st.session_state.get('assessment_academic', "Undergraduate")
+    baseline_late_night = st.session_state.get('assessment_late_night', False)
+    baseline_fomo = st.session_state.get('assessment_fomo', False)
+    baseline_mental = st.session_state.get('assessment_mental', None)
+    if baseline_mental is None:
+        baseline_mental = 6
+    
+    if assessment_present:
+        st.info(f"Your **Current Risk Score** is **{baseline_risk}/10** (Based on your last Assessment).")
+    else:
+        st.info("Your **Current Risk Score** is **0/10**. Run the 'Predict My Risk' assessment to generate a personalized baseline.")
+
+    mode = st.radio("Mode", MODES, horizontal=True, key='what_if_mode', label_visibility="collapsed")
+    if mode == MODES[1]:
+        render_target_mode(
+            st.session_state.get('assessment_usage', 5.0),
+            st.session_state.get('assessment_sleep', 7.0),
+            baseline_mental, baseline_stress, baseline_academic, baseline_late_night, baseline_fomo
+        )
+        return
+    
+    with st.container():
+        st.markdown('<div class="content-box">', unsafe_allow_html=True)
+        col1, col2 = st.columns(2)
+        with col1:
+            current_usage_display = st.session_state.get('assessment_usage', 5.0)
+            st.markdown(f"**Baseline Usage:** {current_usage_display:.1f} hours")
+            # Use state for initial value (synced from Assessment)
+            new_usage = st.slider(
+                "If I reduce daily usage to...", 1.0, 8.0,
+                float(st.session_state.get('what_if_usage', current_usage_display)),
+                0.5, key='what_if_usage')
+        with col2:
+            current_sleep_display = st.session_state.get('assessment_sleep', 7.0)
+            st.markdown(f"**Baseline Sleep:** {current_sleep_display:.1f} hours")
+            # Use state for initial value (synced from Assessment)
+            new_sleep = st.slider(
+                "And increase sleep to...", 6.0, 10.0,
+                float(st.session_state.get('what_if_sleep', current_sleep_display)),
+                0.5, key='what_if_sleep')
+        
+        # Score the whole usage x sleep grid for this baseline once (cached), then read the slider point from it
+        surface = predict_risk_surface(
+            USAGE_VALUES, SLEEP_VALUES,
+            mental=baseline_mental,
+            stress=baseline_stress,
+            academic=baseline_academic,
+            late_night=baseline_late_night,
+            fomo=baseline_fomo
+        )
+        perf.lap('risk_surface')
+        usage_index = _grid_index(new_usage, USAGE_VALUES)
+        sleep_index = _grid_index(new_sleep, SLEEP_VALUES)
+        if usage_index is not None and sleep_index is not None:
+            simulated_risk = int(surface[sleep_index, usage_index])
+        else:
+            # Slider still at an off-step value synced from Assessment
+            simulated_risk = predict_risk_score(
+                usage=new_usage, 
+                sleep=new_sleep, 
+                mental=baseline_mental, 
+                stress=baseline_stress, 
+                academic=baseline_academic, 
+                late_night=baseline_late_night, 
+                fomo=baseline_fomo
+            )
+        # Ensure simulated_risk is numeric and fallback to baseline if prediction failed
+        try:
+            simulated_risk = float(simulated_risk)
+        except Exception:
+            simulated_risk = float(baseline_risk)
+
+        # Calculate absolute change (baseline - simulated)
+        risk_change_absolute = float(baseline_risk) - float(simulated_risk)
+
+        # If assessment hasn't been run, do not calculate or display percentage reduction
+        if not assessment_present or baseline_risk == 0:
+            # Prompt the user to run the assessment to get a personalized estimate
+            risk_reduction_percentage = None
+            message_html = "<p style='color:#4318FF; font-weight:bold;'>Run the 'Predict My Risk' assessment to see estimated risk reductions from habit changes.</p>"
+        else:
+            # Calculate percentage change for display (max 100% reduction)
+            if risk_change_absolute > 0:
+                # Risk reduced
+                risk_reduction_percentage = min(100, int((risk_change_absolute / baseline_risk) * 100))
+                message_html = f"<p style='color:#05CD99; font-weight:bold;'>🎉 Estimated Risk Reduction: {risk_reduction_percentage}%</p>"
+            else:
+                # Risk increased or no change
+                message_html = f"<p style='color:#4318FF; font-weight:bold;'>⚠️ Estimated Risk Change: {abs(risk_change_absolute)} points.</p>"
+
+        col_res, col_chart = st.columns([1, 1])
+        
+        with col_res:
+            st.markdown("##### Simulation Result")
+            # Show delta only when assessment baseline exists
+            if assessment_present and baseline_risk != 0:
+                st.metric(label="Projected Score", value=f"{simulated_risk}/10", delta=risk_change_absolute)
+            else:
+                st.metric(label="Projected Score", value=f"{simulated_risk}/10")
+            st.markdown(message_html, unsafe_allow_html=True)
+
+        with col_chart:
+            st.markdown("##### Projected 24-Hour Routine")
+            # Pie chart colors updated for blue/green compliance
+            perf.lap('page')
+            fig = go.Figure(go.Pie(
+                labels=["Sleep", "Social Media", "Productivity", "Leisure"],
+                values=[new_sleep, new_usage, 8, 24-new_sleep-new_usage-8],
+                hole=0.7,
+                marker_colors=['#4318FF', '#5A7DFF', '#00D2AA', '#E6E8EC'],
+                textinfo='label+percent'
+            ))
+            fig.update_layout(showlegend=False, margin=dict(l=20, r=20, t=10, b=10))
+            perf.lap('plotly_build')
+            st.plotly_chart(fig, use_container_width=True)
+            perf.lap('plotly_render')
+            
+        # Full risk surface with the current slider position marked
+        st.markdown("##### Risk Map: Every Usage & Sleep Combination")
+        st.markdown("<p style='font-size:0.9rem; color:#707EAE;'>Projected risk score for each combination, keeping your other answers fixed. ✖ marks your current sliders.</p>", unsafe_allow_html=True)
+        perf.lap('page')
+        fig_surface = go.Figure(go.Heatmap(
+            z=surface,
+            x=USAGE_VALUES,
+            y=SLEEP_VALUES,
+            zmin=1,
+            zmax=10,
+            colorscale=SURFACE_COLORSCALE,
+            colorbar=dict(title="Risk"),
+            hovertemplate='Usage %{x}h, Sleep %{y}h<br>Risk: %{z}/10<extra></extra>'
+        ))
+        fig_surface.add_trace(go.Scatter(
+            x=[new_usage],
+            y=[new_sleep],
+            mode='markers',
+            marker=dict(symbol='x', size=16, color='white', line=dict(color='#2B3674', width=2)),
+            hoverinfo='skip',
+            showlegend=False
+        ))
+        fig_surface.update_layout(
+            height=380,
+            margin=dict(l=0, r=0, t=10, b=0),
+            xaxis_title="Daily Usage (hours)",
+            yaxis_title="Sleep (hours)"
+        )
+        perf.lap('plotly_build')
+        st.plotly_chart(fig_surface, use_container_width=True)
+        perf.lap('plotly_render')
+
+        st.markdown('</div>', unsafe_allow_html=True)
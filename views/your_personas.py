@@ -0,0 +1,103 @@
+"""
+Your Personas page.
+"""
+import os
+
+import streamlit as st
+
+from personas import PERSONA_MODEL_PATH, addiction_stand_in, load_persona_model, persona_for_profile, persona_profiles
+
+# Card colour and position of each centroid in the risk ordering (personas.py sorts centroids by overall risk)
+PERSONA_CARDS = {
+    "Casual": ("Casual Scroller", "#00D2AA", "Lowest-risk cluster", "✅"),
+    "NightOwl": ("Night Owl", "#5A7DFF", "Middle cluster", "⚠️"),
+    "DeepDiver": ("Deep Diver", "#4318FF", "Highest-risk cluster", "🚨"),
+}
+
+RESULT_MESSAGES = {
+    "Casual": (st.success, "Your habits are closest to the **Casual Scroller** profile: the healthy zone."),
+    "NightOwl": (st.warning, "Your habits are closest to the **Night Owl** profile, which shows signs of dependency."),
+    "DeepDiver": (st.error, "Your habits are closest to the **Deep Diver** profile. A digital detox is recommended."),
+}
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def _cached_persona_model(path, mtime_ns):
+    return load_persona_model(path)
+
+
+def persona_model(path=PERSONA_MODEL_PATH):
+    """
+    The persona centroid model (fit with `python personas.py`), read once per file
+    version; the built-in prototype centroids if the file is absent.
+    """
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        mtime_ns = None
+    return _cached_persona_model(path, mtime_ns)
+
+
+# ====================== 5. PAGE: YOUR PERSONAS (INTERACTIVE) ======================
+def render():
+    st.markdown("<h2 class='gradient-text'>Discover Your Digital Persona</h2>", unsafe_allow_html=True)
+    st.markdown("<p>Use the sliders below to see which digital persona matches your current profile.</p>", unsafe_allow_html=True)
+
+    # --- INPUT SLIDERS ---
+    col_input_1, col_input_2 = st.columns(2)
+
+    # Stress comes from the assessment: it sets the conflicts coordinate and feeds the addiction estimate
+    baseline_stress = st.session_state.get('assessment_stress', 6)
+
+    with col_input_1:
+        st.markdown("<b>Daily Social Media Usage (Hours)</b>", unsafe_allow_html=True)
+        # Use session state for initial value
+        usage_check = st.slider("Hours", 0.0, 12.0, float(st.session_state.persona_usage_slider), 0.5, key="persona_usage_slider", label_visibility="collapsed")
+
+        st.markdown("<b>Sleep Hours Per Night</b>", unsafe_allow_html=True)
+        # Use session state for initial value
+        sleep_check = st.slider("Sleep", 4.0, 10.0, float(st.session_state.persona_sleep_slider), 0.5, key="persona_sleep_slider", label_visibility="collapsed")
+    with col_input_2:
+        st.markdown("<b>Mental Health Score (1-10)</b>", unsafe_allow_html=True)
+        # Use session state for initial value
+        mental_check = st.slider("Mental Health", 1, 10, int(st.session_state.persona_mental_slider), 1, key="persona_mental_slider", label_visibility="collapsed")
+
+        st.markdown("<b>Addiction Estimate (From Your Inputs)</b>", unsafe_allow_html=True)
+        # The app does not ask for the addiction score, so the persona uses this estimate instead (no model call)
+        addiction = int(addiction_stand_in(usage_check, sleep_check, mental_check, baseline_stress))
+        st.metric(label="Estimated Addiction Score", value=f"{addiction}/10")
+
+    st.markdown('</div>', unsafe_allow_html=True)
+
+
+    # --- LOGIC TO DETERMINE ACTIVE PERSONA ---
+    # Nearest centroid over the notebook's risk features (fitted persona_centroids.json, or the
+    # built-in prototypes); shared with batch scoring in personas.py
+    model = persona_model()
+    active_persona = persona_for_profile(model, usage_check, sleep_check, mental_check, baseline_stress)
+
+
+    # --- PERSONA CARDS ---
+    # Each card describes its centroid, so the text always matches how personas are assigned
+    st.write("")
+    profiles = persona_profiles(model)
+    for column, persona in zip(st.columns(3), PERSONA_CARDS):
+        name, colour, cluster, icon = PERSONA_CARDS[persona]
+        centre = profiles[persona]
+        status_class = "active-card" if active_persona == persona else ""
+        with column:
+            st.markdown(f"""
+            <div class="persona-card {status_class}" style="border-top: 5px solid {colour};">
+                <h3 style='color:{colour}'>{name}</h3>
+                <p style='font-weight:700;'>{cluster}</p>
+                <hr>
+                <p style='font-size:0.9rem;'>{icon} Usage: about {centre['usage']:.1f} hrs/day</p>
+                <p style='font-size:0.9rem;'>{icon} Sleep: about {centre['sleep']:.1f} hrs</p>
+                <p style='font-size:0.9rem;'>{icon} Mental Health: about {centre['mental']:.0f}/10</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+    # Dynamic Message below cards
+    st.write("")
+    show, message = RESULT_MESSAGES[active_persona]
+    show(f"Result: {message}")